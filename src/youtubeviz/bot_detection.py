@@ -18,18 +18,33 @@ Key Features:
 
 from __future__ import annotations
 
+import os
 import re
 import unicodedata
-from dataclasses import dataclass
+import zlib
+from dataclasses import dataclass, field
 from datetime import timedelta
-from typing import Optional
+from typing import Callable, Optional
 
 import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
 from pydantic import BaseModel, Field, PositiveInt, field_validator
-from sklearn.feature_extraction.text import TfidfVectorizer
+from scipy import sparse
+from sklearn.feature_extraction.text import CountVectorizer, TfidfTransformer
 from sklearn.metrics.pairwise import cosine_similarity
-from sqlalchemy import text
+from sklearn.preprocessing import normalize
+from sqlalchemy import DateTime, bindparam, text
+from sqlalchemy.engine import URL, Engine
+
+try:
+    import connectorx as cx
+except Exception:  # pragma: no cover - optional
+    cx = None
+
+# connectorx URL scheme for each SQLAlchemy backend it can read from directly
+_CONNECTORX_SCHEMES = {"mysql": "mysql", "postgresql": "postgresql", "sqlite": "sqlite"}
 
 
 class BotDetectionConfig(BaseModel):
@@ -113,9 +128,15 @@ class BotDetectionConfig(BaseModel):
 
 
 # Text processing utilities
-_whitespace_re = re.compile(r"\s+", flags=re.UNICODE)
 _emoji_re = re.compile(r"[\U0001F300-\U0001FAFF\U00002700-\U000027BF\U00002600-\U000026FF]+", flags=re.UNICODE)
 
+# Pattern strings for the Series helpers. pandas hands string patterns on its pyarrow
+# backend to RE2 (ASCII-only \s, no \U escapes), so the classes are spelled with
+# literal characters: Python's \s (str.isspace) and the emoji class above.
+_WHITESPACE_RUN = "[\t\n\x0b\x0c\r\x1c-\x1f \x85\xa0\u1680\u2000-\u200a\u2028\u2029\u202f\u205f\u3000]+"
+_REGEX_METACHARS = frozenset("\\.^$|?*+()[]{}")
+_EMOJI_CHAR = "[\U0001f300-\U0001faff\U00002700-\U000027bf\U00002600-\U000026ff]"
+
 
 def _normalize_text(text: str) -> str:
     """
@@ -128,17 +149,17 @@ def _normalize_text(text: str) -> str:
         return ""
 
     # Unicode normalization and case folding
-    normalized = unicodedata.normalize("NFKC", text)
-    normalized = normalized.casefold()
+    normalized = unicodedata.normalize("NFKC", text).casefold()
 
-    # Collapse whitespace
-    normalized = _whitespace_re.sub(" ", normalized).strip()
-
-    return normalized
+    # Collapse whitespace: str.split() breaks on exactly the characters \s matches
+    return " ".join(normalized.split())
 
 
 def _strip_emojis(text: str) -> str:
     """Remove emojis from text for content analysis."""
+    # Every emoji range is non-ASCII, so plain ASCII text skips the regex engine
+    if text.isascii():
+        return text.strip()
     # Remove emojis but preserve surrounding spaces
     result = _emoji_re.sub("", text)
     return result.strip()
@@ -146,9 +167,99 @@ def _strip_emojis(text: str) -> str:
 
 def _count_emojis(text: str) -> int:
     """Count emoji characters in text."""
+    if text.isascii():
+        return 0
     return len("".join(_emoji_re.findall(text)))
 
 
+def _nfkc_series(texts: pd.Series) -> pd.Series:
+    """
+    NFKC-normalize a string Series, skipping rows that are already normalized.
+
+    ASCII text is always in NFKC, so on pyarrow-backed strings only the rows
+    ``string_is_ascii`` rejects go through ``unicodedata``; ``.str.normalize``
+    would call it once per row. Other dtypes use ``.str.normalize`` directly.
+    """
+    if getattr(texts.dtype, "storage", None) != "pyarrow":
+        return texts.str.normalize("NFKC")
+    arr = pa.array(texts.array)
+    non_ascii = pc.invert(pc.string_is_ascii(arr))
+    if not pc.any(non_ascii).as_py():
+        return texts
+    normalized = pa.array(
+        [unicodedata.normalize("NFKC", t) for t in pc.filter(arr, non_ascii).to_pylist()], type=arr.type
+    )
+    return pd.Series(
+        pc.replace_with_mask(arr, non_ascii, normalized), dtype=texts.dtype, index=texts.index, name=texts.name
+    )
+
+
+def _escape_literal(phrase: str) -> str:
+    """Escape regex metacharacters with plain backslashes, a spelling both ``re`` and RE2 accept."""
+    return "".join("\\" + char if char in _REGEX_METACHARS else char for char in phrase)
+
+
+def _normalize_text_series(texts: pd.Series) -> pd.Series:
+    """Column-wise :func:`_normalize_text` using the pandas ``.str`` accessor."""
+    return _nfkc_series(texts.fillna("")).str.casefold().str.replace(_WHITESPACE_RUN, " ", regex=True).str.strip()
+
+
+def _strip_and_count_emojis_series(texts: pd.Series) -> tuple[pd.Series, pd.Series]:
+    """Column-wise (:func:`_strip_emojis`, :func:`_count_emojis`) from a single regex pass.
+
+    The count is the length the removal took off, i.e. emoji characters, not runs.
+    """
+    texts = texts.fillna("")
+    without = texts.str.replace(_EMOJI_CHAR + "+", "", regex=True)
+    return without.str.strip(), (texts.str.len() - without.str.len()).astype("int64")
+
+
+def _minhash_candidate_pairs(
+    texts: list[str], shingle_size: int, num_perm: int = 64, band_size: int = 4, seed: int = 0
+) -> np.ndarray:
+    """
+    Candidate near-duplicate pairs ``(i, j)``, ``i < j``, from MinHash LSH.
+
+    Each text is signed with ``num_perm`` MinHashes of its character shingles;
+    texts sharing every value in any band of ``band_size`` rows become a pair.
+    With the defaults, pairs with shingle Jaccard similarity above ~0.6 are
+    almost always found. Texts shorter than one shingle are never paired.
+    """
+    # Multiply-shift hashing: odd 64-bit multipliers, arithmetic mod 2**64, keep the top 32 bits
+    rng = np.random.default_rng(seed)
+    a = rng.integers(0, 2**64 - 1, size=num_perm, dtype=np.uint64, endpoint=True) | np.uint64(1)
+    b = rng.integers(0, 2**64 - 1, size=num_perm, dtype=np.uint64, endpoint=True)
+
+    signed = []
+    signatures = []
+    for row, text in enumerate(texts):
+        shingles = {text[i : i + shingle_size] for i in range(len(text) - shingle_size + 1)}
+        if not shingles:
+            continue
+        hashes = np.fromiter((zlib.crc32(s.encode("utf-8")) for s in shingles), dtype=np.uint64, count=len(shingles))
+        signatures.append(((np.outer(hashes, a) + b) >> np.uint64(32)).min(axis=0))
+        signed.append(row)
+
+    if len(signed) < 2:
+        return np.empty((0, 2), dtype=np.int64)
+
+    rows = np.asarray(signed)
+    signature_matrix = np.vstack(signatures)
+    pairs = []
+    for start in range(0, num_perm - band_size + 1, band_size):
+        _, bucket = np.unique(signature_matrix[:, start : start + band_size], axis=0, return_inverse=True)
+        order = np.argsort(bucket.ravel(), kind="stable")
+        bounds = np.flatnonzero(np.diff(bucket.ravel()[order])) + 1
+        for members in np.split(rows[order], bounds):
+            if len(members) > 1:
+                left, right = np.triu_indices(len(members), k=1)
+                pairs.append(np.column_stack([members[left], members[right]]))
+
+    if not pairs:
+        return np.empty((0, 2), dtype=np.int64)
+    return np.unique(np.vstack(pairs), axis=0)
+
+
 def _clamp_01(value):
     """Clamp value(s) to [0, 1] range. Works with scalars and pandas Series."""
     if hasattr(value, "clip"):  # pandas Series
@@ -157,6 +268,261 @@ def _clamp_01(value):
         return min(max(value, 0.0), 1.0)
 
 
+# Per-group cap on distinct character n-grams weighted for similarity
+_MAX_NGRAM_FEATURES = 10_000
+
+# Comment pairs (an upper bound, counted before exact duplicates collapse) scored per batched sparse product
+_SIMILARITY_BATCH_PAIRS = 4_000_000
+
+# Below this many rows the numba compile/dispatch cost outweighs the fused pass
+_JIT_MIN_ROWS = 10_000
+
+
+def _group_tfidf(all_counts: Optional[sparse.csr_matrix], rows: np.ndarray) -> sparse.csr_matrix:
+    """TF-IDF of ``rows`` exactly as a TfidfVectorizer fitted on just those rows produces it.
+
+    ``all_counts`` holds the n-gram counts of every comment. The group keeps its
+    own n-grams in vocabulary order, applies the same ``max_features`` cut, and
+    fits the IDF weights on the group alone.
+    """
+    if all_counts is None:
+        raise ValueError("empty vocabulary")
+    counts = all_counts[rows]
+    present, local = np.unique(counts.indices, return_inverse=True)
+    if present.size == 0:
+        raise ValueError("empty vocabulary")
+    counts = sparse.csr_matrix((counts.data, local, counts.indptr), shape=(len(rows), present.size))
+    if present.size > _MAX_NGRAM_FEATURES:
+        # Most frequent n-grams win, ties resolved like CountVectorizer's max_features
+        term_freq = np.asarray(counts.sum(axis=0)).ravel()
+        counts = counts[:, np.sort((-term_freq).argsort()[:_MAX_NGRAM_FEATURES])]
+    counts.sort_indices()
+    return TfidfTransformer().fit(counts).transform(counts, copy=False)
+
+
+def _count_similar_comments(
+    all_texts: list[str],
+    all_counts: Optional[sparse.csr_matrix],
+    rows: np.ndarray,
+    threshold: float,
+    lsh_shingle_size: Optional[int] = None,
+) -> np.ndarray:
+    """Count similar comments within one group using TF-IDF + cosine similarity.
+
+    ``rows`` are the positions of the group's comments. With ``lsh_shingle_size``
+    only MinHash LSH candidate pairs (over shingles of that size) are scored
+    instead of every pair, for groups too large to compare exhaustively.
+    """
+    texts = [all_texts[row] for row in rows]
+
+    # Exact duplicates are compared once and weighted by how often they occur
+    codes, _ = pd.factorize(np.asarray(texts, dtype=object))
+    _, first_rows = np.unique(codes, return_index=True)
+    multiplicity = np.bincount(codes)
+
+    try:
+        # Fit on every comment so the IDF weights still count the duplicates
+        tfidf_matrix = _group_tfidf(all_counts, rows)[first_rows]
+
+        if lsh_shingle_size is not None:
+            # Rows are L2-normalized, so each candidate's cosine is a row-wise dot product
+            unique_texts = [texts[row] for row in first_rows]
+            pairs = _minhash_candidate_pairs(unique_texts, lsh_shingle_size)
+            left, right = pairs[:, 0], pairs[:, 1]
+            similarity = np.asarray(tfidf_matrix[left].multiply(tfidf_matrix[right]).sum(axis=1)).ravel()
+            similar = similarity >= threshold
+            n_unique = len(first_rows)
+            # Count neighbors above threshold (including self)
+            counts = (
+                np.where(tfidf_matrix.getnnz(axis=1) > 0, multiplicity, 0)
+                + np.bincount(left[similar], weights=multiplicity[right[similar]], minlength=n_unique)
+                + np.bincount(right[similar], weights=multiplicity[left[similar]], minlength=n_unique)
+            ).astype(np.int64)
+            return counts[codes]
+
+        similarity_matrix = cosine_similarity(tfidf_matrix, dense_output=False)
+
+        # Count neighbors above threshold (including self)
+        counts = (similarity_matrix >= threshold) @ multiplicity
+
+        return counts[codes]
+
+    except ValueError:
+        # Handle edge cases (empty texts, etc.)
+        return np.ones(len(rows), dtype=np.int64)
+
+
+def _count_similar_batch(
+    all_texts: list[str], all_counts: Optional[sparse.csr_matrix], groups: list[np.ndarray], threshold: float
+) -> np.ndarray:
+    """
+    :func:`_count_similar_comments` for several groups from one sparse product.
+
+    Every group gets its own block of n-gram columns and its own IDF weights,
+    so the block-diagonal TF-IDF matrix holds exactly the per-group matrices
+    and one cosine product scores all groups at once. Groups over the
+    ``max_features`` cap fall back to the per-group path. Returns the counts
+    for ``np.concatenate(groups)``.
+    """
+    rows = np.concatenate(groups)
+    if all_counts is None:
+        return np.ones(len(rows), dtype=np.int64)
+    sizes = np.array([len(group) for group in groups])
+    group_of_row = np.repeat(np.arange(len(groups)), sizes)
+    counts = all_counts[rows]
+    row_nnz = np.diff(counts.indptr)
+    n_vocab = all_counts.shape[1]
+
+    block_cols, cols = np.unique(np.repeat(group_of_row, row_nnz) * n_vocab + counts.indices, return_inverse=True)
+    if len(block_cols) == 0:
+        # No group in the batch has a single n-gram: TfidfVectorizer's empty-vocabulary case
+        return np.ones(len(rows), dtype=np.int64)
+    n_features = np.bincount(block_cols // n_vocab, minlength=len(groups))
+    capped = n_features > _MAX_NGRAM_FEATURES
+    if capped.any():
+        result = np.empty(len(rows), dtype=np.int64)
+        starts = np.concatenate([[0], np.cumsum(sizes)])
+        for g in np.flatnonzero(capped):
+            result[starts[g] : starts[g + 1]] = _count_similar_comments(all_texts, all_counts, groups[g], threshold)
+        rest = ~capped[group_of_row]
+        if rest.any():
+            uncapped = [group for group, cap in zip(groups, capped) if not cap]
+            result[rest] = _count_similar_batch(all_texts, all_counts, uncapped, threshold)
+        return result
+
+    # TfidfTransformer(smooth_idf=True) per group: idf = ln((n + 1) / (df + 1)) + 1
+    col_group = block_cols // n_vocab
+    doc_freq = np.bincount(cols, minlength=len(block_cols)).astype(np.float64) + 1.0
+    idf = (sizes[col_group] + 1).astype(np.float64) / doc_freq
+    np.log(idf, out=idf)
+    idf += 1.0
+    tfidf = sparse.csr_matrix((counts.data.astype(np.float64), cols, counts.indptr), shape=(len(rows), len(block_cols)))
+    tfidf.data *= idf[tfidf.indices]
+    tfidf = normalize(tfidf, copy=False)
+
+    # Exact duplicates within a group are compared once and weighted by how often they occur
+    text_codes, text_uniques = pd.factorize(np.asarray([all_texts[row] for row in rows], dtype=object))
+    codes, _ = pd.factorize(group_of_row.astype(np.int64) * len(text_uniques) + text_codes)
+    _, first_rows = np.unique(codes, return_index=True)
+    multiplicity = np.bincount(codes)
+
+    similarity_matrix = cosine_similarity(tfidf[first_rows], dense_output=False)
+    result = ((similarity_matrix >= threshold) @ multiplicity)[codes]
+
+    # A group without a single n-gram is TfidfVectorizer's empty-vocabulary case
+    empty = np.bincount(group_of_row, weights=row_nnz, minlength=len(groups)) == 0
+    result[empty[group_of_row]] = 1
+    return result.astype(np.int64)
+
+
+def _similarity_counts(
+    all_texts: list[str],
+    all_counts: Optional[sparse.csr_matrix],
+    keys: pd.Series,
+    threshold: float,
+    lsh_min_unique: Optional[int] = None,
+    shingle_size: int = 3,
+) -> np.ndarray:
+    """Neighbour counts within each group of ``keys``; rows alone in their group keep 1.
+
+    Small groups are scored together in batches of roughly
+    ``_SIMILARITY_BATCH_PAIRS`` comment pairs. Groups with more than
+    ``lsh_min_unique`` distinct texts only compare MinHash LSH candidates, built
+    from character shingles of ``shingle_size``.
+    """
+    result = np.ones(len(keys), dtype=np.int64)
+    group_codes, _ = pd.factorize(keys)
+    order = np.argsort(group_codes, kind="stable")
+    order = order[group_codes[order] >= 0]
+    sizes = np.bincount(group_codes[order])
+
+    batch: list[np.ndarray] = []
+    batch_pairs = 0
+    for rows in np.split(order, np.cumsum(sizes)[:-1]):
+        if len(rows) <= 1:
+            continue
+        if lsh_min_unique is not None and len({all_texts[row] for row in rows}) > lsh_min_unique:
+            result[rows] = _count_similar_comments(
+                all_texts, all_counts, rows, threshold, lsh_shingle_size=shingle_size
+            )
+            continue
+        if batch and batch_pairs + len(rows) ** 2 > _SIMILARITY_BATCH_PAIRS:
+            result[np.concatenate(batch)] = _count_similar_batch(all_texts, all_counts, batch, threshold)
+            batch, batch_pairs = [], 0
+        batch.append(rows)
+        batch_pairs += len(rows) ** 2
+    if batch:
+        result[np.concatenate(batch)] = _count_similar_batch(all_texts, all_counts, batch, threshold)
+    return result
+
+
+def _raw_score_loop(
+    dupe_local: np.ndarray,
+    dupe_global: np.ndarray,
+    burst: np.ndarray,
+    author: np.ndarray,
+    engagement: np.ndarray,
+    emoji_count: np.ndarray,
+    is_whitelisted: np.ndarray,
+    min_dupe_cluster: float,
+    weights: np.ndarray,
+    emoji_max_weight: float,
+) -> np.ndarray:
+    """Weighted raw bot score per row in one traversal; same arithmetic as the vectorized path.
+
+    ``weights`` holds (local dupe, global dupe, burstiness, author diversity, low engagement).
+    Clamps are written as comparisons so NaN passes through, as it does with ``clip``.
+    """
+    out = np.empty(dupe_local.size, dtype=np.float64)
+    for i in range(dupe_local.size):
+        damp = 0.15 if is_whitelisted[i] else 1.0
+        local = (dupe_local[i] - min_dupe_cluster) / 7.0
+        if local < 0.0:
+            local = 0.0
+        elif local > 1.0:
+            local = 1.0
+        glob = (dupe_global[i] - min_dupe_cluster) / 7.0
+        if glob < 0.0:
+            glob = 0.0
+        elif glob > 1.0:
+            glob = 1.0
+        b = burst[i]
+        if b < 0.0:
+            b = 0.0
+        elif b > 1.0:
+            b = 1.0
+        a = author[i]
+        if a < 0.0:
+            a = 0.0
+        elif a > 1.0:
+            a = 1.0
+        e = engagement[i]
+        if e < 0.0:
+            e = 0.0
+        elif e > 1.0:
+            e = 1.0
+        bonus = emoji_count[i] / 5.0
+        if bonus > emoji_max_weight:
+            bonus = emoji_max_weight
+        out[i] = (
+            weights[0] * (local * damp)
+            + weights[1] * (glob * damp)
+            + weights[2] * b
+            + weights[3] * a
+            + weights[4] * e
+            - bonus * 0.15
+        )
+    return out
+
+
+try:
+    from numba import njit
+
+    _raw_score: Optional[Callable[..., np.ndarray]] = njit(_raw_score_loop)
+except Exception:  # pragma: no cover - optional
+    _raw_score = None
+
+
 @dataclass(frozen=True)
 class BotDetector:
     """
@@ -170,6 +536,17 @@ class BotDetector:
     """
 
     config: BotDetectionConfig
+    _whitelist: frozenset[str] = field(init=False, repr=False, compare=False)
+    _whitelist_pattern: Optional[str] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Normalized once, like the comment text, so analyze_comments never rebuilds it
+        whitelist = frozenset(_normalize_text(phrase) for phrase in self.config.whitelist_phrases)
+        object.__setattr__(self, "_whitelist", whitelist)
+
+        # One alternation of the literal phrases, matched column-wise (by RE2 on pyarrow strings)
+        pattern = "|".join(_escape_literal(phrase) for phrase in sorted(whitelist)) if whitelist else None
+        object.__setattr__(self, "_whitelist_pattern", pattern)
 
     def analyze_comments(self, df: pd.DataFrame) -> pd.DataFrame:
         """
@@ -206,24 +583,26 @@ class BotDetector:
             raise ValueError(f"Invalid timestamps found in comments: {invalid_ids}")
 
         # Text normalization
-        analysis_df["text_normalized"] = analysis_df["comment_text"].astype(str).apply(_normalize_text)
-
-        analysis_df["text_no_emoji"] = analysis_df["text_normalized"].apply(_strip_emojis)
+        # Arrow-backed strings run the .str passes in pyarrow compute rather than per-row Python
+        analysis_df["text_normalized"] = _normalize_text_series(
+            analysis_df["comment_text"].astype(str).astype("string[pyarrow]")
+        )
 
-        analysis_df["emoji_count"] = analysis_df["text_normalized"].apply(_count_emojis)
+        analysis_df["text_no_emoji"], analysis_df["emoji_count"] = _strip_and_count_emojis_series(
+            analysis_df["text_normalized"]
+        )
 
         # Whitelist detection - check if any whitelist phrase is contained in the text
-        whitelist = self.config.whitelist_phrases
+        pattern = self._whitelist_pattern
 
-        def _contains_whitelist_phrase(text: str) -> bool:
-            """Check if text contains any whitelisted phrase."""
-            if not text:
-                return False
-            return any(phrase in text for phrase in whitelist)
+        def _contains_whitelist_phrase(texts: pd.Series) -> np.ndarray:
+            """Check which (non-empty) texts contain any whitelisted phrase."""
+            if pattern is None:
+                return np.zeros(len(texts), dtype=bool)
+            return ((texts.str.len() > 0) & texts.str.contains(pattern, regex=True)).to_numpy(dtype=bool)
 
-        analysis_df["is_whitelisted"] = analysis_df["text_normalized"].apply(_contains_whitelist_phrase) | analysis_df[
-            "text_no_emoji"
-        ].apply(_contains_whitelist_phrase)
+        normalized_hit = _contains_whitelist_phrase(analysis_df["text_normalized"])
+        analysis_df["is_whitelisted"] = normalized_hit | _contains_whitelist_phrase(analysis_df["text_no_emoji"])
 
         # Feature engineering
         analysis_df = self._add_similarity_features(analysis_df)
@@ -256,74 +635,32 @@ class BotDetector:
     def _add_similarity_features(self, df: pd.DataFrame) -> pd.DataFrame:
         """Add near-duplicate detection features using TF-IDF similarity."""
 
-        def _count_similar_comments(group: pd.DataFrame) -> pd.Series:
-            """Count similar comments within a group using TF-IDF + cosine similarity."""
-            texts = group["text_no_emoji"].tolist()
-
-            if len(texts) <= 1:
-                return pd.Series([1], index=group.index)
-
-            # Use character n-grams for short comment similarity
-            vectorizer = TfidfVectorizer(
-                analyzer="char",
-                ngram_range=(self.config.ngram_min, self.config.ngram_max),
-                max_features=10000,  # Limit for performance
-            )
-
-            try:
-                tfidf_matrix = vectorizer.fit_transform(texts)
-                similarity_matrix = cosine_similarity(tfidf_matrix, dense_output=False)
-
-                # Count neighbors above threshold (including self)
-                counts = []
-                threshold = self.config.near_dupe_threshold
-
-                for i in range(similarity_matrix.shape[0]):
-                    row = similarity_matrix[i]
-                    similar_count = int((row.data >= threshold).sum())
-                    counts.append(similar_count)
-
-                return pd.Series(counts, index=group.index)
-
-            except ValueError:
-                # Handle edge cases (empty texts, etc.)
-                return pd.Series([1] * len(group), index=group.index)
+        # Character n-grams are counted once for every comment; each group below only
+        # reweights its own rows, instead of re-analyzing its texts with a fresh vectorizer
+        all_texts = df["text_no_emoji"].tolist()
+        counter = CountVectorizer(analyzer="char", ngram_range=(self.config.ngram_min, self.config.ngram_max))
+        try:
+            all_counts: Optional[sparse.csr_matrix] = sparse.csr_matrix(counter.fit_transform(all_texts))
+        except ValueError:
+            all_counts = None  # No comment is long enough for a single n-gram
+        threshold = self.config.near_dupe_threshold
 
         # Local similarity (within video)
-        local_counts = []
-        for video_id, group in df.groupby("video_id"):
-            counts = _count_similar_comments(group)
-            local_counts.append(counts)
+        df["duplicate_count_local"] = _similarity_counts(all_texts, all_counts, df["video_id"], threshold)
 
-        if local_counts:
-            df["duplicate_count_local"] = pd.concat(local_counts).reindex(df.index).fillna(1)
-        else:
-            df["duplicate_count_local"] = 1
-
-        # Global similarity (across videos, bucketed for performance)
-        df["_text_bucket"] = df["text_no_emoji"].apply(lambda x: (x[:1], len(x) // 5) if x else ("", 0))
-
-        def _count_similar_global(group: pd.DataFrame) -> pd.Series:
-            if len(group) > 5000:  # Prevent quadratic explosion
-                raise RuntimeError(
-                    f"Text bucket too large ({len(group)} items). " "Consider implementing LSH for scale."
-                )
-            return _count_similar_comments(group)
-
-        global_counts = []
-        for text_bucket, group in df.groupby("_text_bucket"):
-            counts = _count_similar_global(group)
-            global_counts.append(counts)
-        if global_counts:
-            df["duplicate_count_global"] = pd.concat(global_counts).reindex(df.index).fillna(1)
-        else:
-            df["duplicate_count_global"] = 1
+        # Global similarity (across videos, bucketed by first character and length // 5 for performance)
+        texts = df["text_no_emoji"]
+        text_bucket = texts.groupby([texts.str[:1], texts.str.len() // 5]).ngroup()
+
+        # Prevent quadratic explosion: past 5000 distinct texts, only LSH candidates are compared
+        df["duplicate_count_global"] = _similarity_counts(
+            all_texts, all_counts, text_bucket, threshold, lsh_min_unique=5000, shingle_size=self.config.ngram_min
+        )
 
         # Filter out small clusters (but keep pairs as they're still suspicious)
         df.loc[df["duplicate_count_local"] < 2, "duplicate_count_local"] = 0
         df.loc[df["duplicate_count_global"] < 2, "duplicate_count_global"] = 0
 
-        df.drop(columns=["_text_bucket"], inplace=True)
         return df
 
     def _add_timing_features(self, df: pd.DataFrame) -> pd.DataFrame:
@@ -394,8 +731,8 @@ class BotDetector:
 
         return df
 
-    def _calculate_bot_score(self, df: pd.DataFrame) -> pd.DataFrame:
-        """Calculate final bot suspicion score with interpretable components."""
+    def _raw_score_vectorized(self, df: pd.DataFrame) -> pd.Series:
+        """Weighted raw bot score from pandas/numpy column operations."""
 
         # Component scores (0-1 scale)
         def _duplicate_component(count_series: pd.Series, is_whitelisted: pd.Series) -> pd.Series:
@@ -415,7 +752,7 @@ class BotDetector:
 
         # Weighted combination
         cfg = self.config
-        raw_score = (
+        return (
             cfg.w_dupe_local * f_dupe_local
             + cfg.w_dupe_global * f_dupe_global
             + cfg.w_burstiness * f_burst
@@ -424,6 +761,38 @@ class BotDetector:
             - emoji_bonus * 0.15  # Small deduction for emoji use
         )
 
+    def _calculate_bot_score(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Calculate final bot suspicion score with interpretable components."""
+
+        cfg = self.config
+        if _raw_score is not None and len(df) >= _JIT_MIN_ROWS:
+            # One fused pass instead of a temporary Series per component
+            raw_score = pd.Series(
+                _raw_score(
+                    df["duplicate_count_local"].to_numpy(dtype=np.float64),
+                    df["duplicate_count_global"].to_numpy(dtype=np.float64),
+                    df["burst_score"].to_numpy(dtype=np.float64),
+                    df["author_repetition_score"].to_numpy(dtype=np.float64),
+                    df["engagement_score"].to_numpy(dtype=np.float64),
+                    df["emoji_count"].to_numpy(dtype=np.float64),
+                    df["is_whitelisted"].to_numpy(dtype=np.bool_),
+                    float(cfg.min_dupe_cluster),
+                    np.array(
+                        [
+                            cfg.w_dupe_local,
+                            cfg.w_dupe_global,
+                            cfg.w_burstiness,
+                            cfg.w_author_diversity,
+                            cfg.w_low_engagement,
+                        ]
+                    ),
+                    float(cfg.emoji_max_weight),
+                ),
+                index=df.index,
+            )
+        else:
+            raw_score = self._raw_score_vectorized(df)
+
         # Normalize to 0-100 scale
         if raw_score.max() > raw_score.min():
             normalized_score = (raw_score - raw_score.min()) / (raw_score.max() - raw_score.min())
@@ -440,6 +809,20 @@ class BotDetector:
         return df
 
 
+def _connectorx_url(url: URL) -> Optional[str]:
+    """Translate a SQLAlchemy URL into a connectorx connection string, or None if it has none."""
+    scheme = _CONNECTORX_SCHEMES.get(url.get_backend_name())
+    if scheme is None:
+        return None
+    if scheme == "sqlite":
+        # connectorx opens the file itself, so an in-memory database is out of its reach
+        if not url.database or url.database == ":memory:" or url.database.startswith("file:"):
+            return None
+        return f"sqlite://{os.path.abspath(url.database)}"
+    # The driver suffix (mysql+pymysql, postgresql+psycopg2) names a Python DBAPI connectorx does not use
+    return url.set(drivername=scheme).render_as_string(hide_password=False)
+
+
 def load_recent_comments(engine, days: int = 30) -> pd.DataFrame:
     """
     Load recent comments from database for bot analysis.
@@ -451,9 +834,10 @@ def load_recent_comments(engine, days: int = 30) -> pd.DataFrame:
     Returns:
         DataFrame with comment data ready for bot analysis
     """
-    cutoff_date = pd.Timestamp.utcnow() - pd.Timedelta(days=days)
+    cutoff_date = (pd.Timestamp.now(tz="UTC") - pd.Timedelta(days=days)).tz_localize(None).to_pydatetime()
 
-    query = """
+    query = text(
+        """
         SELECT
             yc.comment_id,
             yc.video_id,
@@ -470,8 +854,23 @@ def load_recent_comments(engine, days: int = 30) -> pd.DataFrame:
         AND yc.comment_text != ''
         ORDER BY yc.published_at DESC
     """
-
-    return pd.read_sql(text(query), engine, params={"cutoff_date": cutoff_date})
+    ).bindparams(bindparam("cutoff_date", cutoff_date, type_=DateTime()))
+
+    connectorx_url = _connectorx_url(engine.url) if cx is not None and isinstance(engine, Engine) else None
+    if connectorx_url is not None:
+        # connectorx streams the result straight into Arrow buffers instead of
+        # building Python row tuples, but it takes no bind parameters; the
+        # engine's dialect renders the cutoff as a literal instead.
+        sql = str(query.compile(dialect=engine.dialect, compile_kwargs={"literal_binds": True}))
+        df = cx.read_sql(connectorx_url, sql, return_type="pandas")
+        # connectorx leaves text columns as object; infer them the way read_sql does
+        df = df.infer_objects()
+    else:
+        df = pd.read_sql(query, engine)
+
+    # SQLite hands back timestamps as text, so both paths parse them the same way
+    df["published_at"] = pd.to_datetime(df["published_at"])
+    return df
 
 
 def analyze_bot_patterns(engine, config: Optional[BotDetectionConfig] = None, days: int = 30) -> pd.DataFrame:
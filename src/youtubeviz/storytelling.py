@@ -1,26 +1,214 @@
 from __future__ import annotations
 
+import inspect
 import random
+import re
+import sys
 import warnings
-from typing import Any, Dict, Iterable, List, Optional, Sequence, Union
-
+import weakref
+from bisect import bisect_right
+from dataclasses import dataclass, field, fields
+from functools import lru_cache
+from itertools import islice
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Final,
+    ItemsView,
+    Iterable,
+    Iterator,
+    KeysView,
+    List,
+    Literal,
+    Mapping,
+    Optional,
+    Sequence,
+    Union,
+    ValuesView,
+)
+
+import jinja2
+import numpy as np
 import pandas as pd
+from markupsafe import Markup
+
+if TYPE_CHECKING:
+    from IPython.display import HTML
+
+# Rendered figure HTML keyed by id(fig); entries are evicted when the figure is
+# garbage collected. Plotly and Altair figures are unhashable, so a
+# WeakKeyDictionary cannot be used directly.
+_FIG_HTML_CACHE: Dict[int, str] = {}
+
+# Dedicated generator for narrative variations so notebooks can be seeded
+# without touching the global ``random`` state
+_rng = random.Random()
+
+# Autoescaping keeps titles, bullets and captions from injecting markup; the
+# figure HTML is the only value marked safe
+_JINJA_ENV = jinja2.Environment(autoescape=True, auto_reload=False)
+
+# (text_color, sub_color) per story_block theme; anything but "light" renders dark
+_THEMES: Dict[str, tuple[str, str]] = {"light": ("#111", "#444"), "dark": ("#fafafa", "#ddd")}
+
+# Layout and theme colours shared by every story block, so the block markup itself
+# only carries class names
+_STATIC_CSS = (
+    "<style>"
+    ".yv-story{display:flex;gap:18px;align-items:flex-start;width:100%}"
+    ".yv-story .yv-text{flex:1;font-family:system-ui,-apple-system,Segoe UI,Roboto,sans-serif;color:var(--yv-text)}"
+    ".yv-story h3{margin:0 0 6px 0;font-weight:700}"
+    ".yv-story ul{margin:6px 0 8px 18px;padding:0;line-height:1.4}"
+    ".yv-story .yv-caption{font-size:12px;color:var(--yv-sub);margin-top:4px}"
+    + "".join(f".yv-{name}{{--yv-text:{text};--yv-sub:{sub}}}" for name, (text, sub) in _THEMES.items())
+    + "</style>"
+)
+
+_STORY_TPL = _JINJA_ENV.from_string("""
+    <div class="yv-story yv-{{ theme }}">
+      <div class="yv-fig" style="flex:0 0 {{ width_left }}; max-width:{{ width_left }};">{{ fig_html|safe }}</div>
+      <div class="yv-text">
+        <h3>{{ title }}</h3>
+        <ul>{{ bullets_html }}</ul>
+        {% if caption %}<div class="yv-caption">{{ caption }}</div>{% endif %}
+      </div>
+    </div>
+    """)
+
+
+def set_story_seed(seed: Optional[int]) -> None:
+    """Seed the generator behind narrative_intro/section_transition.
+
+    Use a fixed seed for reproducible notebook renders (stable HTML diffs in CI);
+    pass ``None`` to reseed from system entropy.
+    """
+    _rng.seed(seed)
+
+
+def _join_bullets(lines: Iterable[str]) -> Markup:
+    """Render non-blank bullets as HTML-escaped ``<li>`` items."""
+    # Every item is coerced with str(): bullet lists may mix in numbers or None
+    return Markup("\n").join(Markup("<li>%s</li>") % line for line in lines if str(line).strip())
+
+
+def _plotly_html(fig: Any) -> str:
+    # Every figure loads plotly.js itself, so each saved cell output stays self-contained
+    return fig.to_html(include_plotlyjs="cdn", full_html=False)
+
+
+def _plain_html(fig: Any) -> str:
+    return fig.to_html()
 
 
-def _join_bullets(lines: Sequence[str]) -> str:
-    items = [f"<li>{l}</li>" for l in lines if str(l).strip()]
-    return "\n".join(items)
+def _fallback_html(fig: Any) -> str:
+    # Rely on the object's repr
+    return f"<div class='figure-fallback'>{fig}</div>"
+
+
+def _select_renderer(cls: type) -> Callable[[Any], str]:
+    """Pick the HTML renderer for a figure class.
+
+    Plotly and Altair figures are recognised by their defining module; other
+    classes with ``to_html`` are inspected once to see whether they declare
+    Plotly's ``include_plotlyjs`` argument. A bare ``**kwargs`` (pandas
+    ``Styler``) or an uninspectable signature gets the plain renderer.
+    """
+    module = cls.__module__
+    if module.startswith("plotly"):
+        return _plotly_html
+    if module.startswith("altair"):
+        return _plain_html
+
+    to_html = getattr(cls, "to_html", None)
+    if to_html is None:
+        return _fallback_html
+    try:
+        params = inspect.signature(to_html).parameters
+    except (TypeError, ValueError):
+        return _plain_html
+    if "include_plotlyjs" in params:
+        return _plotly_html
+    return _plain_html
+
+
+# Renderer chosen per figure class, so repeat renders skip the inspection
+_RENDERERS: weakref.WeakKeyDictionary[type, Callable[[Any], str]] = weakref.WeakKeyDictionary()
+
+
+def _renderer_for(fig: Any) -> Callable[[Any], str]:
+    cls = type(fig)
+    renderer = _RENDERERS.get(cls)
+    if renderer is None:
+        renderer = _RENDERERS[cls] = _select_renderer(cls)
+    return renderer
+
+
+def _figure_html(fig: Any) -> str:
+    """Render a figure to an HTML fragment using the renderer cached for its class."""
+    return _renderer_for(fig)(fig)
+
+
+def _cached_figure_html(fig: Any, renderer: Callable[[Any], str]) -> str:
+    """Return ``renderer(fig)``, reusing the output while ``fig`` is alive."""
+    key = id(fig)
+    cached = _FIG_HTML_CACHE.get(key)
+    if cached is not None:
+        return cached
+
+    fig_html = renderer(fig)
+    try:
+        weakref.finalize(fig, _FIG_HTML_CACHE.pop, key, None)
+    except TypeError:
+        # Not weak-referenceable (str, dict, ...): cannot track its lifetime
+        return fig_html
+    _FIG_HTML_CACHE[key] = fig_html
+    return fig_html
+
+
+def _story_block_html(
+    fig: Any,
+    title: str,
+    bullets: Iterable[str],
+    caption: Optional[str],
+    width_left: str,
+    theme: str,
+    cache_fig_html: bool,
+) -> str:
+    """Render one story block (without the shared CSS)."""
+    # Render figure HTML if supported, else rely on notebook renderer
+    renderer: Optional[Callable[[Any], str]] = None
+    if isinstance(fig, str):
+        fig_html = fig
+    elif isinstance(fig, bytes):
+        fig_html = fig.decode("utf-8")
+    else:
+        renderer = _renderer_for(fig)
+        fig_html = _cached_figure_html(fig, renderer) if cache_fig_html else renderer(fig)
+
+    html: str = _STORY_TPL.render(
+        theme="light" if theme == "light" else "dark",
+        width_left=width_left,
+        fig_html=fig_html,
+        title=title,
+        bullets_html=_join_bullets(bullets),
+        caption=caption,
+    )
+    return html
 
 
 def story_block(
-    fig,
+    fig: Any,
     title: str,
     bullets: Iterable[str],
     caption: Optional[str] = None,
     width_left: str = "58%",
     theme: str = "light",
     return_html: bool = False,
-):
+    cache_fig_html: bool = False,
+    display_now: bool = True,
+) -> Union[str, Dict[str, Any], "HTML", None]:
     """Display a chart with a human narrative beside it in notebooks.
 
     - Places an interactive Plotly/Altair figure on the left
@@ -28,12 +216,23 @@ def story_block(
     - Falls back to returning a tuple if IPython is not available
 
     Args:
-        fig: Plotly/Altair figure (or any object with ``to_html`` or rich repr)
+        fig: Plotly/Altair figure (or any object with ``to_html`` or rich repr). An
+            already-rendered HTML ``str``/``bytes`` is embedded as-is, which is the
+            fastest path for dashboards that reuse figures.
         title: Short, engaging headline
         bullets: Key points that explain the chart and the story
         caption: Optional one-line caption (tone, takeaway)
         width_left: CSS width for chart column
         theme: "light" or "dark" (affects text colors)
+        return_html: Return the HTML string instead of displaying it
+        cache_fig_html: Reuse the rendered figure HTML when the same figure object
+            is passed again (leave off for figures you still intend to edit)
+        display_now: Display the block immediately; pass ``False`` to get an
+            ``IPython.display.HTML`` object back that Jupyter renders as cell output
+
+    ``title``, each bullet and ``caption`` are HTML-escaped, so comment text or
+    artist names show up literally. To keep trusted markup such as a ``<b>`` or a
+    link, wrap that value in ``markupsafe.Markup``.
     """
     try:
         from IPython.display import HTML, display  # type: ignore
@@ -41,38 +240,77 @@ def story_block(
         # Outside IPython: just return the content so callers can handle
         return {"figure": fig, "title": title, "bullets": list(bullets), "caption": caption}
 
-    # Render figure HTML if supported, else rely on notebook renderer
-    fig_html: str
+    # Every output carries the (small) stylesheet, so re-running or clearing one cell
+    # never leaves the other story blocks in the notebook unstyled
+    html = _STATIC_CSS + _story_block_html(fig, title, bullets, caption, width_left, theme, cache_fig_html)
+    if return_html:
+        return html
+    if not display_now:
+        return HTML(html)
+    display(HTML(html))
+    return None
+
+
+def story_blocks(
+    blocks: Sequence[Mapping[str, Any]],
+    theme: str = "light",
+    return_html: bool = False,
+    display_now: bool = True,
+) -> Union[str, List[Dict[str, Any]], "HTML", None]:
+    """Render several story blocks with a single notebook display call.
+
+    Each block is a mapping of :func:`story_block` arguments (``fig``, ``title``,
+    ``bullets`` and optionally ``caption``, ``width_left``, ``theme``,
+    ``cache_fig_html``). Blocks without their own ``theme`` use ``theme``. The
+    shared CSS is emitted once for the batch.
+
+    Args:
+        blocks: Story block specifications, rendered in order
+        theme: Default theme for blocks that do not set one
+        return_html: Return the combined HTML string instead of displaying it
+        display_now: Display the blocks immediately; pass ``False`` to get an
+            ``IPython.display.HTML`` object back instead
+    """
     try:
-        # Plotly
-        fig_html = fig.to_html(include_plotlyjs="cdn", full_html=False)  # type: ignore[attr-defined]
+        from IPython.display import HTML, display  # type: ignore
     except Exception:
-        try:
-            # Altair
-            fig_html = fig.to_html()  # type: ignore[attr-defined]
-        except Exception:
-            # Fallback: rely on IPython repr
-            fig_html = f"<div class='figure-fallback'>{fig}</div>"
-
-    text_color = "#111" if theme == "light" else "#fafafa"
-    sub_color = "#444" if theme == "light" else "#ddd"
-
-    html = f"""
-    <div style="display:flex; gap:18px; align-items:flex-start; width:100%;">
-      <div style="flex:0 0 {width_left}; max-width:{width_left};">{fig_html}</div>
-      <div style="flex:1; font-family: system-ui, -apple-system, Segoe UI, Roboto, sans-serif; color:{text_color};">
-        <h3 style="margin:0 0 6px 0; font-weight:700;">{title}</h3>
-        <ul style="margin:6px 0 8px 18px; padding:0; line-height:1.4;">{_join_bullets(list(bullets))}</ul>
-        {f"<div style='font-size:12px; color:{sub_color}; margin-top:4px;'>{caption}</div>" if caption else ''}
-      </div>
-    </div>
-    """
+        # Outside IPython: just return the content so callers can handle
+        return [
+            {
+                "figure": block["fig"],
+                "title": block["title"],
+                "bullets": list(block["bullets"]),
+                "caption": block.get("caption"),
+            }
+            for block in blocks
+        ]
+
+    html = _STATIC_CSS + "".join(
+        _story_block_html(
+            block["fig"],
+            block["title"],
+            block["bullets"],
+            block.get("caption"),
+            block.get("width_left", "58%"),
+            block.get("theme", theme),
+            block.get("cache_fig_html", False),
+        )
+        for block in blocks
+    )
     if return_html:
         return html
+    if not display_now:
+        return HTML(html)
     display(HTML(html))
     return None
 
 
+# Shared by quick_takeaways and quick_takeaways_many so both stay in sync
+_ARROW_UP: Final[str] = "⤴️"
+_ARROW_DOWN: Final[str] = "⤵️"
+_STEADY_TAKEAWAY: Final[str] = "Steady performance — watch for emerging spikes and collabs 🤝"
+
+
 def quick_takeaways(
     artist: str,
     last_7d_change_pct: Optional[float] = None,
@@ -85,17 +323,69 @@ def quick_takeaways(
     """
     out: list[str] = []
     if last_7d_change_pct is not None:
-        arrow = "⤴️" if last_7d_change_pct >= 0 else "⤵️"
+        arrow = _ARROW_UP if last_7d_change_pct >= 0 else _ARROW_DOWN
         out.append(f"Momentum {arrow} last 7 days: {last_7d_change_pct:+.1f}%")
     if engagement_rate is not None:
         out.append(f"Fan engagement: {engagement_rate:.1f}% — community leaning in 🎧")
     if standout_video:
         out.append(f"Breakout track: “{standout_video}” — consider boosting promo 💸")
     if not out:
-        out.append("Steady performance — watch for emerging spikes and collabs 🤝")
+        out.append(_STEADY_TAKEAWAY)
     return out
 
 
+def quick_takeaways_many(df: pd.DataFrame) -> pd.Series:
+    """Vectorized :func:`quick_takeaways` for a DataFrame of artists.
+
+    Reads the optional columns ``last_7d_change_pct``, ``engagement_rate`` and
+    ``standout_video`` (missing columns or NaN values are skipped, just like
+    ``None`` arguments) and formats every row's bullets in a handful of
+    column-wise operations.
+
+    Returns:
+        Series aligned with ``df.index`` holding a list of bullets per row
+    """
+    n = len(df)
+    missing = pd.Series(np.nan, index=range(n), dtype=object)
+
+    def _col(name: str) -> pd.Series:
+        return df[name].reset_index(drop=True) if name in df.columns else missing
+
+    change = pd.to_numeric(_col("last_7d_change_pct"), errors="coerce")
+    engagement = pd.to_numeric(_col("engagement_rate"), errors="coerce")
+    standout = _col("standout_video")
+
+    arrows = pd.Series(np.where(change >= 0, _ARROW_UP, _ARROW_DOWN), index=change.index)
+    parts = pd.DataFrame(
+        {
+            "momentum": ("Momentum " + arrows + " last 7 days: " + change.map("{:+.1f}%".format).astype(str)).where(
+                change.notna()
+            ),
+            "engagement": (
+                "Fan engagement: " + engagement.map("{:.1f}%".format).astype(str) + " — community leaning in 🎧"
+            ).where(engagement.notna()),
+            "standout": ("Breakout track: “" + standout.astype(str) + "” — consider boosting promo 💸").where(
+                standout.notna() & standout.astype(bool)
+            ),
+        }
+    )
+
+    stacked = parts.stack()
+    stacked = stacked[stacked.notna()]
+    bullets = stacked.groupby(level=0, sort=False).agg(list).reindex(range(n))
+    bullets = bullets.map(lambda b: b if isinstance(b, list) else [_STEADY_TAKEAWAY])
+    bullets.index = df.index
+    return bullets
+
+
+# Intro templates for artist comparisons; ``{artist_list}`` is filled in per call
+_ARTIST_COMPARISON_INTROS: tuple[str, ...] = (
+    "🎵 **The Music Data Detective Story** 🕵️‍♀️\n\nWelcome to the fascinating world where music meets data science! Today we're diving deep into the YouTube performance of {artist_list}. Think of this as your backstage pass to understanding how artists build their digital empires, one view at a time.\n\n*What makes an artist's content resonate? How do engagement patterns reveal fan loyalty? Let's find out together!*",
+    "🚀 **From Bedroom Studios to Billboard Charts** 📈\n\nEvery chart-topping artist started somewhere, and YouTube has become the modern equivalent of playing local venues. We're analyzing {artist_list} to uncover the data-driven secrets behind their success.\n\n*Spoiler alert: It's not just about the music anymore. It's about understanding your audience, timing your releases, and building genuine connections through content.*",
+    "💡 **The Algorithm Whisperers** 🤖\n\nIn today's music industry, understanding YouTube's algorithm is as important as understanding chord progressions. We're examining how {artist_list} navigate this digital landscape, turning data insights into career momentum.\n\n*Ready to see how the sausage gets made? Let's decode the patterns that separate viral hits from hidden gems.*",
+)
+
+
 def narrative_intro(
     analysis_type: str = "artist_comparison",
     context: Optional[Dict[str, Any]] = None,
@@ -117,17 +407,11 @@ def narrative_intro(
     if analysis_type == "artist_comparison":
         artists = context.get("artists", ["our featured artists"])
         if isinstance(artists, list) and len(artists) > 1:
-            artist_list = ", ".join(artists[:-1]) + f" and {artists[-1]}"
+            artist_list = f"{', '.join(islice(artists, len(artists) - 1))} and {artists[-1]}"
         else:
             artist_list = str(artists[0]) if artists else "our featured artists"
 
-        intros = [
-            f"🎵 **The Music Data Detective Story** 🕵️‍♀️\n\nWelcome to the fascinating world where music meets data science! Today we're diving deep into the YouTube performance of {artist_list}. Think of this as your backstage pass to understanding how artists build their digital empires, one view at a time.\n\n*What makes an artist's content resonate? How do engagement patterns reveal fan loyalty? Let's find out together!*",
-            f"🚀 **From Bedroom Studios to Billboard Charts** 📈\n\nEvery chart-topping artist started somewhere, and YouTube has become the modern equivalent of playing local venues. We're analyzing {artist_list} to uncover the data-driven secrets behind their success.\n\n*Spoiler alert: It's not just about the music anymore. It's about understanding your audience, timing your releases, and building genuine connections through content.*",
-            f"💡 **The Algorithm Whisperers** 🤖\n\nIn today's music industry, understanding YouTube's algorithm is as important as understanding chord progressions. We're examining how {artist_list} navigate this digital landscape, turning data insights into career momentum.\n\n*Ready to see how the sausage gets made? Let's decode the patterns that separate viral hits from hidden gems.*",
-        ]
-
-        return random.choice(intros)
+        return _rng.choice(_ARTIST_COMPARISON_INTROS).format(artist_list=artist_list)
 
     elif analysis_type == "sentiment_analysis":
         return "💬 **Reading Between the Lines** 📊\n\nComments sections are the modern equivalent of fan mail, and they're goldmines of insight. We're using sentiment analysis to understand how audiences really feel about content, beyond just likes and views.\n\n*Every comment tells a story. Let's listen to what the data is saying.*"
@@ -136,6 +420,53 @@ def narrative_intro(
         return f"📊 **Data-Driven Music Insights** 🎶\n\nWelcome to an exploration of {analysis_type}! We're combining the art of music with the science of data to uncover insights that can shape careers and inform decisions.\n\n*Let's turn numbers into narratives and metrics into music industry magic.*"
 
 
+_EXPLANATIONS: Dict[tuple[str, str], str] = {
+    (
+        "engagement_rate",
+        "beginner",
+    ): "📚 **What's Engagement Rate?**\n\nEngagement rate measures how actively fans interact with content beyond just watching. It includes likes, comments, shares, and saves divided by total views.\n\n*Think of it like applause at a concert - views are attendance, but engagement shows how much the audience loved the show!*",
+    (
+        "engagement_rate",
+        "intermediate",
+    ): "📊 **Deep Dive: Engagement Metrics**\n\nEngagement rate = (Likes + Comments + Shares) / Views × 100\n\nHigh engagement (>3%) suggests strong fan loyalty and algorithmic favor. Low engagement might indicate passive consumption or content-audience mismatch.\n\n*Industry benchmark: 2-4% is solid, 5%+ is exceptional for established artists.*",
+    (
+        "engagement_rate",
+        "advanced",
+    ): "🔬 **Engagement Rate Analytics**\n\nEngagement velocity (rate of engagement over time) often predicts viral potential better than absolute numbers. Consider engagement quality (comment sentiment, share context) alongside quantity.\n\n*Advanced tip: Engagement patterns in first 24 hours strongly correlate with long-term performance and algorithmic promotion.*",
+    (
+        "momentum",
+        "beginner",
+    ): "🚀 **Understanding Momentum**\n\nMomentum tracks how fast an artist's metrics are changing. Positive momentum means growing views, subscribers, or engagement. It's like measuring if a song is climbing or falling on the charts.\n\n*Momentum matters more than absolute numbers for investment decisions!*",
+    (
+        "momentum",
+        "intermediate",
+    ): "📈 **Momentum Calculations**\n\nWe calculate momentum using percentage change over rolling time windows (7-day, 30-day). Sustained positive momentum across multiple metrics indicates genuine growth vs. one-hit wonders.\n\n*Key insight: Consistent 10% monthly growth often outperforms sporadic viral spikes.*",
+    (
+        "momentum",
+        "advanced",
+    ): "⚡ **Advanced Momentum Analysis**\n\nMomentum analysis includes trend decomposition, seasonality adjustment, and cross-metric correlation. Leading indicators (comment sentiment, subscriber velocity) often predict view momentum.\n\n*Pro tip: Momentum inflection points often coincide with strategic content pivots or external events.*",
+    (
+        "youtube_algorithm",
+        "beginner",
+    ): "🤖 **The YouTube Algorithm Explained**\n\nYouTube's algorithm decides which videos get recommended to viewers. It considers watch time, engagement, click-through rates, and viewer behavior patterns.\n\n*Think of it as a digital DJ that learns what each listener likes and creates personalized playlists!*",
+    (
+        "youtube_algorithm",
+        "intermediate",
+    ): "🎯 **Algorithm Optimization Strategies**\n\nKey factors: Session duration, audience retention curves, engagement velocity, and topic authority. The algorithm rewards creators who keep viewers on the platform longer.\n\n*Strategy: Focus on series content and playlists to increase session watch time.*",
+    (
+        "youtube_algorithm",
+        "advanced",
+    ): "🧠 **Algorithmic Ranking Factors**\n\nMulti-objective optimization balancing user satisfaction, advertiser value, and creator ecosystem health. Recent updates emphasize authentic engagement over vanity metrics.\n\n*Advanced insight: Cross-video engagement patterns and subscriber notification rates heavily influence reach.*",
+}
+
+# Intern keys and texts so lookups hit the identity fast path and every
+# returned copy of a sidebar shares one string object
+_EXPLANATIONS = {
+    (sys.intern(concept), sys.intern(level)): sys.intern(text) for (concept, level), text in _EXPLANATIONS.items()
+}
+
+
+@lru_cache(maxsize=128)
 def educational_sidebar(
     concept: str,
     complexity_level: str = "beginner",
@@ -152,30 +483,64 @@ def educational_sidebar(
     Returns:
         Markdown-formatted educational content
     """
-    explanations = {
-        "engagement_rate": {
-            "beginner": "📚 **What's Engagement Rate?**\n\nEngagement rate measures how actively fans interact with content beyond just watching. It includes likes, comments, shares, and saves divided by total views.\n\n*Think of it like applause at a concert - views are attendance, but engagement shows how much the audience loved the show!*",
-            "intermediate": "📊 **Deep Dive: Engagement Metrics**\n\nEngagement rate = (Likes + Comments + Shares) / Views × 100\n\nHigh engagement (>3%) suggests strong fan loyalty and algorithmic favor. Low engagement might indicate passive consumption or content-audience mismatch.\n\n*Industry benchmark: 2-4% is solid, 5%+ is exceptional for established artists.*",
-            "advanced": "🔬 **Engagement Rate Analytics**\n\nEngagement velocity (rate of engagement over time) often predicts viral potential better than absolute numbers. Consider engagement quality (comment sentiment, share context) alongside quantity.\n\n*Advanced tip: Engagement patterns in first 24 hours strongly correlate with long-term performance and algorithmic promotion.*",
-        },
-        "momentum": {
-            "beginner": "🚀 **Understanding Momentum**\n\nMomentum tracks how fast an artist's metrics are changing. Positive momentum means growing views, subscribers, or engagement. It's like measuring if a song is climbing or falling on the charts.\n\n*Momentum matters more than absolute numbers for investment decisions!*",
-            "intermediate": "📈 **Momentum Calculations**\n\nWe calculate momentum using percentage change over rolling time windows (7-day, 30-day). Sustained positive momentum across multiple metrics indicates genuine growth vs. one-hit wonders.\n\n*Key insight: Consistent 10% monthly growth often outperforms sporadic viral spikes.*",
-            "advanced": "⚡ **Advanced Momentum Analysis**\n\nMomentum analysis includes trend decomposition, seasonality adjustment, and cross-metric correlation. Leading indicators (comment sentiment, subscriber velocity) often predict view momentum.\n\n*Pro tip: Momentum inflection points often coincide with strategic content pivots or external events.*",
-        },
-        "youtube_algorithm": {
-            "beginner": "🤖 **The YouTube Algorithm Explained**\n\nYouTube's algorithm decides which videos get recommended to viewers. It considers watch time, engagement, click-through rates, and viewer behavior patterns.\n\n*Think of it as a digital DJ that learns what each listener likes and creates personalized playlists!*",
-            "intermediate": "🎯 **Algorithm Optimization Strategies**\n\nKey factors: Session duration, audience retention curves, engagement velocity, and topic authority. The algorithm rewards creators who keep viewers on the platform longer.\n\n*Strategy: Focus on series content and playlists to increase session watch time.*",
-            "advanced": "🧠 **Algorithmic Ranking Factors**\n\nMulti-objective optimization balancing user satisfaction, advertiser value, and creator ecosystem health. Recent updates emphasize authentic engagement over vanity metrics.\n\n*Advanced insight: Cross-video engagement patterns and subscriber notification rates heavily influence reach.*",
-        },
-    }
-
-    if concept in explanations and complexity_level in explanations[concept]:
-        return explanations[concept][complexity_level]
+    explanation = _EXPLANATIONS.get((concept, complexity_level))
+    if explanation is not None:
+        return explanation
 
     return f"💡 **About {concept.replace('_', ' ').title()}**\n\nThis is an important concept in music industry analytics. Understanding {concept} helps artists and labels make data-driven decisions about content strategy and resource allocation."
 
 
+# (from_section, to_section, phrasings); small enough that a linear scan beats hashing a tuple key
+_TRANSITIONS: Final[tuple[tuple[str, str, tuple[str, ...]], ...]] = (
+    (
+        "overview",
+        "comparison",
+        (
+            "Now that we've set the stage, let's dive into the head-to-head comparison. This is where the real insights emerge! 🥊",
+            "With the landscape mapped out, it's time to zoom in on the competitive dynamics. Who's winning the engagement game? 🏆",
+            "The overview gave us the big picture - now let's get tactical and see how these artists stack up against each other. 📊",
+        ),
+    ),
+    (
+        "comparison",
+        "deep_dive",
+        (
+            "The numbers tell one story, but let's dig deeper into what's driving these patterns. Time for some detective work! 🔍",
+            "Surface-level metrics are just the beginning. Let's dig deep and uncover the strategic insights hiding in the data. 💎",
+            "Interesting patterns are emerging! Let's investigate what's really happening behind these trends. 🕵️‍♀️",
+        ),
+    ),
+    (
+        "deep_dive",
+        "recommendations",
+        (
+            "All this analysis leads to one crucial question: What should we do about it? Let's get strategic! 💡",
+            "Data without action is just pretty charts. Time to turn these insights into investment decisions. 💰",
+            "The evidence is clear - now let's translate these findings into concrete next steps. 🎯",
+        ),
+    ),
+    (
+        "analysis",
+        "sentiment",
+        (
+            "Numbers tell us what happened, but sentiment analysis reveals how people feel about it. Let's listen to the audience! 💬",
+            "Beyond the metrics lies the human story. What are fans actually saying in the comments? 🗣️",
+            "Time to add the human element to our data story. Sentiment analysis reveals the emotional connection. ❤️",
+        ),
+    ),
+)
+
+
+@lru_cache(maxsize=128)
+def _transition_choices(from_section: str, to_section: str) -> Optional[tuple[str, ...]]:
+    """Phrasings for a section pair, matched case-insensitively, or None if there are none."""
+    from_key, to_key = from_section.lower(), to_section.lower()
+    for src, dst, choices in _TRANSITIONS:
+        if src == from_key and dst == to_key:
+            return choices
+    return None
+
+
 def section_transition(
     from_section: str,
     to_section: str,
@@ -194,32 +559,10 @@ def section_transition(
     Returns:
         Markdown-formatted transition text
     """
-    transitions = {
-        ("overview", "comparison"): [
-            "Now that we've set the stage, let's dive into the head-to-head comparison. This is where the real insights emerge! 🥊",
-            "With the landscape mapped out, it's time to zoom in on the competitive dynamics. Who's winning the engagement game? 🏆",
-            "The overview gave us the big picture - now let's get tactical and see how these artists stack up against each other. 📊",
-        ],
-        ("comparison", "deep_dive"): [
-            "The numbers tell one story, but let's dig deeper into what's driving these patterns. Time for some detective work! 🔍",
-            "Surface-level metrics are just the beginning. Let's dig deep and uncover the strategic insights hiding in the data. 💎",
-            "Interesting patterns are emerging! Let's investigate what's really happening behind these trends. 🕵️‍♀️",
-        ],
-        ("deep_dive", "recommendations"): [
-            "All this analysis leads to one crucial question: What should we do about it? Let's get strategic! 💡",
-            "Data without action is just pretty charts. Time to turn these insights into investment decisions. 💰",
-            "The evidence is clear - now let's translate these findings into concrete next steps. 🎯",
-        ],
-        ("analysis", "sentiment"): [
-            "Numbers tell us what happened, but sentiment analysis reveals how people feel about it. Let's listen to the audience! 💬",
-            "Beyond the metrics lies the human story. What are fans actually saying in the comments? 🗣️",
-            "Time to add the human element to our data story. Sentiment analysis reveals the emotional connection. ❤️",
-        ],
-    }
-
-    key = (from_section.lower(), to_section.lower())
-    if key in transitions:
-        transition = random.choice(transitions[key])
+    # Repeat calls with the same spelling skip the lowercasing and the table scan
+    choices = _transition_choices(from_section, to_section)
+    if choices is not None:
+        transition = _rng.choice(choices)
     else:
         transition = f"Let's shift our focus from {from_section} to explore {to_section}. 🔄"
 
@@ -229,6 +572,15 @@ def section_transition(
     return f"\n---\n\n{transition}\n"
 
 
+_CHART_GUIDES: Dict[str, str] = {
+    "line_chart": "📈 **Reading the Timeline**\n\nLine charts show trends over time. Look for:",
+    "bar_chart": "📊 **Comparing Performance**\n\nBar charts make comparisons easy. Focus on:",
+    "scatter_plot": "🎯 **Finding Relationships**\n\nScatter plots reveal correlations. Watch for:",
+    "heatmap": "🌡️ **Pattern Recognition**\n\nHeatmaps show intensity patterns. Notice:",
+    "pie_chart": "🥧 **Understanding Proportions**\n\nPie charts show how parts make up the whole. Examine:",
+}
+
+
 def chart_context(
     chart_type: str,
     what_to_look_for: List[str],
@@ -247,26 +599,27 @@ def chart_context(
     Returns:
         Markdown-formatted chart reading guide
     """
-    chart_guides = {
-        "line_chart": "📈 **Reading the Timeline**\n\nLine charts show trends over time. Look for:",
-        "bar_chart": "📊 **Comparing Performance**\n\nBar charts make comparisons easy. Focus on:",
-        "scatter_plot": "🎯 **Finding Relationships**\n\nScatter plots reveal correlations. Watch for:",
-        "heatmap": "🌡️ **Pattern Recognition**\n\nHeatmaps show intensity patterns. Notice:",
-        "pie_chart": "🥧 **Understanding Proportions**\n\nPie charts show how parts make up the whole. Examine:",
-    }
+    return _chart_context_cached(chart_type, tuple(what_to_look_for), tuple(business_implications or ()))
 
-    guide_start = chart_guides.get(
-        chart_type, f"📊 **Understanding This {chart_type.replace('_', ' ').title()}**\n\nLook for:"
-    )
+
+@lru_cache(maxsize=256)
+def _chart_context_cached(
+    chart_type: str,
+    what_to_look_for: tuple[str, ...],
+    business_implications: tuple[str, ...],
+) -> str:
+    guide_start = _CHART_GUIDES.get(chart_type)
+    if guide_start is None:
+        guide_start = f"📊 **Understanding This {chart_type.replace('_', ' ').title()}**\n\nLook for:"
 
     # Format what to look for
-    lookfor_bullets = "\n".join([f"• {item}" for item in what_to_look_for])
+    lookfor_bullets = "\n".join(f"• {item}" for item in what_to_look_for)
 
     result = f"{guide_start}\n\n{lookfor_bullets}"
 
     # Add business implications if provided
     if business_implications:
-        implications_bullets = "\n".join([f"• {item}" for item in business_implications])
+        implications_bullets = "\n".join(f"• {item}" for item in business_implications)
         result += f"\n\n**💼 Business Impact:**\n\n{implications_bullets}"
 
     return result
@@ -289,12 +642,112 @@ class DataQualityWarning(UserWarning):
     pass
 
 
+@dataclass(slots=True)
+class ValidationResult:
+    """Outcome of :func:`validate_data_for_storytelling`.
+
+    Supports the read side of the mapping protocol (``result["key"]``, ``in``,
+    iteration, ``get``, ``keys``/``values``/``items``, ``dict(result)``) plus item
+    assignment, so code written against the former dict return value keeps
+    working; use :meth:`to_dict` for a plain dict.
+    """
+
+    is_valid: bool = True
+    warnings: List[str] = field(default_factory=list)
+    errors: List[str] = field(default_factory=list)
+    recommendations: List[str] = field(default_factory=list)
+    confidence_score: float = 1.0
+    data_quality_issues: List[str] = field(default_factory=list)
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in _VALIDATION_FIELDS:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        if key not in _VALIDATION_FIELDS:
+            raise KeyError(key)
+        setattr(self, key, value)
+
+    def __contains__(self, key: object) -> bool:
+        return key in _VALIDATION_FIELDS
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(_VALIDATION_FIELDS)
+
+    def __len__(self) -> int:
+        return len(_VALIDATION_FIELDS)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return getattr(self, key) if key in _VALIDATION_FIELDS else default
+
+    def keys(self) -> KeysView[str]:
+        return self.to_dict().keys()
+
+    def values(self) -> ValuesView[Any]:
+        return self.to_dict().values()
+
+    def items(self) -> ItemsView[str, Any]:
+        return self.to_dict().items()
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {name: getattr(self, name) for name in _VALIDATION_FIELDS}
+
+
+_VALIDATION_FIELDS: Final[tuple[str, ...]] = tuple(f.name for f in fields(ValidationResult))
+
+
+# Validation messages, built once; templates are filled with str.format when they fire
+_MSG_NO_DATA: Final[str] = (
+    "📊 **No Data Available** 📊\n\n"
+    "We couldn't find any data to analyze! This could happen for several reasons:\n"
+    "• The database might be empty or not properly connected\n"
+    "• Your date range might be too restrictive\n"
+    "• The artists you're looking for might not be in our dataset\n\n"
+    "💡 **What to try next:**\n"
+    "• Check your database connection\n"
+    "• Expand your date range\n"
+    "• Verify artist names are spelled correctly"
+)
+_MSG_LIMITED_DATA_TMPL: Final[str] = (
+    "📉 **Limited Data Warning** 📉\n\n"
+    "We found only {n_rows} rows of data, which might not be enough for reliable {analysis_type} analysis. "
+    "For best results, we recommend at least {min_rows} data points.\n\n"
+    "💡 **This might affect:**\n"
+    "• Statistical significance of trends\n"
+    "• Reliability of comparisons\n"
+    "• Confidence in recommendations"
+)
+_MSG_MISSING_COLUMNS_TMPL: Final[str] = (
+    "🔍 **Missing Data Columns** 🔍\n\n"
+    "We're missing some essential data columns for {analysis_type} analysis:\n"
+    "Missing: {missing}\n"
+    "Available: {available}\n\n"
+    "💡 **This usually means:**\n"
+    "• The data extraction didn't complete properly\n"
+    "• Database schema has changed\n"
+    "• Different data source than expected"
+)
+_MSG_HIGH_NULLS_TMPL: Final[str] = (
+    "⚠️ **High Missing Data in {col}** ⚠️\n\n"
+    "{null_pct:.1f}% of {col} values are missing. This could significantly impact analysis quality.\n\n"
+    "💡 **Consider:**\n"
+    "• Filtering out incomplete records\n"
+    "• Using alternative metrics\n"
+    "• Investigating data collection issues"
+)
+_MSG_SOME_NULLS_TMPL: Final[str] = (
+    "📝 **Some Missing Data in {col}** 📝\n\n"
+    "{null_pct:.1f}% of {col} values are missing. Analysis will continue but results may be affected."
+)
+
+
 def validate_data_for_storytelling(
     data: pd.DataFrame,
     required_columns: List[str],
     analysis_type: str = "general",
     min_rows: int = 1,
-) -> Dict[str, Any]:
+) -> ValidationResult:
     """
     Validate data quality for storytelling analysis with educational error messages.
 
@@ -305,106 +758,71 @@ def validate_data_for_storytelling(
         min_rows: Minimum number of rows required
 
     Returns:
-        Dict with validation results and recommendations
+        ValidationResult with validation results and recommendations
 
     Raises:
         StorytellingDataError: For critical validation failures
     """
-    validation_result = {
-        "is_valid": True,
-        "warnings": [],
-        "errors": [],
-        "recommendations": [],
-        "confidence_score": 1.0,
-        "data_quality_issues": [],
-    }
+    validation_result = ValidationResult()
 
     # Check if data exists
     if data is None or data.empty:
-        validation_result["is_valid"] = False
-        validation_result["errors"].append(
-            "📊 **No Data Available** 📊\n\n"
-            "We couldn't find any data to analyze! This could happen for several reasons:\n"
-            "• The database might be empty or not properly connected\n"
-            "• Your date range might be too restrictive\n"
-            "• The artists you're looking for might not be in our dataset\n\n"
-            "💡 **What to try next:**\n"
-            "• Check your database connection\n"
-            "• Expand your date range\n"
-            "• Verify artist names are spelled correctly"
-        )
+        validation_result.is_valid = False
+        validation_result.errors.append(_MSG_NO_DATA)
         raise StorytellingDataError("No data available for analysis")
 
     # Check minimum rows
     if len(data) < min_rows:
-        validation_result["warnings"].append(
-            f"📉 **Limited Data Warning** 📉\n\n"
-            f"We found only {len(data)} rows of data, which might not be enough for reliable {analysis_type} analysis. "
-            f"For best results, we recommend at least {min_rows} data points.\n\n"
-            f"💡 **This might affect:**\n"
-            f"• Statistical significance of trends\n"
-            f"• Reliability of comparisons\n"
-            f"• Confidence in recommendations"
+        validation_result.warnings.append(
+            _MSG_LIMITED_DATA_TMPL.format(n_rows=len(data), analysis_type=analysis_type, min_rows=min_rows)
         )
-        validation_result["confidence_score"] *= 0.7
+        validation_result.confidence_score *= 0.7
 
     # Check required columns
-    missing_columns = [col for col in required_columns if col not in data.columns]
+    columns = data.columns
+    missing_columns = [col for col in required_columns if col not in columns]
     if missing_columns:
-        validation_result["is_valid"] = False
-        validation_result["errors"].append(
-            f"🔍 **Missing Data Columns** 🔍\n\n"
-            f"We're missing some essential data columns for {analysis_type} analysis:\n"
-            f"Missing: {', '.join(missing_columns)}\n"
-            f"Available: {', '.join(data.columns.tolist())}\n\n"
-            f"💡 **This usually means:**\n"
-            f"• The data extraction didn't complete properly\n"
-            f"• Database schema has changed\n"
-            f"• Different data source than expected"
+        missing = ", ".join(missing_columns)
+        validation_result.is_valid = False
+        validation_result.errors.append(
+            _MSG_MISSING_COLUMNS_TMPL.format(analysis_type=analysis_type, missing=missing, available=", ".join(columns))
         )
-        raise StorytellingDataError(f"Missing required columns: {', '.join(missing_columns)}")
-
-    # Check for null values in critical columns
-    for col in required_columns:
-        if col in data.columns:
-            null_count = data[col].isnull().sum()
-            null_pct = (null_count / len(data)) * 100
-
-            if null_pct > 50:
-                validation_result["warnings"].append(
-                    f"⚠️ **High Missing Data in {col}** ⚠️\n\n"
-                    f"{null_pct:.1f}% of {col} values are missing. This could significantly impact analysis quality.\n\n"
-                    f"💡 **Consider:**\n"
-                    f"• Filtering out incomplete records\n"
-                    f"• Using alternative metrics\n"
-                    f"• Investigating data collection issues"
-                )
-                validation_result["confidence_score"] *= 0.8
-                validation_result["data_quality_issues"].append(f"high_nulls_{col}")
-            elif null_pct > 10:
-                validation_result["warnings"].append(
-                    f"📝 **Some Missing Data in {col}** 📝\n\n"
-                    f"{null_pct:.1f}% of {col} values are missing. Analysis will continue but results may be affected."
-                )
-                validation_result["confidence_score"] *= 0.9
+        raise StorytellingDataError(f"Missing required columns: {missing}")
+
+    # Check for null values in critical columns: one 2-D reduction over all of them
+    null_pcts = data[required_columns].isna().mean() * 100
+    flagged = null_pcts[null_pcts > 10]
+    n_high = 0
+    for col, null_pct in flagged.items():
+        if null_pct > 50:
+            n_high += 1
+            validation_result.warnings.append(_MSG_HIGH_NULLS_TMPL.format(col=col, null_pct=null_pct))
+            validation_result.data_quality_issues.append(f"high_nulls_{col}")
+        else:
+            validation_result.warnings.append(_MSG_SOME_NULLS_TMPL.format(col=col, null_pct=null_pct))
+    if len(flagged):
+        validation_result.confidence_score *= 0.8**n_high * 0.9 ** (len(flagged) - n_high)
 
     # Analysis-specific validations
-    if analysis_type == "artist_comparison":
-        _validate_artist_comparison_data(data, validation_result)
-    elif analysis_type == "sentiment_analysis":
-        _validate_sentiment_data(data, validation_result)
-    elif analysis_type == "trend_analysis":
-        _validate_trend_data(data, validation_result)
+    validator = _VALIDATORS.get(analysis_type)
+    if validator is not None:
+        validator(data, validation_result)
 
     return validation_result
 
 
-def _validate_artist_comparison_data(data: pd.DataFrame, validation_result: Dict[str, Any]) -> None:
+def _validate_artist_comparison_data(data: pd.DataFrame, validation_result: ValidationResult) -> None:
     """Validate data specifically for artist comparison analysis."""
     if "artist_name" in data.columns:
-        unique_artists = data["artist_name"].nunique()
+        artists = data["artist_name"]
+        if isinstance(artists.dtype, pd.CategoricalDtype):
+            # Count the categories actually in use from the integer codes
+            codes = artists.cat.codes.to_numpy()
+            unique_artists = int(np.count_nonzero(np.bincount(codes[codes >= 0], minlength=1)))
+        else:
+            unique_artists = artists.dropna().unique().size
         if unique_artists < 2:
-            validation_result["warnings"].append(
+            validation_result.warnings.append(
                 "🎤 **Single Artist Detected** 🎤\n\n"
                 "We found data for only one artist. Artist comparison works best with multiple artists to compare.\n\n"
                 "💡 **Suggestions:**\n"
@@ -412,20 +830,28 @@ def _validate_artist_comparison_data(data: pd.DataFrame, validation_result: Dict
                 "• Consider switching to single-artist deep dive\n"
                 "• Check if artist names are being grouped correctly"
             )
-            validation_result["confidence_score"] *= 0.6
+            validation_result.confidence_score *= 0.6
         elif unique_artists > 10:
-            validation_result["warnings"].append(
+            validation_result.warnings.append(
                 f"📊 **Many Artists ({unique_artists})** 📊\n\n"
                 "With many artists, comparisons might become cluttered. Consider focusing on top performers or grouping by category."
             )
 
 
-def _validate_sentiment_data(data: pd.DataFrame, validation_result: Dict[str, Any]) -> None:
+def _validate_sentiment_data(data: pd.DataFrame, validation_result: ValidationResult) -> None:
     """Validate data specifically for sentiment analysis."""
     if "comment_count" in data.columns:
-        total_comments = data["comment_count"].sum()
+        counts = data["comment_count"]
+        arr = counts.to_numpy()
+        # Plain int/float columns skip pandas' NA-aware reduction; anything else uses it
+        if arr.dtype.kind in "iu":
+            total_comments = int(arr.sum())
+        elif arr.dtype.kind == "f":
+            total_comments = np.nansum(arr)
+        else:
+            total_comments = counts.sum()
         if total_comments < 100:
-            validation_result["warnings"].append(
+            validation_result.warnings.append(
                 "💬 **Limited Comment Data** 💬\n\n"
                 f"Only {total_comments} total comments found. Sentiment analysis is more reliable with larger comment volumes.\n\n"
                 "💡 **This affects:**\n"
@@ -433,30 +859,99 @@ def _validate_sentiment_data(data: pd.DataFrame, validation_result: Dict[str, An
                 "• Ability to detect sentiment trends\n"
                 "• Confidence in audience insights"
             )
-            validation_result["confidence_score"] *= 0.7
+            validation_result.confidence_score *= 0.7
 
 
-def _validate_trend_data(data: pd.DataFrame, validation_result: Dict[str, Any]) -> None:
+def _validate_trend_data(data: pd.DataFrame, validation_result: ValidationResult) -> None:
     """Validate data specifically for trend analysis."""
     if "published_at" in data.columns or "metrics_date" in data.columns:
         date_col = "published_at" if "published_at" in data.columns else "metrics_date"
         try:
-            data[date_col] = pd.to_datetime(data[date_col])
-            date_range = (data[date_col].max() - data[date_col].min()).days
+            # Parse a local copy only when needed; the caller's frame is left untouched.
+            # A lone row is still parsed, so an unreadable date is reported rather than read as zero days.
+            dates = data[date_col]
+            if not pd.api.types.is_datetime64_any_dtype(dates):
+                dates = pd.to_datetime(dates, cache=True)
+            date_range = (dates.max() - dates.min()).days
 
             if date_range < 7:
-                validation_result["warnings"].append(
+                validation_result.warnings.append(
                     f"📅 **Short Time Range ({date_range} days)** 📅\n\n"
                     "Trend analysis works best with longer time periods. Consider expanding your date range for more reliable trends."
                 )
-                validation_result["confidence_score"] *= 0.8
+                validation_result.confidence_score *= 0.8
         except Exception:
-            validation_result["warnings"].append(
+            validation_result.warnings.append(
                 "📅 **Date Format Issues** 📅\n\n"
                 "Having trouble parsing dates in your data. This might affect trend calculations."
             )
 
 
+# Extra checks per analysis type; other types only get the generic validation
+_VALIDATORS: Dict[str, Callable[[pd.DataFrame, ValidationResult], None]] = {
+    "artist_comparison": _validate_artist_comparison_data,
+    "sentiment_analysis": _validate_sentiment_data,
+    "trend_analysis": _validate_trend_data,
+}
+
+
+# Substrings of data-quality issue identifiers and how they read in the indicator
+_ISSUE_DESCRIPTIONS: Dict[str, str] = {
+    "high_nulls": "High missing data",
+    "limited_data": "Limited data volume",
+    "date_issues": "Date formatting problems",
+    "single_artist": "Single artist only",
+    "many_artists": "Too many artists",
+}
+_ISSUE_RE = re.compile("|".join(map(re.escape, _ISSUE_DESCRIPTIONS)))
+
+
+_CONFIDENCE_HTML = """
+    <div style="
+        background: {color}15;
+        border-left: 4px solid {color};
+        padding: 12px;
+        margin: 10px 0;
+        border-radius: 4px;
+        font-family: system-ui, sans-serif;
+    ">
+        <strong>{icon} Confidence Level: {level} ({confidence_score:.0%})</strong><br>
+        <span style="color: #666;">{message}{issue_details}</span>
+    </div>
+    """
+
+
+# Lower bounds of the Low/Medium/High tiers; scores below the first are Very Low
+_CONFIDENCE_THRESHOLDS: Final[tuple[float, ...]] = (0.5, 0.7, 0.9)
+# (color, icon, level, message template), indexed by bisect_right over the thresholds
+_CONFIDENCE_TIERS: Final[tuple[tuple[str, str, str, str], ...]] = (
+    (
+        "#dc3545",  # Red
+        "🔴",
+        "Very Low",
+        "Significant data quality issues. This {analysis_type} should be used for exploration only.",
+    ),
+    (
+        "#fd7e14",  # Orange
+        "🟠",
+        "Low",
+        "Some data quality concerns. Interpret this {analysis_type} with caution.",
+    ),
+    (
+        "#ffc107",  # Yellow
+        "🟡",
+        "Medium",
+        "Good data quality with minor issues. This {analysis_type} is generally reliable.",
+    ),
+    (
+        "#28a745",  # Green
+        "🟢",
+        "High",
+        "Excellent data quality! This {analysis_type} is highly reliable.",
+    ),
+)
+
+
 def create_confidence_indicator(
     confidence_score: float, data_quality_issues: List[str], analysis_type: str = "analysis"
 ) -> str:
@@ -471,60 +966,37 @@ def create_confidence_indicator(
     Returns:
         HTML-formatted confidence indicator
     """
-    if confidence_score >= 0.9:
-        color = "#28a745"  # Green
-        icon = "🟢"
-        level = "High"
-        message = f"Excellent data quality! This {analysis_type} is highly reliable."
-    elif confidence_score >= 0.7:
-        color = "#ffc107"  # Yellow
-        icon = "🟡"
-        level = "Medium"
-        message = f"Good data quality with minor issues. This {analysis_type} is generally reliable."
-    elif confidence_score >= 0.5:
-        color = "#fd7e14"  # Orange
-        icon = "🟠"
-        level = "Low"
-        message = f"Some data quality concerns. Interpret this {analysis_type} with caution."
-    else:
-        color = "#dc3545"  # Red
-        icon = "🔴"
-        level = "Very Low"
-        message = f"Significant data quality issues. This {analysis_type} should be used for exploration only."
+    # NaN scores compare false against every threshold, so pin them to the lowest tier
+    tier = bisect_right(_CONFIDENCE_THRESHOLDS, confidence_score) if confidence_score == confidence_score else 0
+    color, icon, level, message_tmpl = _CONFIDENCE_TIERS[tier]
+    message = message_tmpl.format(analysis_type=analysis_type)
 
     # Add specific issue details
     issue_details = ""
     if data_quality_issues:
-        issue_map = {
-            "high_nulls": "High missing data",
-            "limited_data": "Limited data volume",
-            "date_issues": "Date formatting problems",
-            "single_artist": "Single artist only",
-            "many_artists": "Too many artists",
-        }
-
-        issues_text = []
+        issues_text: List[str] = []
         for issue in data_quality_issues:
-            for key, description in issue_map.items():
-                if key in issue:
-                    issues_text.append(description)
-
+            # One scan per issue; its descriptions follow _ISSUE_DESCRIPTIONS order, each listed once
+            found = set(_ISSUE_RE.findall(issue))
+            issues_text.extend(description for key, description in _ISSUE_DESCRIPTIONS.items() if key in found)
         if issues_text:
             issue_details = f"<br><small>Issues: {', '.join(issues_text)}</small>"
 
-    return f"""
-    <div style="
-        background: {color}15;
-        border-left: 4px solid {color};
-        padding: 12px;
-        margin: 10px 0;
-        border-radius: 4px;
-        font-family: system-ui, sans-serif;
-    ">
-        <strong>{icon} Confidence Level: {level} ({confidence_score:.0%})</strong><br>
-        <span style="color: #666;">{message}{issue_details}</span>
-    </div>
-    """
+    return _CONFIDENCE_HTML.format(
+        color=color,
+        icon=icon,
+        level=level,
+        confidence_score=confidence_score,
+        message=message,
+        issue_details=issue_details,
+    )
+
+
+def _replace_column(data: pd.DataFrame, column: str, values: pd.Series) -> pd.DataFrame:
+    """Return a new frame with ``column`` swapped out; other columns are shared, not copied."""
+    out = data.copy(deep=False)
+    out[column] = values
+    return out
 
 
 def handle_missing_data_gracefully(
@@ -545,7 +1017,9 @@ def handle_missing_data_gracefully(
     if column not in data.columns:
         return data, f"⚠️ Column '{column}' not found in data"
 
-    missing_count = data[column].isnull().sum()
+    # One null mask serves the count and the exclude strategy
+    null_mask = data[column].isna()
+    missing_count = int(null_mask.sum())
     total_count = len(data)
     missing_pct = (missing_count / total_count) * 100 if total_count > 0 else 0
 
@@ -556,7 +1030,7 @@ def handle_missing_data_gracefully(
     explanation += f"Found {missing_count} missing values ({missing_pct:.1f}% of data) in {column}.\n\n"
 
     if fallback_strategy == "exclude":
-        cleaned_data = data.dropna(subset=[column])
+        cleaned_data = data.loc[~null_mask]
         explanation += f"**Strategy:** Excluding rows with missing {column} values.\n"
         explanation += f"**Impact:** Analysis will use {len(cleaned_data)} rows instead of {total_count}.\n"
         explanation += (
@@ -564,16 +1038,20 @@ def handle_missing_data_gracefully(
         )
 
     elif fallback_strategy == "fill_zero":
-        cleaned_data = data.copy()
-        cleaned_data[column] = cleaned_data[column].fillna(0)
+        cleaned_data = _replace_column(data, column, data[column].fillna(0))
         explanation += f"**Strategy:** Replacing missing {column} values with 0.\n"
         explanation += f"**Impact:** Assumes missing values represent zero activity.\n"
         explanation += f"**Why this works:** For metrics like engagement, missing often means no activity occurred."
 
     elif fallback_strategy == "fill_mean":
-        mean_value = data[column].mean()
-        cleaned_data = data.copy()
-        cleaned_data[column] = cleaned_data[column].fillna(mean_value)
+        values = data[column]
+        if values.dtype.kind == "f" and missing_count < total_count:
+            # Float columns skip the Series reduction; an all-NaN column would warn in nanmean
+            mean_value = np.nanmean(values.to_numpy(dtype=np.float64, na_value=np.nan))
+        else:
+            # Datetimes, nullable integers and all-missing columns keep pandas' own mean
+            mean_value = values.mean()
+        cleaned_data = _replace_column(data, column, data[column].fillna(mean_value))
         explanation += f"**Strategy:** Replacing missing {column} values with average ({mean_value:.2f}).\n"
         explanation += f"**Impact:** Maintains overall statistical properties while filling gaps.\n"
         explanation += (
@@ -588,13 +1066,123 @@ def handle_missing_data_gracefully(
     return cleaned_data, explanation
 
 
-def generate_data_quality_report(data: pd.DataFrame, analysis_type: str = "general") -> str:
+# Below this many rows the numba compile/dispatch cost outweighs the fused pass
+_JIT_MIN_ROWS: Final[int] = 10_000
+
+
+def _min_max_mean_loop(arr: np.ndarray) -> tuple[float, float, float]:
+    """Min, max and mean of a non-empty float array in a single traversal."""
+    lo = arr[0]
+    hi = arr[0]
+    total = 0.0
+    for i in range(arr.size):
+        value = arr[i]
+        if value < lo:
+            lo = value
+        elif value > hi:
+            hi = value
+        total += value
+    return lo, hi, total / arr.size
+
+
+try:
+    from numba import njit
+
+    _min_max_mean: Optional[Callable[[np.ndarray], tuple[float, float, float]]] = njit(_min_max_mean_loop)
+except Exception:  # pragma: no cover - optional
+    _min_max_mean = None
+
+
+# Frames at least this long are scanned with polars (when installed) unless an engine is given
+_POLARS_MIN_ROWS: Final[int] = 500_000
+
+try:
+    import polars as pl
+except Exception:  # pragma: no cover - optional
+    pl = None  # type: ignore[assignment]
+
+NumericSummary = List[tuple[Any, float, float, float]]
+
+
+def _numeric_summary(data: pd.DataFrame, columns: Sequence[Any]) -> NumericSummary:
+    """(column, min, max, mean) for each column with at least one non-null value."""
+    summary: NumericSummary = []
+    min_max_mean = _min_max_mean if len(data) > _JIT_MIN_ROWS else None
+    for col in columns:
+        if min_max_mean is not None:
+            arr = data[col].to_numpy(dtype=np.float64, na_value=np.nan)
+            arr = arr[~np.isnan(arr)]
+            if arr.size > 0:
+                summary.append((col, *min_max_mean(arr)))
+            continue
+        series = data[col].dropna()
+        if len(series) > 0:
+            summary.append((col, series.min(), series.max(), series.mean()))
+    return summary
+
+
+def _polars_quality_stats(
+    data: pd.DataFrame, numeric_cols: Sequence[Any]
+) -> Optional[tuple[float, pd.Series, NumericSummary]]:
+    """Memory estimate, null counts and numeric summary from one polars scan.
+
+    Returns ``None`` when the frame cannot be converted (e.g. non-string column
+    names or mixed object columns) so the caller can fall back to pandas.
+    """
+    try:
+        pl_df = pl.from_pandas(data, rechunk=False)
+        null_counts = pd.Series(pl_df.null_count().row(0), index=data.columns)
+        summary: NumericSummary = []
+        if len(numeric_cols):
+            # Aliased by position so the three aggregates per column get distinct names
+            row = pl_df.select(
+                expr
+                for i, col in enumerate(numeric_cols)
+                for expr in (
+                    pl.col(col).min().alias(f"{i}_min"),
+                    pl.col(col).max().alias(f"{i}_max"),
+                    pl.col(col).mean().alias(f"{i}_mean"),
+                )
+            ).row(0)
+            summary = [(col, *row[3 * i : 3 * i + 3]) for i, col in enumerate(numeric_cols) if row[3 * i] is not None]
+    except Exception:
+        return None
+    return float(pl_df.estimated_size()), null_counts, summary
+
+
+def _estimate_memory_bytes(data: pd.DataFrame, sample_size: int = 100) -> float:
+    """Approximate ``memory_usage(deep=True)`` without visiting every object.
+
+    Buffer-backed columns are measured exactly; object columns are extrapolated
+    from the average size of their first ``sample_size`` values.
+    """
+    total = float(data.memory_usage(deep=False).sum())
+    for col, dtype in data.dtypes.items():
+        if dtype != object:
+            continue
+        sample = data[col].head(sample_size)
+        if len(sample):
+            total += float(sample.map(sys.getsizeof).mean()) * len(data)
+    return total
+
+
+def generate_data_quality_report(
+    data: pd.DataFrame,
+    analysis_type: str = "general",
+    engine: Optional[Literal["pandas", "polars"]] = None,
+    deep_memory: bool = False,
+) -> str:
     """
     Generate a comprehensive data quality report for educational purposes.
 
     Args:
         data: DataFrame to analyze
         analysis_type: Type of analysis for context
+        engine: Library used for the column scans. ``None`` picks polars for frames
+            of 500k+ rows when it is installed, pandas otherwise; an unavailable
+            polars always falls back to pandas.
+        deep_memory: Measure every Python object for the memory figure instead of
+            estimating object columns from a sample (exact but slow on large frames)
 
     Returns:
         Markdown-formatted data quality report
@@ -602,47 +1190,51 @@ def generate_data_quality_report(data: pd.DataFrame, analysis_type: str = "gener
     if data is None or data.empty:
         return "❌ **No data available for quality assessment**"
 
+    numeric_cols = data.select_dtypes(include=["number"]).columns
+    if engine is None:
+        engine = "polars" if len(data) >= _POLARS_MIN_ROWS else "pandas"
+    stats = _polars_quality_stats(data, numeric_cols[:5]) if engine == "polars" and pl is not None else None
+    if stats is not None:
+        memory_bytes, missing_data, numeric_summary = stats
+    else:
+        memory_bytes = data.memory_usage(deep=True).sum() if deep_memory else _estimate_memory_bytes(data)
+        missing_data = data.isna().sum()
+        numeric_summary = _numeric_summary(data, numeric_cols[:5])  # Limit to first 5 numeric columns
+
     report = f"📋 **Data Quality Report for {analysis_type.title()} Analysis** 📋\n\n"
 
     # Basic data info
     report += f"**Dataset Overview:**\n"
     report += f"• Total records: {len(data):,}\n"
     report += f"• Columns: {len(data.columns)}\n"
-    report += f"• Memory usage: {data.memory_usage(deep=True).sum() / 1024 / 1024:.1f} MB\n\n"
+    report += f"• Memory usage: {memory_bytes / 1024 / 1024:.1f} MB\n\n"
 
     # Missing data analysis
-    missing_data = data.isnull().sum()
-    if missing_data.sum() > 0:
+    if missing_data.any():
         report += f"**Missing Data Analysis:**\n"
-        for col in missing_data[missing_data > 0].index:
-            missing_count = missing_data[col]
-            missing_pct = (missing_count / len(data)) * 100
-            if missing_pct > 20:
-                status = "🔴"
-            elif missing_pct > 5:
-                status = "🟡"
-            else:
-                status = "🟢"
-            report += f"• {col}: {missing_count:,} missing ({missing_pct:.1f}%) {status}\n"
+        missing_cols = missing_data[missing_data > 0]
+        missing_pcts = missing_cols * (100.0 / len(data))
+        statuses = np.select([missing_pcts > 20, missing_pcts > 5], ["🔴", "🟡"], default="🟢")
+        report += "".join(
+            f"• {col}: {count:,} missing ({pct:.1f}%) {status}\n"
+            for col, count, pct, status in zip(missing_cols.index, missing_cols, missing_pcts, statuses)
+        )
         report += "\n"
     else:
         report += "✅ **No missing data detected**\n\n"
 
     # Data type analysis
     report += f"**Data Types:**\n"
-    for dtype in data.dtypes.value_counts().index:
-        count = data.dtypes.value_counts()[dtype]
-        report += f"• {dtype}: {count} columns\n"
+    report += "".join(f"• {dtype}: {count} columns\n" for dtype, count in data.dtypes.value_counts().items())
     report += "\n"
 
     # Numeric columns summary
-    numeric_cols = data.select_dtypes(include=["number"]).columns
     if len(numeric_cols) > 0:
         report += f"**Numeric Data Summary:**\n"
-        for col in numeric_cols[:5]:  # Limit to first 5 numeric columns
-            series = data[col].dropna()
-            if len(series) > 0:
-                report += f"• {col}: min={series.min():.2f}, max={series.max():.2f}, mean={series.mean():.2f}\n"
+        report += "".join(
+            f"• {col}: min={col_min:.2f}, max={col_max:.2f}, mean={col_mean:.2f}\n"
+            for col, col_min, col_max, col_mean in numeric_summary
+        )
         if len(numeric_cols) > 5:
             report += f"• ... and {len(numeric_cols) - 5} more numeric columns\n"
         report += "\n"
@@ -665,7 +1257,7 @@ def generate_data_quality_report(data: pd.DataFrame, analysis_type: str = "gener
     return report
 
 
-def create_error_recovery_suggestions(error_type: str, context: Dict[str, Any] = None) -> str:
+def create_error_recovery_suggestions(error_type: str, context: Optional[Dict[str, Any]] = None) -> str:
     """
     Generate helpful error recovery suggestions with educational context.
 
@@ -1,14 +1,20 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Iterable, List, Optional
+from dataclasses import dataclass, field
+from typing import FrozenSet, Iterable, List, Optional
 
+import numpy as np
 import pandas as pd
 
 
 def ensure_cols(df: pd.DataFrame, cols: Iterable[str], fill: Optional[object] = None) -> pd.DataFrame:
-    """Ensure dataframe has the specified columns; add them filled with `fill` if missing."""
-    df = df.copy()
+    """Ensure dataframe has the specified columns; add them filled with `fill` if missing.
+
+    Always returns a new frame, never `df` itself. It is a shallow copy: existing
+    columns share their data with `df` until either side writes to them (enable
+    pandas copy-on-write on pandas 2.x to keep such writes from leaking across).
+    """
+    df = df.copy(deep=False)
     for c in cols:
         if c not in df.columns:
             df[c] = fill
@@ -27,20 +33,41 @@ def safe_head(df: pd.DataFrame, cols: Optional[Iterable[str]] = None, n: int = 5
 
 
 def filter_artists(df: pd.DataFrame, col: str, artists: Iterable[str]) -> pd.DataFrame:
-    """Return rows where `col` is in the provided `artists` list."""
-    artists = list(artists) if artists is not None else []
+    """Return rows where `col` is in the provided `artists` list.
+
+    Always returns a new frame, never `df` itself. Boolean indexing already copies
+    the selected rows; with no artists the result is a shallow copy of `df`, which
+    shares its data the same way as :func:`ensure_cols`.
+    """
+    if artists is None:
+        artists = []
+    elif not isinstance(artists, (set, frozenset)):
+        artists = list(artists)
     if not artists:
-        return df.copy()
-    return df.loc[df[col].isin(artists)].copy()
+        return df.copy(deep=False)
+    series = df[col]
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        # Compare integer category codes instead of hashing every string
+        codes = series.cat.categories.get_indexer(list(artists))
+        return df.loc[np.isin(series.cat.codes.to_numpy(), codes[codes >= 0])]
+    return df.loc[series.isin(artists)]
 
 
-@dataclass
+@dataclass(frozen=True)
 class ArtistFilter:
+    """Reusable artist filter; `artists` is read once, when the filter is built."""
+
     col: str
     artists: List[str]
+    _artist_set: FrozenSet[str] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Built once so repeated apply() calls reuse the same hash set; the dataclass
+        # is frozen so `artists` cannot be swapped out from under it
+        object.__setattr__(self, "_artist_set", frozenset(self.artists))
 
     def apply(self, df: pd.DataFrame) -> pd.DataFrame:
-        return filter_artists(df, self.col, self.artists)
+        return filter_artists(df, self.col, self._artist_set)
 
 
 __all__ = ["ensure_cols", "safe_head", "filter_artists", "ArtistFilter"]
@@ -12,19 +12,46 @@ Implements the professional approach:
 Based on expert feedback for production-grade sentiment analysis.
 """
 
+import os
 import re
+import string
+import warnings
+import zipfile
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 from enum import Enum
-from typing import Dict, List, Optional, Set, Tuple
+from functools import cached_property
+from itertools import groupby
+from typing import Any, Callable, Dict, FrozenSet, List, Optional, Set, Tuple, Union
 
 import joblib
 import numpy as np
 import pandas as pd
+from scipy import sparse
+from scipy.special import expit
 from sklearn.calibration import CalibratedClassifierCV
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.linear_model import LogisticRegression
+from sklearn.feature_extraction.text import HashingVectorizer, TfidfTransformer
+from sklearn.linear_model import SGDClassifier
 from sklearn.metrics import classification_report, f1_score
 from sklearn.model_selection import train_test_split
+from sklearn.pipeline import Pipeline
+from sklearn.utils.class_weight import compute_class_weight
+
+try:
+    from sklearn.frozen import FrozenEstimator
+except ImportError:  # scikit-learn < 1.6
+    FrozenEstimator = None
+
+try:
+    import ahocorasick
+except Exception:  # pragma: no cover - optional
+    ahocorasick = None
+
+try:
+    import hyperscan
+except Exception:  # pragma: no cover - optional
+    hyperscan = None  # type: ignore[assignment]
 
 
 class SentimentLabel(Enum):
@@ -43,6 +70,15 @@ class LabelingFunction:
     confidence: float
     description: str
 
+    @cached_property
+    def compiled(self) -> re.Pattern:
+        """Case-insensitive compiled ``pattern``, built on first use and then reused.
+
+        A cached property (rather than a dataclass field) so labeling functions
+        unpickled from models saved before it existed still work.
+        """
+        return re.compile(self.pattern, re.IGNORECASE)
+
 
 @dataclass
 class WeakLabel:
@@ -55,6 +91,309 @@ class WeakLabel:
     explanation: str
 
 
+# apply_labeling_functions(n_jobs=...) only fans out from this many texts, in shards of this size
+_PARALLEL_MIN_TEXTS = 20_000
+_PARALLEL_SHARD_SIZE = 5_000
+
+# Weight-matrix column order; also the tie-break order when resolving labels
+_CLASS_ORDER = (SentimentLabel.POSITIVE, SentimentLabel.NEGATIVE, SentimentLabel.NEUTRAL)
+
+# Rows per partial_fit call and passes over the silver-labeled set when training
+_TRAIN_CHUNK_SIZE = 10_000
+_SGD_EPOCHS = 20
+# Share of the silver labels held out to fit the Platt calibration
+_CALIBRATION_FRACTION = 0.1
+# Silver labels whose label-model posterior is below this are left out of training.
+# The top class of three always gets at least 1/3, so only a majority posterior counts as confident.
+_MIN_SILVER_CONFIDENCE = 0.5
+
+# Columns of the predict_batch/predict_fast frame
+_PREDICTION_COLUMNS = ("sentiment_score", "confidence", "positive", "neutral", "negative")
+
+_FIRE_EMOJI = "🔥"
+# Code points of the former ``[😍❤️💯👑🎵🎶]`` class, variation selector included
+_POSITIVE_EMOJI = tuple("😍❤️💯👑🎵🎶")
+_ASCII_LOWERCASE = frozenset(string.ascii_lowercase)
+_ASCII_UPPERCASE = frozenset(string.ascii_uppercase)
+_URGENCY_WORDS = ("now", "already", "asap", "please")
+
+
+# ``\b(word|two words|...)\b`` with plain lowercase alternatives: answerable by Aho-Corasick
+_LITERAL_LF_RE = re.compile(r"\\b\(((?:[a-z0-9 ']|\\')+(?:\|(?:[a-z0-9 ']|\\')+)*)\)\\b")
+
+
+def _is_word_boundary(text: str, pos: int) -> bool:
+    """Whether ``\\b`` holds at ``pos`` in ASCII ``text``."""
+    before = pos > 0 and (text[pos - 1].isalnum() or text[pos - 1] == "_")
+    after = pos < len(text) and (text[pos].isalnum() or text[pos] == "_")
+    return before != after
+
+
+# Whole-comment phrase LFs are ``^\s*(phrase|phrase)\s*\??\s*$`` with ``\s+`` between words
+_PLAIN_REQUEST_PREFIX = r"^\s*("
+_PLAIN_REQUEST_SUFFIX = r")\s*\??\s*$"
+_PLAIN_REQUEST_PHRASE_RE = re.compile(r"[a-z0-9']+(?: [a-z0-9']+)*")
+# Characters re.IGNORECASE equates with a phrase letter but str.lower() does not map onto it
+_PLAIN_REQUEST_FOLD = str.maketrans({"\u0130": "i", "\u0131": "i", "\u017f": "s"})
+
+
+def _plain_request_pattern(phrases: Tuple[str, ...]) -> str:
+    """Anchored LF pattern accepting exactly ``phrases``, with an optional trailing "?"."""
+    return _PLAIN_REQUEST_PREFIX + "|".join(phrase.replace(" ", r"\s+") for phrase in phrases) + _PLAIN_REQUEST_SUFFIX
+
+
+def _plain_request_phrases(pattern: str) -> Optional[List[str]]:
+    """Invert :func:`_plain_request_pattern`; ``None`` for any other pattern."""
+    if not (pattern.startswith(_PLAIN_REQUEST_PREFIX) and pattern.endswith(_PLAIN_REQUEST_SUFFIX)):
+        return None
+    body = pattern[len(_PLAIN_REQUEST_PREFIX) : -len(_PLAIN_REQUEST_SUFFIX)]
+    phrases = [alternative.replace(r"\s+", " ") for alternative in body.split("|")]
+    if all(_PLAIN_REQUEST_PHRASE_RE.fullmatch(phrase) for phrase in phrases):
+        return phrases
+    return None
+
+
+def _plain_request_key(text: str) -> str:
+    """Normalize a comment so it equals a phrase exactly when the phrase pattern matches it."""
+    key = text.strip()
+    if key.endswith("?"):
+        key = key[:-1]
+    key = " ".join(key.split())
+    if not key.isascii():
+        key = key.translate(_PLAIN_REQUEST_FOLD)
+    return key.lower()
+
+
+# Python's \s also covers the ASCII separators \x1c-\x1f; Hyperscan's does not, so they are
+# scanned as spaces (which every construct matching them in ``re`` also matches)
+_HYPERSCAN_WHITESPACE = bytes.maketrans(b"\x1c\x1d\x1e\x1f", b"    ")
+
+
+def _collect_match_id(pattern_id: int, start: int, end: int, flags: int, context: Set[int]) -> None:
+    """Hyperscan match callback: record which pattern fired."""
+    context.add(pattern_id)
+
+
+def _fast_dawid_skene(fired: np.ndarray, initial: np.ndarray, max_iter: int = 50) -> np.ndarray:
+    """Posterior class probabilities for LF votes via Fast Dawid-Skene EM.
+
+    Each LF either votes for its own class or abstains, so per true class the
+    model learns how often each LF fires; the E-step combines those rates with
+    the class priors naive-Bayes style. Following Fast DS, the M-step uses hard
+    (argmax) assignments and stops as soon as they no longer change.
+
+    Args:
+        fired: (n_texts x n_LFs) boolean matrix of LF firings
+        initial: (n_texts x n_classes) scores used for the starting assignment
+
+    Returns:
+        (n_texts x n_classes) posterior probabilities, columns as in ``initial``
+    """
+    n_classes = initial.shape[1]
+    votes = fired.astype(np.float64)
+    assignment = initial.argmax(axis=1)
+    for _ in range(max_iter):
+        one_hot = np.eye(n_classes)[assignment]
+        class_counts = one_hot.sum(axis=0)
+        # Laplace smoothing keeps empty classes and never-firing LFs finite
+        priors = (class_counts + 1.0) / (class_counts.sum() + n_classes)
+        fire_rate = (one_hot.T @ votes + 1.0) / (class_counts[:, None] + 2.0)
+        log_posterior = np.log(priors) + votes @ np.log(fire_rate).T + (1.0 - votes) @ np.log1p(-fire_rate).T
+        updated = log_posterior.argmax(axis=1)
+        if np.array_equal(updated, assignment):
+            break
+        assignment = updated
+
+    posterior = np.exp(log_posterior - log_posterior.max(axis=1, keepdims=True))
+    return posterior / posterior.sum(axis=1, keepdims=True)
+
+
+# Per-process analyzer for apply_labeling_functions(n_jobs=...); its matchers are compiled once per worker
+_worker_analyzer: Optional["WeakSupervisionSentimentAnalyzer"] = None
+
+
+def _init_labeling_worker(functions: List[LabelingFunction]) -> None:
+    """Process-pool initializer: index the parent's labeling functions in this worker."""
+    global _worker_analyzer
+    analyzer = WeakSupervisionSentimentAnalyzer.__new__(WeakSupervisionSentimentAnalyzer)
+    analyzer.labeling_functions = functions
+    analyzer._index_labeling_functions()
+    _worker_analyzer = analyzer
+
+
+def _label_shard(texts: List[str]) -> List[WeakLabel]:
+    """Label one shard of comments in a worker process."""
+    assert _worker_analyzer is not None, "_init_labeling_worker has not run in this process"
+    return _worker_analyzer.apply_labeling_functions(texts)
+
+
+def _make_vectorizer() -> Pipeline:
+    """Unfitted hashing + TF-IDF pipeline used for training and serving."""
+    # Stateless hashing keeps no vocabulary in memory; only the IDF weights are fitted
+    return Pipeline(
+        [
+            (
+                "hash",
+                HashingVectorizer(
+                    n_features=2**18,
+                    ngram_range=(1, 2),
+                    alternate_sign=False,
+                    norm=None,
+                    lowercase=True,
+                    stop_words="english",
+                    dtype=np.float32,
+                ),
+            ),
+            ("tfidf", TfidfTransformer()),
+        ]
+    )
+
+
+def _score_csr_loop(
+    indptr: np.ndarray,
+    indices: np.ndarray,
+    data: np.ndarray,
+    lookup: np.ndarray,
+    coef: np.ndarray,
+    intercept: np.ndarray,
+) -> np.ndarray:
+    """Linear scores of CSR rows against column-compacted weights.
+
+    ``lookup`` maps a feature column to its row in ``coef.T`` (or -1 when no
+    weight uses it), so the full-width feature matrix never has to be sliced.
+    """
+    n_rows = indptr.size - 1
+    n_outputs = coef.shape[0]
+    out = np.empty((n_rows, n_outputs))
+    for r in range(n_rows):
+        for k in range(n_outputs):
+            out[r, k] = intercept[k]
+        for p in range(indptr[r], indptr[r + 1]):
+            column = lookup[indices[p]]
+            if column < 0:
+                continue
+            value = data[p]
+            for k in range(n_outputs):
+                out[r, k] += value * coef[k, column]
+    return out
+
+
+try:
+    from numba import njit
+
+    _score_csr: Optional[Callable[..., np.ndarray]] = njit(fastmath=True)(_score_csr_loop)
+except Exception:  # pragma: no cover - optional
+    _score_csr = None
+
+
+class _CompactSentimentModel:
+    """Inference-only stand-in for the fitted classifier, held as plain arrays.
+
+    Keeps per-fold linear weights for the feature columns any fold actually
+    uses, plus the fitted calibrators (isotonic breakpoints or sigmoid
+    parameters), and reproduces ``predict_proba`` of the estimator it was built
+    from. Saved with :func:`numpy.savez`, so loading involves no unpickling.
+    """
+
+    def __init__(self, arrays: Dict[str, np.ndarray]):
+        self.arrays = arrays
+        self.classes_ = arrays["classes"]
+        self._lookup: Optional[np.ndarray] = None
+
+    @classmethod
+    def from_estimator(cls, estimator) -> "_CompactSentimentModel":
+        """Extract the arrays from a fitted CalibratedClassifierCV or bare linear classifier."""
+        calibrated = getattr(estimator, "calibrated_classifiers_", None)
+        if calibrated:
+            folds = [(fold.estimator, fold.calibrators) for fold in calibrated]
+            method = calibrated[0].method
+        else:
+            folds = [(estimator, [])]
+            method = "none"
+
+        coef = np.stack([fold_estimator.coef_ for fold_estimator, _ in folds]).astype(np.float32)
+        columns = np.flatnonzero(np.any(coef != 0, axis=(0, 1)))
+        arrays = {
+            "classes": np.asarray(estimator.classes_),
+            "method": np.array(method),
+            "columns": columns,
+            "coef": coef[:, :, columns],
+            "intercept": np.stack([fold_estimator.intercept_ for fold_estimator, _ in folds]).astype(np.float32),
+        }
+
+        calibrators = [calibrator for _, fold_calibrators in folds for calibrator in fold_calibrators]
+        if method == "isotonic":
+            lengths = [len(calibrator.X_thresholds_) for calibrator in calibrators]
+            arrays["calibrator_offsets"] = np.concatenate([[0], np.cumsum(lengths)])
+            arrays["calibrator_x"] = np.concatenate([calibrator.X_thresholds_ for calibrator in calibrators])
+            arrays["calibrator_y"] = np.concatenate([calibrator.y_thresholds_ for calibrator in calibrators])
+        elif method == "sigmoid":
+            arrays["calibrator_a"] = np.array([calibrator.a_ for calibrator in calibrators])
+            arrays["calibrator_b"] = np.array([calibrator.b_ for calibrator in calibrators])
+        return cls(arrays)
+
+    def _calibrate(self, index: int, decision: np.ndarray) -> np.ndarray:
+        """Apply the ``index``-th calibrator (fold-major, then class) to ``decision``."""
+        if str(self.arrays["method"]) == "isotonic":
+            start, stop = self.arrays["calibrator_offsets"][index : index + 2]
+            x = self.arrays["calibrator_x"][start:stop]
+            y = self.arrays["calibrator_y"][start:stop]
+            # np.interp clamps outside the breakpoints, like IsotonicRegression(out_of_bounds="clip")
+            return np.interp(decision.astype(x.dtype), x, y).astype(x.dtype)
+        return expit(-(self.arrays["calibrator_a"][index] * decision + self.arrays["calibrator_b"][index]))
+
+    def _decision_function(self, X) -> np.ndarray:
+        """(n_samples x n_folds x n_outputs) linear scores for CSR features ``X``."""
+        coef, intercept = self.arrays["coef"], self.arrays["intercept"]
+        n_folds, n_outputs, n_columns = coef.shape
+        if _score_csr is None:
+            scores = X[:, self.arrays["columns"]] @ coef.reshape(-1, n_columns).T
+            return (np.asarray(scores) + intercept.reshape(-1)).reshape(-1, n_folds, n_outputs)
+
+        if self._lookup is None or len(self._lookup) != X.shape[1]:
+            self._lookup = np.full(X.shape[1], -1, dtype=np.int64)
+            self._lookup[self.arrays["columns"]] = np.arange(n_columns)
+        scores = _score_csr(
+            X.indptr, X.indices, X.data, self._lookup, coef.reshape(-1, n_columns), intercept.reshape(-1)
+        )
+        return scores.reshape(-1, n_folds, n_outputs)
+
+    def predict_proba(self, X) -> np.ndarray:
+        n_classes = len(self.classes_)
+        n_folds, n_outputs, _ = self.arrays["coef"].shape
+        method = str(self.arrays["method"])
+        decisions = self._decision_function(X.tocsr())
+
+        # Every fold and class at once: Platt and uncalibrated scores are one
+        # elementwise expression; isotonic calibrators are applied per column
+        if method == "sigmoid":
+            a = self.arrays["calibrator_a"].reshape(n_folds, n_outputs)
+            b = self.arrays["calibrator_b"].reshape(n_folds, n_outputs)
+            scores = expit(-(a * decisions + b))
+        elif method == "none":
+            scores = expit(decisions)
+        else:
+            scores = np.empty(decisions.shape)
+            for fold in range(n_folds):
+                for k in range(n_outputs):
+                    scores[:, fold, k] = self._calibrate(fold * n_outputs + k, decisions[:, fold, k])
+
+        if n_classes == 2:
+            proba = np.stack([1.0 - scores[:, :, 0], scores[:, :, 0]], axis=2)
+        else:
+            denominator = scores.sum(axis=2, keepdims=True)
+            proba = np.divide(scores, denominator, out=np.full(scores.shape, 1 / n_classes), where=denominator != 0)
+        proba[(1.0 < proba) & (proba <= 1.0 + 1e-5)] = 1.0
+        return proba.mean(axis=1)
+
+    def predict(self, X) -> np.ndarray:
+        return self.classes_[self.predict_proba(X).argmax(axis=1)]
+
+
+# A trained classifier: fitted with sklearn, or the arrays of a loaded .npz bundle
+_SentimentModel = Union[CalibratedClassifierCV, SGDClassifier, _CompactSentimentModel]
+
+
 class WeakSupervisionSentimentAnalyzer:
     """
     Production-grade sentiment analyzer using weak supervision.
@@ -63,11 +402,21 @@ class WeakSupervisionSentimentAnalyzer:
     generates silver labels, and trains a calibrated classifier.
     """
 
-    def __init__(self):
+    def __init__(self, prediction_cache_size: int = 65_536):
+        """
+        Args:
+            prediction_cache_size: Most recent distinct texts whose :meth:`predict`
+                results are kept; comment streams repeat "mid" and "🔥🔥🔥" a lot.
+                0 disables the cache.
+        """
+        self.prediction_cache_size = prediction_cache_size
+        self._prediction_cache: "OrderedDict[str, Tuple[float, float, float, float, float]]" = OrderedDict()
         self.labeling_functions = self._create_labeling_functions()
-        self.vectorizer = TfidfVectorizer(max_features=5000, ngram_range=(1, 3), lowercase=True, stop_words="english")
-        self.classifier = None
-        self.calibrated_classifier = None
+        self._index_labeling_functions()
+        self.vectorizer = _make_vectorizer()
+        self.classifier: Optional[SGDClassifier] = None
+        self.calibrated_classifier: Optional[_SentimentModel] = None
+        self._fast_model: Optional[_CompactSentimentModel] = None
 
     def _create_labeling_functions(self) -> List[LabelingFunction]:
         """Create labeling functions from domain knowledge."""
@@ -147,19 +496,19 @@ class WeakSupervisionSentimentAnalyzer:
                 )
             )
 
-        # Plain requests = NEUTRAL
+        # Plain requests = NEUTRAL; the whole comment is one of these phrases
         plain_requests = [
-            (r"^\s*(who\s+(produced|mixed|made)\s+this)\s*\??\s*$", 0.8),
-            (r"^\s*(what\'?s\s+the\s+sample)\s*\??\s*$", 0.8),
-            (r"^\s*(lyrics)\s*\??\s*$", 0.7),
-            (r"^\s*(clean\s+version)\s*\??\s*$", 0.7),
+            (("who produced this", "who mixed this", "who made this"), 0.8),
+            (("what's the sample", "whats the sample"), 0.8),
+            (("lyrics",), 0.7),
+            (("clean version",), 0.7),
         ]
 
-        for pattern, conf in plain_requests:
+        for phrases, conf in plain_requests:
             functions.append(
                 LabelingFunction(
                     name=f"plain_req_{len(functions)}",
-                    pattern=pattern,
+                    pattern=_plain_request_pattern(phrases),
                     label=SentimentLabel.NEUTRAL,
                     confidence=conf,
                     description="Plain request",
@@ -187,67 +536,355 @@ class WeakSupervisionSentimentAnalyzer:
 
         return functions
 
-    def _extract_booster_features(self, text: str) -> Dict[str, float]:
-        """Extract intensity booster features."""
-        features = {}
-
-        # Exclamation marks
-        features["exclamation_count"] = len(re.findall(r"!", text))
-        features["multiple_exclamations"] = 1.0 if re.search(r"!{2,}", text) else 0.0
-
-        # Elongation (repeated letters)
-        elongations = re.findall(r"([a-z])\1{2,}", text.lower())
-        features["elongation_count"] = len(elongations)
-        features["max_elongation"] = max([len(match) for match in re.findall(r"([a-z])\1+", text.lower())] + [0])
+    @staticmethod
+    def _group_labeling_functions(
+        functions: List[LabelingFunction], exclude: FrozenSet[int] = frozenset()
+    ) -> List[Tuple[re.Pattern, Tuple[int, ...]]]:
+        """Group consecutive same-label LFs behind one fused alternation regex.
+
+        The fused pattern is only a prefilter: a text that misses it cannot match
+        any LF in the group, so the whole group is skipped with a single search.
+        On a hit the individual LFs (given by index) still run, keeping per-LF
+        matches (and their order) exactly as before even where their patterns overlap.
+        LFs whose index is in ``exclude`` are left out.
+        """
+        groups: List[Tuple[re.Pattern, Tuple[int, ...]]] = []
+        indexed = [(idx, lf) for idx, lf in enumerate(functions) if idx not in exclude]
+        for _, run in groupby(indexed, key=lambda item: item[1].label):
+            members = list(run)
+            fused = re.compile("|".join(f"(?:{lf.pattern})" for _, lf in members), re.IGNORECASE)
+            groups.append((fused, tuple(idx for idx, _ in members)))
+        return groups
+
+    @staticmethod
+    def _compile_hyperscan_database(functions: List[LabelingFunction]):
+        """Compile every LF pattern into one Hyperscan multi-pattern database.
+
+        Returns ``None`` when the optional ``hyperscan`` package is missing or
+        rejects a pattern; matching then uses the ``re`` path alone.
+        """
+        if hyperscan is None or not functions:
+            return None
+        flags = hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_UTF8 | hyperscan.HS_FLAG_SINGLEMATCH
+        database = hyperscan.Database()
+        try:
+            database.compile(
+                expressions=[lf.pattern.encode("utf-8") for lf in functions],
+                ids=list(range(len(functions))),
+                elements=len(functions),
+                flags=[flags] * len(functions),
+            )
+        except Exception:
+            return None
+        return database
+
+    @staticmethod
+    def _build_literal_automaton(functions: List[LabelingFunction]):
+        """Load the words of every plain ``\\b(a|b|c)\\b`` LF into one Aho-Corasick automaton.
+
+        Each keyword maps to ``(length, LF indices)``. Returns the automaton (or
+        ``None`` without the optional ``pyahocorasick``) and the indices of the
+        LFs it answers; the rest stay on the regex path.
+        """
+        if ahocorasick is None:
+            return None, frozenset()
+        keywords: Dict[str, List[int]] = {}
+        for idx, lf in enumerate(functions):
+            literal = _LITERAL_LF_RE.fullmatch(lf.pattern)
+            if literal:
+                for word in literal.group(1).replace("\\'", "'").split("|"):
+                    keywords.setdefault(word, []).append(idx)
+        if not keywords:
+            return None, frozenset()
+        automaton = ahocorasick.Automaton()
+        for word, indices in keywords.items():
+            automaton.add_word(word, (len(word), tuple(indices)))
+        automaton.make_automaton()
+        return automaton, frozenset(idx for indices in keywords.values() for idx in indices)
+
+    def _index_labeling_functions(self) -> None:
+        """Rebuild every lookup structure derived from ``self.labeling_functions``.
+
+        Besides the prefilters, the LFs are flattened into parallel arrays
+        (compiled pattern, prebuilt ``(name, label, confidence)`` entry, class
+        column, confidence) so the hot loops index a tuple instead of reading
+        dataclass attributes per LF per text.
+        """
+        functions = self.labeling_functions
+        self._lf_compiled = tuple(lf.compiled for lf in functions)
+        self._lf_entries = tuple((lf.name, lf.label, lf.confidence) for lf in functions)
+        self._lf_label_idx = np.array([_CLASS_ORDER.index(lf.label) for lf in functions], dtype=np.int8)
+        self._lf_conf = np.array([lf.confidence for lf in functions], dtype=np.float64)
+
+        # (n_LFs x 3) confidences in their label's column; columns follow _CLASS_ORDER, so a hit
+        # vector times this matrix gives the per-class weights of _resolve_labels, ties included
+        self._lf_weight_matrix = np.zeros((len(functions), len(_CLASS_ORDER)))
+        self._lf_weight_matrix[np.arange(len(functions)), self._lf_label_idx] = self._lf_conf
+
+        # Whole-comment phrase LFs are answered by one dict probe on the normalized comment
+        self._plain_requests: Dict[str, Tuple[int, ...]] = {}
+        for idx, lf in enumerate(functions):
+            for phrase in _plain_request_phrases(lf.pattern) or ():
+                self._plain_requests[phrase] = self._plain_requests.get(phrase, ()) + (idx,)
+        self._lf_plain = plain = frozenset(idx for indices in self._plain_requests.values() for idx in indices)
+        self._plain_request_max_len = max(map(len, self._plain_requests), default=0) + 1
+        self._plain_request_fused = (
+            re.compile("|".join(f"(?:{functions[idx].pattern})" for idx in sorted(plain)), re.IGNORECASE)
+            if plain
+            else None
+        )
+
+        self._lf_groups = self._group_labeling_functions(functions, exclude=plain)
+        self._lf_database = self._compile_hyperscan_database(functions)
+        self._lf_automaton, self._lf_literal = self._build_literal_automaton(functions)
+        self._lf_non_plain = frozenset(range(len(functions))) - plain
+        self._lf_regex = self._lf_non_plain - self._lf_literal
+        self._lf_regex_idx = tuple(sorted(self._lf_regex))
+
+    def _match_ascii(self, text: str) -> Set[int]:
+        """Indices of the LFs matching ASCII ``text``, via the optional multi-pattern matchers.
+
+        Word-list LFs are answered by the Aho-Corasick automaton: every keyword
+        occurrence in the lowercased text counts once both ends sit on a word
+        boundary, which for ASCII text is exactly the regex's ``\\b`` check. The
+        remaining LFs go through Hyperscan (``\\b`` and ``\\s`` are ASCII-only
+        there) with each candidate confirmed by ``re``, or through ``re`` directly.
+        """
+        hits: Set[int] = set()
+        literal = self._lf_literal if self._lf_automaton is not None else frozenset()
+        regex = self._lf_regex if literal else self._lf_non_plain
+        if literal:
+            lower = text.lower()
+            for end, (length, indices) in self._lf_automaton.iter(lower):
+                if _is_word_boundary(lower, end - length + 1) and _is_word_boundary(lower, end + 1):
+                    hits.update(indices)
+
+        if self._lf_database is not None:
+            candidates: Set[int] = set()
+            self._lf_database.scan(
+                text.encode("ascii").translate(_HYPERSCAN_WHITESPACE),
+                match_event_handler=_collect_match_id,
+                context=candidates,
+            )
+            hits.update(idx for idx in candidates if idx in regex and self._lf_compiled[idx].search(text))
+            if not candidates.isdisjoint(self._lf_plain):
+                hits.update(self._match_plain_requests(text))
+        else:
+            hits.update(idx for idx in self._lf_regex_idx if self._lf_compiled[idx].search(text))
+            hits.update(self._match_plain_requests(text))
+        return hits
+
+    def _match_labeling_functions(self, text: str) -> List[Tuple[str, SentimentLabel, float]]:
+        """Return ``(name, label, confidence)`` for every LF matching ``text``, in LF order."""
+        if text.isascii() and (self._lf_automaton is not None or self._lf_database is not None):
+            hits = self._match_ascii(text)
+        else:
+            hits = set(self._match_plain_requests(text))
+            # Skip groups whose fused pattern misses
+            for fused, members in self._lf_groups:
+                if fused.search(text):
+                    hits.update(idx for idx in members if self._lf_compiled[idx].search(text))
+        return [self._lf_entries[idx] for idx in sorted(hits)]
+
+    def _match_plain_requests(self, text: str) -> Tuple[int, ...]:
+        """Indices of the whole-comment phrase LFs matching ``text``: one dict probe.
+
+        Comments longer than any phrase (plus "?") can only match through extra
+        whitespace, so the anchored fused pattern rejects those first; it fails
+        at the first character, which is cheaper than normalizing a long comment.
+        """
+        if len(text) > self._plain_request_max_len and not (
+            self._plain_request_fused is not None and self._plain_request_fused.match(text)
+        ):
+            return ()
+        return self._plain_requests.get(_plain_request_key(text), ())
 
-        # ALL-CAPS words
-        caps_words = re.findall(r"\b[A-Z]{2,}\b", text)
-        features["caps_word_count"] = len(caps_words)
-        features["caps_ratio"] = len(caps_words) / max(len(text.split()), 1)
+    def _extract_booster_features(self, text: str) -> Dict[str, float]:
+        """Extract intensity booster features in a single pass over ``text``.
+
+        Counts match the original regex definitions: ``!`` runs, repeated
+        lowercase letters, ``\\b[A-Z]{2,}\\b`` words, and the emoji classes.
+        """
+        lower = text.lower()
+        # Only "\u0130" lowercases to two code points ("i" + combining dot); walk it as
+        # "i" and let the dot break the letter run, which keeps the two strings aligned
+        walk = lower if len(lower) == len(text) else "".join(ch.lower()[:1] for ch in text)
+
+        exclamations = elongations = caps_words = tokens = 0
+        multiple_exclamations = doubled_letter = False
+        prev_low = ""
+        letter_run = word_len = 0
+        word_caps = True
+        in_token = False
+
+        for ch, low in zip(text, walk):
+            if ch == "!":
+                exclamations += 1
+                if prev_low == "!":
+                    multiple_exclamations = True
+
+            # Runs of the same lowercase letter: 2+ is doubled, 3+ is an elongation
+            if low == prev_low and low in _ASCII_LOWERCASE:
+                letter_run += 1
+                if letter_run == 2:
+                    doubled_letter = True
+                elif letter_run == 3:
+                    elongations += 1
+            else:
+                letter_run = 1
+            prev_low = low if ch != "\u0130" else "\u0307"
+
+            # Regex word characters; a caps word is a whole word of 2+ ASCII capitals
+            if ch.isalnum() or ch == "_":
+                word_len += 1
+                if word_caps and ch not in _ASCII_UPPERCASE:
+                    word_caps = False
+            else:
+                if word_caps and word_len >= 2:
+                    caps_words += 1
+                word_len = 0
+                word_caps = True
+
+            # Whitespace-separated tokens, as counted by str.split()
+            if ch.isspace():
+                in_token = False
+            elif not in_token:
+                in_token = True
+                tokens += 1
+
+        if word_caps and word_len >= 2:
+            caps_words += 1
+
+        # Emoji are literal code points, so str.count beats testing each character
+        fire_emojis = positive_emojis = 0
+        if not text.isascii():
+            fire_emojis = text.count(_FIRE_EMOJI)
+            positive_emojis = sum(text.count(emoji) for emoji in _POSITIVE_EMOJI)
 
-        # Fire emojis and positive emojis
-        features["fire_emoji_count"] = len(re.findall(r"🔥", text))
-        features["positive_emoji_count"] = len(re.findall(r"[😍❤️💯👑🎵🎶]", text))
+        return {
+            "exclamation_count": exclamations,
+            "multiple_exclamations": 1.0 if multiple_exclamations else 0.0,
+            "elongation_count": elongations,
+            # The original findall returned the captured letter, so this is 1 for any doubled letter
+            "max_elongation": 1 if doubled_letter else 0,
+            "caps_word_count": caps_words,
+            "caps_ratio": caps_words / max(tokens, 1),
+            "fire_emoji_count": fire_emojis,
+            "positive_emoji_count": positive_emojis,
+            "urgency_count": sum(1 for word in _URGENCY_WORDS if word in lower),
+        }
 
-        # Urgency words
-        urgency_words = ["now", "already", "asap", "please"]
-        features["urgency_count"] = sum(1 for word in urgency_words if word in text.lower())
+    def apply_labeling_functions(self, texts: List[str], n_jobs: int = 1) -> List[WeakLabel]:
+        """Apply all labeling functions to generate weak labels.
 
-        return features
+        Args:
+            texts: Comments to label
+            n_jobs: Worker processes for large inputs (-1 for one per CPU). Texts
+                are labeled independently, so shards run in parallel and the
+                results come back in input order.
+        """
+        if n_jobs != 1 and len(texts) >= _PARALLEL_MIN_TEXTS:
+            return self._apply_labeling_functions_parallel(texts, n_jobs)
 
-    def apply_labeling_functions(self, texts: List[str]) -> List[WeakLabel]:
-        """Apply all labeling functions to generate weak labels."""
         weak_labels = []
+        # Duplicate comments are labeled once; each still gets its own WeakLabel
+        resolved: Dict[str, Tuple[List[Tuple[str, SentimentLabel, float]], Optional[SentimentLabel], float, str]] = {}
 
         for text in texts:
-            labels = []
-
-            # Apply each labeling function
-            for lf in self.labeling_functions:
-                if re.search(lf.pattern, text, re.IGNORECASE):
-                    labels.append((lf.name, lf.label, lf.confidence))
-
-            # Extract booster features
-            boosters = self._extract_booster_features(text)
-            booster_score = (
-                boosters["exclamation_count"] * 0.2
-                + boosters["elongation_count"] * 0.3
-                + boosters["caps_word_count"] * 0.4
-                + boosters["fire_emoji_count"] * 0.5
-                + boosters["urgency_count"] * 0.3
-            )
+            if text not in resolved:
+                # Apply each labeling function
+                labels = self._match_labeling_functions(text)
+
+                # Extract booster features
+                booster_score = self._booster_score(text)
 
-            # Resolve conflicts and determine final label
-            final_label, confidence, explanation = self._resolve_labels(labels, booster_score)
+                # Resolve conflicts and determine final label
+                resolved[text] = (labels, *self._resolve_labels(labels, booster_score))
 
+            labels, final_label, confidence, explanation = resolved[text]
             weak_labels.append(
                 WeakLabel(
-                    text=text, labels=labels, final_label=final_label, confidence=confidence, explanation=explanation
+                    text=text,
+                    labels=list(labels),
+                    final_label=final_label,
+                    confidence=confidence,
+                    explanation=explanation,
                 )
             )
 
         return weak_labels
 
+    def _apply_labeling_functions_parallel(self, texts: List[str], n_jobs: int) -> List[WeakLabel]:
+        """Label ``texts`` in shards across a process pool; see :meth:`apply_labeling_functions`."""
+        workers = (os.cpu_count() or 1) if n_jobs < 0 else n_jobs
+        shards = [texts[start : start + _PARALLEL_SHARD_SIZE] for start in range(0, len(texts), _PARALLEL_SHARD_SIZE)]
+        with ProcessPoolExecutor(
+            max_workers=min(workers, len(shards)),
+            initializer=_init_labeling_worker,
+            initargs=(self.labeling_functions,),
+        ) as executor:
+            return [weak_label for shard in executor.map(_label_shard, shards) for weak_label in shard]
+
+    def _booster_score(self, text: str) -> float:
+        """Weighted intensity score from the booster features of ``text``."""
+        boosters = self._extract_booster_features(text)
+        return (
+            boosters["exclamation_count"] * 0.2
+            + boosters["elongation_count"] * 0.3
+            + boosters["caps_word_count"] * 0.4
+            + boosters["fire_emoji_count"] * 0.5
+            + boosters["urgency_count"] * 0.3
+        )
+
+    def apply_labeling_functions_batch(self, texts: pd.Series) -> pd.DataFrame:
+        """Vectorized :meth:`apply_labeling_functions` for a Series of comments.
+
+        Each LF runs once over the whole Series via ``str.contains``, giving an
+        (n_texts x n_LFs) hit matrix; label weights are then a single matrix
+        product with ``_lf_weight_matrix``. Ties resolve like
+        :meth:`_resolve_labels` (positive, then negative, then neutral).
+
+        Returns:
+            DataFrame aligned with ``texts.index`` with ``final_label`` (a
+            SentimentLabel or None), ``confidence`` and the per-class weights
+        """
+        texts = texts.astype(str)
+        hits = self._labeling_function_hits(texts)
+        weights = hits.astype(np.float64) @ self._lf_weight_matrix
+
+        booster = self._booster_scores(texts)
+        weights[:, 0] += np.where(booster > 0.5, booster * 0.5, 0.0)
+
+        max_weight = weights.max(axis=1)
+        total = weights.sum(axis=1)
+        labeled = hits.any(axis=1) & (max_weight > 0)
+        winners = weights.argmax(axis=1)
+        final = np.array([_CLASS_ORDER[w] if ok else None for w, ok in zip(winners, labeled)], dtype=object)
+        confidence = np.divide(max_weight, total, out=np.zeros_like(total), where=labeled & (total > 0))
+
+        return pd.DataFrame(
+            {
+                "final_label": final,
+                "confidence": confidence,
+                "positive_weight": weights[:, 0],
+                "negative_weight": weights[:, 1],
+                "neutral_weight": weights[:, 2],
+            },
+            index=texts.index,
+        )
+
+    def _labeling_function_hits(self, texts: pd.Series) -> np.ndarray:
+        """(n_texts x n_LFs) boolean matrix of which LFs fire on each text."""
+        with warnings.catch_warnings():
+            # LF patterns use groups for alternation only; pandas warns about them regardless
+            warnings.filterwarnings("ignore", "This pattern is interpreted as a regular expression", UserWarning)
+            columns = [texts.str.contains(pattern, regex=True).to_numpy(dtype=bool) for pattern in self._lf_compiled]
+        return np.column_stack(columns) if columns else np.zeros((len(texts), 0), dtype=bool)
+
+    def _booster_scores(self, texts: pd.Series) -> np.ndarray:
+        """:meth:`_booster_score` for every text."""
+        return np.fromiter((self._booster_score(text) for text in texts), dtype=np.float64, count=len(texts))
+
     def _resolve_labels(
         self, labels: List[Tuple[str, SentimentLabel, float]], booster_score: float
     ) -> Tuple[Optional[SentimentLabel], float, str]:
@@ -255,10 +892,13 @@ class WeakSupervisionSentimentAnalyzer:
         if not labels:
             return None, 0.0, "No patterns matched"
 
-        # Weight labels by confidence
-        pos_weight = sum(conf for _, label, conf in labels if label == SentimentLabel.POSITIVE)
-        neg_weight = sum(conf for _, label, conf in labels if label == SentimentLabel.NEGATIVE)
-        neu_weight = sum(conf for _, label, conf in labels if label == SentimentLabel.NEUTRAL)
+        # Weight labels by confidence, in one pass over the matches
+        weights = dict.fromkeys(_CLASS_ORDER, 0.0)
+        for _, label, conf in labels:
+            weights[label] += conf
+        pos_weight = weights[SentimentLabel.POSITIVE]
+        neg_weight = weights[SentimentLabel.NEGATIVE]
+        neu_weight = weights[SentimentLabel.NEUTRAL]
 
         # Apply booster bonus to positive
         if booster_score > 0.5:
@@ -292,97 +932,316 @@ class WeakSupervisionSentimentAnalyzer:
     def train_classifier(self, texts: List[str], use_silver_labels: bool = True) -> Dict[str, float]:
         """Train classifier on silver labels or provided labels."""
         print("🔄 Generating silver labels...")
-        weak_labels = self.apply_labeling_functions(texts)
-
-        # Filter out unlabeled examples
-        labeled_data = [
-            (wl.text, wl.final_label.value) for wl in weak_labels if wl.final_label is not None and wl.confidence > 0.3
-        ]
-
-        if len(labeled_data) < 100:
-            raise ValueError(f"Insufficient labeled data: {len(labeled_data)} examples")
-
-        print(f"📊 Training on {len(labeled_data)} silver-labeled examples")
-
-        # Prepare training data
-        train_texts, train_labels = zip(*labeled_data)
-        X_train = self.vectorizer.fit_transform(train_texts)
-        y_train = np.array(train_labels)
-
-        # Train classifier with class balancing
-        self.classifier = LogisticRegression(class_weight="balanced", random_state=42, max_iter=1000)
-        self.classifier.fit(X_train, y_train)
+        series = pd.Series(texts, dtype=object).astype(str)
+        hits = self._labeling_function_hits(series)
+        booster = self._booster_scores(series)
+
+        # The booster rule votes positive like one more LF; texts no LF fired on stay unlabeled
+        fired = np.column_stack([hits, booster > 0.5])
+        labeled = np.any(hits, axis=1)
+        if labeled.sum() < 100:
+            raise ValueError(f"Insufficient labeled data: {labeled.sum()} examples")
+
+        # Denoise the votes with a label model, seeded by the hand-weighted vote
+        initial = hits[labeled].astype(np.float64) @ self._lf_weight_matrix
+        initial[:, 0] += np.where(booster[labeled] > 0.5, booster[labeled] * 0.5, 0.0)
+        posteriors = _fast_dawid_skene(fired[labeled], initial)
+
+        # Drop the silver labels the label model is not confident about
+        confident = posteriors.max(axis=1) >= _MIN_SILVER_CONFIDENCE
+        labeled[labeled] = confident
+        posteriors = posteriors[confident]
+        if labeled.sum() < 100:
+            raise ValueError(f"Insufficient confidently labeled data: {labeled.sum()} examples")
+
+        print(f"📊 Training on {labeled.sum()} silver-labeled examples")
+
+        # Prepare training data, weighting each example by the label model's confidence
+        train_texts = series[labeled].tolist()
+        X_train = self._fit_vectorizer(train_texts)
+        y_train = np.array([label.value for label in _CLASS_ORDER])[posteriors.argmax(axis=1)]
+        sample_weight = posteriors.max(axis=1)
+
+        # Hold out a stratified 10% for calibration when it gets at least two examples of every class
+        # Labels are -1/0/1, so shifted by one they histogram with a single bincount
+        label_counts = np.bincount(y_train + 1, minlength=3)
+        classes = np.flatnonzero(label_counts) - 1
+        fit_rows = np.arange(len(y_train))
+        calibrate = False
+        if label_counts[classes + 1].min() >= 3:
+            split_rows, calibration_rows = train_test_split(
+                fit_rows, test_size=_CALIBRATION_FRACTION, stratify=y_train, random_state=42
+            )
+            held_out_counts = np.bincount(y_train[calibration_rows] + 1, minlength=3)
+            calibrate = held_out_counts[classes + 1].min() >= 2
+            if calibrate:
+                fit_rows = split_rows
+
+        # Train classifier with class balancing, streaming the rows through partial_fit in chunks.
+        # partial_fit does not accept class_weight="balanced", so the weights are computed up front.
+        class_weight = dict(zip(classes, compute_class_weight("balanced", classes=classes, y=y_train[fit_rows])))
+        classifier = SGDClassifier(loss="log_loss", class_weight=class_weight, random_state=42)
+        rng = np.random.default_rng(42)
+        for _ in range(_SGD_EPOCHS):
+            order = rng.permutation(fit_rows)
+            for start in range(0, len(order), _TRAIN_CHUNK_SIZE):
+                chunk = order[start : start + _TRAIN_CHUNK_SIZE]
+                classifier.partial_fit(
+                    X_train[chunk], y_train[chunk], classes=classes, sample_weight=sample_weight[chunk]
+                )
+        self.classifier = classifier
 
-        # Calibrate probabilities
+        # Calibrate probabilities: Platt scaling of the fitted model on the held-out rows
         print("🎯 Calibrating probabilities...")
-        # Check if we have enough samples for cross-validation
-        unique_labels, counts = np.unique(y_train, return_counts=True)
-        min_samples = min(counts)
-
-        if min_samples >= 3:
-            self.calibrated_classifier = CalibratedClassifierCV(
-                self.classifier, method="isotonic", cv=min(3, min_samples)
-            )
-            self.calibrated_classifier.fit(X_train, y_train)
+        if calibrate:
+            if FrozenEstimator is not None:
+                # The frozen model is never refit; the folds only route its scores to one calibrator
+                calibrated = CalibratedClassifierCV(FrozenEstimator(classifier), method="sigmoid", cv=2)
+            else:  # scikit-learn < 1.6
+                calibrated = CalibratedClassifierCV(classifier, method="sigmoid", cv="prefit")
+            with warnings.catch_warnings():
+                # The weights are meant for the calibrator only; the classifier is already fitted
+                warnings.filterwarnings("ignore", "Since FrozenEstimator does not appear to accept sample_weight")
+                calibrated.fit(
+                    X_train[calibration_rows], y_train[calibration_rows], sample_weight=sample_weight[calibration_rows]
+                )
         else:
             # Use the base classifier if not enough samples for calibration
             print("⚠️ Not enough samples for calibration, using base classifier")
-            self.calibrated_classifier = self.classifier
+            calibrated = classifier
+        self.calibrated_classifier = calibrated
+
+        self._cast_weights_to_float32()
+        self._prediction_cache.clear()
+        self._fast_model = None
 
         # Evaluate on training data (for monitoring)
-        y_pred = self.calibrated_classifier.predict(X_train)
+        y_pred = calibrated.predict(X_train)
         f1_macro = f1_score(y_train, y_pred, average="macro")
 
         print(f"✅ Training complete. Macro-F1: {f1_macro:.3f}")
 
         return {
             "macro_f1": f1_macro,
-            "training_size": len(labeled_data),
-            "label_distribution": dict(zip(*np.unique(y_train, return_counts=True))),
+            "training_size": int(labeled.sum()),
+            "label_distribution": {int(label): int(label_counts[label + 1]) for label in classes},
         }
 
+    def _fit_vectorizer(self, texts: List[str]):
+        """Fit the IDF weights on ``texts`` and return their TF-IDF matrix.
+
+        Same result as ``self.vectorizer.fit_transform(texts)``, but the texts are
+        hashed ``_TRAIN_CHUNK_SIZE`` at a time, so the tokenizer's intermediate
+        buffers never cover more than one chunk, and IDF weighting scales the
+        stacked counts in place.
+        """
+        hasher, tfidf = self.vectorizer.named_steps["hash"], self.vectorizer.named_steps["tfidf"]
+        counts = sparse.vstack(
+            [
+                hasher.transform(texts[start : start + _TRAIN_CHUNK_SIZE])
+                for start in range(0, len(texts), _TRAIN_CHUNK_SIZE)
+            ],
+            format="csr",
+        )
+        return tfidf.fit(counts).transform(counts, copy=False)
+
+    def _cast_weights_to_float32(self) -> None:
+        """Store the fitted IDF vector and linear weights as float32 for serving.
+
+        Halves the size of the saved model and keeps the sparse-dense product
+        in predict_proba in single precision.
+        """
+        assert self.classifier is not None, "only called once train_classifier has fitted the classifier"
+        tfidf = self.vectorizer.named_steps["tfidf"]
+        tfidf.idf_ = tfidf.idf_.astype(np.float32)
+
+        estimators = [self.classifier]
+        for calibrated in getattr(self.calibrated_classifier, "calibrated_classifiers_", []):
+            # Prefit calibration wraps the trained classifier in a FrozenEstimator
+            estimators.append(getattr(calibrated.estimator, "estimator", calibrated.estimator))
+        for estimator in estimators:
+            estimator.coef_ = estimator.coef_.astype(np.float32)
+            estimator.intercept_ = estimator.intercept_.astype(np.float32)
+
     def predict(self, text: str) -> Dict[str, float]:
-        """Predict sentiment with calibrated confidence."""
+        """Predict sentiment with calibrated confidence.
+
+        Scored by the compact array model, like :meth:`predict_fast`, so a single
+        comment does not pay sklearn's per-call dispatch through the calibrators.
+        """
+        cached = self._prediction_cache.get(text)
+        if cached is None:
+            if self.calibrated_classifier is None:
+                raise ValueError("Model not trained. Call train_classifier() first.")
+            row = self._prediction_frame([text], self._compact_model()).iloc[0]
+            cached = (
+                float(row["sentiment_score"]),
+                float(row["confidence"]),
+                float(row["positive"]),
+                float(row["neutral"]),
+                float(row["negative"]),
+            )
+            if self.prediction_cache_size > 0:
+                self._prediction_cache[text] = cached
+                if len(self._prediction_cache) > self.prediction_cache_size:
+                    self._prediction_cache.popitem(last=False)
+        else:
+            self._prediction_cache.move_to_end(text)
+
+        sentiment_score, confidence, positive, neutral, negative = cached
+        return {
+            "sentiment_score": sentiment_score,
+            "confidence": confidence,
+            "probabilities": {"positive": positive, "neutral": neutral, "negative": negative},
+        }
+
+    def predict_batch(self, texts: List[str]) -> pd.DataFrame:
+        """Predict sentiment for many texts with one transform and one predict_proba call.
+
+        Returns one row per text with ``sentiment_score``, ``confidence`` and the
+        ``positive``/``neutral``/``negative`` probabilities (0.0 for classes the
+        model never saw).
+        """
         if self.calibrated_classifier is None:
             raise ValueError("Model not trained. Call train_classifier() first.")
 
-        # Vectorize text
-        X = self.vectorizer.transform([text])
+        return self._prediction_frame(texts, self.calibrated_classifier)
 
-        # Get prediction and probabilities
-        prediction = self.calibrated_classifier.predict(X)[0]
-        probabilities = self.calibrated_classifier.predict_proba(X)[0]
+    def predict_fast(self, texts: List[str]) -> pd.DataFrame:
+        """:meth:`predict_batch` scored by the compact array model.
 
-        # Map to sentiment labels
-        classes = self.calibrated_classifier.classes_
-        prob_dict = dict(zip(classes, probabilities))
+        The linear scores come from a compiled CSR kernel when numba is installed
+        (a sparse matrix product otherwise), skipping sklearn's per-call dispatch
+        through every calibrated fold. Probabilities match :meth:`predict_batch`
+        to float32 precision.
+        """
+        if self.calibrated_classifier is None:
+            raise ValueError("Model not trained. Call train_classifier() first.")
 
-        return {
-            "sentiment_score": float(prediction),
-            "confidence": float(max(probabilities)),
-            "probabilities": {
-                "positive": prob_dict.get(1, 0.0),
-                "neutral": prob_dict.get(0, 0.0),
-                "negative": prob_dict.get(-1, 0.0),
-            },
-        }
+        return self._prediction_frame(texts, self._compact_model())
+
+    def _compact_model(self) -> _CompactSentimentModel:
+        """The trained classifier as a :class:`_CompactSentimentModel`, built on first use."""
+        if self._fast_model is None:
+            model = self.calibrated_classifier
+            if not isinstance(model, _CompactSentimentModel):
+                model = _CompactSentimentModel.from_estimator(model)
+            self._fast_model = model
+        return self._fast_model
+
+    def _prediction_frame(self, texts: List[str], model) -> pd.DataFrame:
+        """Score ``texts`` with ``model`` into the :meth:`predict_batch` frame."""
+        if len(texts) == 0:
+            # HashingVectorizer.transform cannot take an empty batch
+            return pd.DataFrame({column: np.empty(0) for column in _PREDICTION_COLUMNS})
+
+        # Score each distinct text once and broadcast back; the vectorizer returns CSR,
+        # so the batch stays sparse all the way into the classifier
+        codes, unique_texts = pd.factorize(pd.Series(texts, dtype=object), use_na_sentinel=False)
+        X = self.vectorizer.transform(unique_texts)
+        probabilities = model.predict_proba(X)[codes]
+        classes = model.classes_
+        class_index = {label: i for i, label in enumerate(classes)}
+
+        def class_probability(label: int) -> np.ndarray:
+            i = class_index.get(label)
+            return probabilities[:, i] if i is not None else np.zeros(len(probabilities))
+
+        return pd.DataFrame(
+            {
+                "sentiment_score": classes[probabilities.argmax(axis=1)].astype(float),
+                "confidence": probabilities.max(axis=1),
+                "positive": class_probability(1),
+                "neutral": class_probability(0),
+                "negative": class_probability(-1),
+            }
+        )
 
     def save_model(self, path: str):
-        """Save trained model and vectorizer."""
-        model_data = {
-            "vectorizer": self.vectorizer,
-            "classifier": self.calibrated_classifier,
-            "labeling_functions": self.labeling_functions,
+        """Save the trained model as a compact ``.npz`` bundle of arrays.
+
+        Only what inference needs is kept: the non-default IDF weights, the
+        classifier weights for the feature columns it uses, the calibrators and
+        the labeling functions. Models whose vectorizer is not the hashing
+        pipeline (loaded from older joblib files) are saved with joblib as before.
+        """
+        if not isinstance(self.vectorizer, Pipeline):
+            joblib.dump(
+                {
+                    "vectorizer": self.vectorizer,
+                    "classifier": self.calibrated_classifier,
+                    "labeling_functions": self.labeling_functions,
+                },
+                path,
+            )
+            print(f"✅ Model saved to {path}")
+            return
+
+        if isinstance(self.calibrated_classifier, _CompactSentimentModel):
+            model = self.calibrated_classifier
+        else:
+            model = _CompactSentimentModel.from_estimator(self.calibrated_classifier)
+
+        # Hashed features never seen in training all share the largest IDF value
+        idf = self.vectorizer.named_steps["tfidf"].idf_
+        idf_default = idf.max()
+        idf_columns = np.flatnonzero(idf != idf_default)
+
+        lfs = self.labeling_functions
+        # Typed loosely: numpy's stubs would match a **dict[str, ndarray] against savez's allow_pickle flag
+        arrays: Dict[str, Any] = {
+            "idf_size": np.array(len(idf)),
+            "idf_default": np.array(idf_default, dtype=np.float32),
+            "idf_columns": idf_columns,
+            "idf_values": idf[idf_columns].astype(np.float32),
+            "lf_name": np.array([lf.name for lf in lfs]),
+            "lf_pattern": np.array([lf.pattern for lf in lfs]),
+            "lf_label": np.array([lf.label.value for lf in lfs], dtype=np.int8),
+            "lf_confidence": np.array([lf.confidence for lf in lfs]),
+            "lf_description": np.array([lf.description for lf in lfs]),
+            **model.arrays,
         }
-        joblib.dump(model_data, path)
+        with open(path, "wb") as f:
+            np.savez(f, **arrays)
         print(f"✅ Model saved to {path}")
 
     def load_model(self, path: str):
-        """Load trained model and vectorizer."""
-        model_data = joblib.load(path)
-        self.vectorizer = model_data["vectorizer"]
-        self.calibrated_classifier = model_data["classifier"]
-        self.labeling_functions = model_data["labeling_functions"]
+        """Load a model saved by :meth:`save_model` (``.npz`` bundle or legacy joblib)."""
+        if zipfile.is_zipfile(path):
+            with np.load(path, allow_pickle=False) as bundle:
+                arrays = {key: bundle[key] for key in bundle.files}
+
+            idf = np.full(int(arrays.pop("idf_size")), arrays.pop("idf_default"), dtype=np.float32)
+            idf[arrays.pop("idf_columns")] = arrays.pop("idf_values")
+            self.vectorizer = _make_vectorizer()
+            self.vectorizer.named_steps["tfidf"].idf_ = idf
+
+            self.labeling_functions = [
+                LabelingFunction(
+                    name=str(name),
+                    pattern=str(pattern),
+                    label=SentimentLabel(int(label)),
+                    confidence=float(confidence),
+                    description=str(description),
+                )
+                for name, pattern, label, confidence, description in zip(
+                    arrays.pop("lf_name"),
+                    arrays.pop("lf_pattern"),
+                    arrays.pop("lf_label"),
+                    arrays.pop("lf_confidence"),
+                    arrays.pop("lf_description"),
+                )
+            ]
+            self.calibrated_classifier = _CompactSentimentModel(arrays)
+        else:
+            model_data = joblib.load(path)
+            self.vectorizer = model_data["vectorizer"]
+            self.calibrated_classifier = model_data["classifier"]
+            self.labeling_functions = model_data["labeling_functions"]
+
+        self._prediction_cache.clear()
+        self._fast_model = None
+        self._index_labeling_functions()
         print(f"✅ Model loaded from {path}")
 
 
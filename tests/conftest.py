@@ -0,0 +1,32 @@
+"""Shared fixtures for the test suite."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.pool import StaticPool
+
+
+@pytest.fixture()
+def sqlite_engine(tmp_path: Path):
+    """Empty shared-cache in-memory SQLite engine; test modules add their own schema and seeds.
+
+    A module-level fixture of the same name can request this one and seed it.
+    """
+    # A StaticPool hands every checkout the same connection, so all of them share state without disk I/O
+    eng = create_engine(
+        f"sqlite:///file:aliases_{tmp_path.name}?mode=memory&cache=shared&uri=true",
+        poolclass=StaticPool,
+        connect_args={"uri": True, "check_same_thread": False},
+    )
+
+    @event.listens_for(eng, "connect")
+    def _temp_store_in_memory(dbapi_conn, _record):
+        # The database already lives in memory; keep temporary tables and indices there too
+        cursor = dbapi_conn.cursor()
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.close()
+
+    return eng
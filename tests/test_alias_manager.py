@@ -5,7 +5,7 @@ import os
 from pathlib import Path
 
 import pytest
-from sqlalchemy import Column, Integer, MetaData, String, Table, create_engine, text
+from sqlalchemy import Column, Integer, MetaData, String, Table, text
 
 from src.youtubeviz.data import _build_artist_alias_map
 
@@ -19,10 +19,10 @@ from tools.alias_manager import (
 
 
 @pytest.fixture()
-def sqlite_engine(tmp_path: Path):
-    # Use a file-backed SQLite DB so multiple connections see the same schema
-    db_path = tmp_path / "test_aliases.sqlite"
-    eng = create_engine(f"sqlite:///{db_path}")
+def sqlite_engine(sqlite_engine):
+    # Seed the empty engine from tests/conftest.py
+    eng = sqlite_engine
+
     # Minimal schema for tests (artists + youtube_videos are optional; tool does not require artists)
     meta = MetaData()
     Table(
@@ -37,13 +37,17 @@ def sqlite_engine(tmp_path: Path):
         Column("video_id", String(32), primary_key=False),
         Column("channel_title", String(255), nullable=True),
     )
-    meta.create_all(eng)
-    # Seed some names
+    # Create the schema and seed some names in a single transaction
     with eng.begin() as conn:
+        meta.create_all(conn)
         conn.execute(text("INSERT INTO artists(artist_name) VALUES (:n)"), {"n": "Enchanting"})
         conn.execute(
-            text("INSERT INTO youtube_videos(video_id, channel_title) VALUES (:id, :c1), (:id2, :c2), (:id3, :c3)"),
-            {"id": "v1", "c1": "LuvEnchantingINC", "id2": "v2", "c2": "@hicorook", "id3": "v3", "c3": None},
+            text("INSERT INTO youtube_videos(video_id, channel_title) VALUES (:video_id, :channel_title)"),
+            [
+                {"video_id": "v1", "channel_title": "LuvEnchantingINC"},
+                {"video_id": "v2", "channel_title": "@hicorook"},
+                {"video_id": "v3", "channel_title": None},
+            ],
         )
     return eng
 
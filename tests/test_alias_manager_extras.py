@@ -14,13 +14,21 @@ from tools.alias_manager import (
 )
 
 
+_VIDEO_SEEDS = [
+    {"video_id": "v1", "channel_title": "LuvEnchantingINC"},
+    {"video_id": "v2", "channel_title": "Enchanting"},
+    {"video_id": "v3", "channel_title": "@hicorook"},
+]
+
+# Extra uploads for the aggregation test, seeded alongside _VIDEO_SEEDS via indirect parametrization
+_EXTRA_LUV_VIDEOS = [{"video_id": f"v{i}", "channel_title": "LuvEnchantingINC"} for i in (4, 5, 6)]
+
+
 @pytest.fixture()
-def sqlite_engine(tmp_path: Path):
-    # Create a file-backed SQLite DB so all connections share state
-    from sqlalchemy import create_engine
+def sqlite_engine(request, sqlite_engine):
+    # Seed the empty engine from tests/conftest.py
+    eng = sqlite_engine
 
-    db_path = tmp_path / "test_aliases.db"
-    eng = create_engine(f"sqlite:///{db_path}")
     with eng.begin() as conn:
         conn.execute(
             text(
@@ -58,12 +66,13 @@ def sqlite_engine(tmp_path: Path):
             text("INSERT INTO artists(artist_name) VALUES (:n1), (:n2)"), {"n1": "Enchanting", "n2": "@hicorook"}
         )
         conn.execute(
-            text("INSERT INTO youtube_videos(video_id, channel_title) VALUES (:id1, :c1), (:id2, :c2), (:id3, :c3)"),
-            {"id1": "v1", "c1": "LuvEnchantingINC", "id2": "v2", "c2": "Enchanting", "id3": "v3", "c3": "@hicorook"},
+            text("INSERT INTO youtube_videos(video_id, channel_title) VALUES (:video_id, :channel_title)"),
+            _VIDEO_SEEDS + getattr(request, "param", []),
         )
     return eng
 
 
+@pytest.mark.parametrize("sqlite_engine", [_EXTRA_LUV_VIDEOS], indirect=True, ids=["extra_luv_videos"])
 def test_fetch_artists_and_channels_dedup_and_limit(sqlite_engine):
     """
     Ensures:
@@ -71,12 +80,6 @@ def test_fetch_artists_and_channels_dedup_and_limit(sqlite_engine):
       - duplicates are summed correctly
       - limit truncates the list deterministically (by count desc)
     """
-    with sqlite_engine.begin() as conn:
-        conn.execute(
-            text("INSERT INTO youtube_videos(video_id, channel_title) " "VALUES (:id4, :c), (:id5, :c), (:id6, :c)"),
-            {"id4": "v4", "id5": "v5", "id6": "v6", "c": "LuvEnchantingINC"},
-        )
-
     items = fetch_artists_and_channels(sqlite_engine)
     names = [n for n, _ in items]
 
@@ -92,6 +95,17 @@ def test_fetch_artists_and_channels_dedup_and_limit(sqlite_engine):
     assert limited[0][1] >= limited[1][1]
 
 
+def test_fetch_artists_and_channels_breaks_count_ties_by_name(sqlite_engine):
+    expected = [("@hicorook", 2), ("Enchanting", 2), ("LuvEnchantingINC", 1)]
+    assert fetch_artists_and_channels(sqlite_engine) == expected
+    assert fetch_artists_and_channels(sqlite_engine, limit=2) == expected[:2]
+
+    # Without the artists table the per-table fallback must order the same way
+    with sqlite_engine.begin() as conn:
+        conn.execute(text("DROP TABLE artists"))
+    assert fetch_artists_and_channels(sqlite_engine) == [("@hicorook", 1), ("Enchanting", 1), ("LuvEnchantingINC", 1)]
+
+
 def test_upsert_aliases_idempotent_and_skip_canonical(sqlite_engine):
     """
     Ensures:
@@ -119,6 +133,21 @@ def test_upsert_aliases_idempotent_and_skip_canonical(sqlite_engine):
         assert aliases == 1
 
 
+def test_upsert_aliases_more_than_one_batch(sqlite_engine):
+    """SQLite rejects compound SELECTs past 500 terms, so large alias lists go in batches."""
+    ensure_alias_table(sqlite_engine)
+
+    aliases = [f"Alias {i}" for i in range(1200)]
+    assert upsert_aliases(sqlite_engine, "Enchanting", aliases) == 1200
+    assert upsert_aliases(sqlite_engine, "Enchanting", [a.upper() for a in aliases]) == 0
+
+    with sqlite_engine.connect() as conn:
+        stored = conn.execute(
+            text("SELECT COUNT(*) FROM artist_aliases WHERE canonical_name='Enchanting' AND alias<>''")
+        ).scalar_one()
+        assert stored == 1200
+
+
 def test_write_aliases_json_overwrite_valid(sqlite_engine, tmp_path: Path):
     """
     Ensures:
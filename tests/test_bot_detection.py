@@ -16,16 +16,25 @@ from __future__ import annotations
 from datetime import datetime, timedelta, timezone
 from unittest.mock import Mock, patch
 
+import numpy as np
 import pandas as pd
+import pyarrow as pa
 import pytest
 
 # System under test
 from src.youtubeviz.bot_detection import (
     BotDetectionConfig,
     BotDetector,
+    _JIT_MIN_ROWS,
+    _MAX_NGRAM_FEATURES,
     _clamp_01,
     _count_emojis,
+    _minhash_candidate_pairs,
+    _nfkc_series,
     _normalize_text,
+    _raw_score,
+    _raw_score_loop,
+    _similarity_counts,
     _strip_emojis,
     analyze_bot_patterns,
     load_recent_comments,
@@ -50,6 +59,21 @@ class TestTextUtilsRealWorld:
         assert _count_emojis("👋 hey artist") == 1
         assert _count_emojis("no emojis") == 0
 
+    def test_minhash_pairs_near_duplicates_only(self):
+        texts = [
+            "check my channel for free beats",
+            "temazo de verdad",
+            "check my channel for free beatz",
+            "ok",  # shorter than a shingle: never paired
+        ]
+        pairs = _minhash_candidate_pairs(texts, shingle_size=3)
+        assert ((pairs[:, 0] == 0) & (pairs[:, 1] == 2)).any()
+        assert not np.isin(pairs, [1, 3]).any()
+
+    def test_nfkc_series_matches_str_normalize(self):
+        texts = pd.Series(["plain ascii", "ｆｕｌｌ width", "ﬁre 🔥", "", "e\u0301"], dtype="string[pyarrow]")
+        pd.testing.assert_series_equal(_nfkc_series(texts), texts.str.normalize("NFKC"))
+
     def test_clamp_behaves(self):
         assert _clamp_01(-1.2) == 0.0
         assert _clamp_01(0.25) == 0.25
@@ -78,7 +102,7 @@ class TestConfigBoundaries:
 # ------------------------------ Detector tests ----------------------------- #
 
 
-@pytest.fixture()
+@pytest.fixture(scope="module")
 def detector():
     # Whitelist common benign hype so fans aren't punished
     wl = frozenset(
@@ -87,11 +111,15 @@ def detector():
     return BotDetector(config=BotDetectionConfig(whitelist_phrases=wl))
 
 
+_FIXED_NOW = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
 def _now(n: int = 0):
-    return datetime.now(timezone.utc) - timedelta(seconds=n)
+    return _FIXED_NOW - timedelta(seconds=n)
 
 
-@pytest.fixture()
+# analyze_comments works on a copy, so both fixtures can be shared read-only across the module
+@pytest.fixture(scope="module")
 def df_realistic():
     """
     Build a mixed bag of legit fan comments and classic bot lures.
@@ -137,7 +165,7 @@ def test_detector_structure_and_ranges(detector, df_realistic):
     # Scores are within [0,100]
     assert out["bot_score"].between(0, 100).all()
     # Risk labels limited set
-    assert set(out["bot_risk_level"].unique()) <= {"Low", "Medium", "High"}
+    assert out["bot_risk_level"].isin(["Low", "Medium", "High"]).all()
 
 
 def test_benign_hype_not_overpenalized(detector, df_realistic):
@@ -171,7 +199,7 @@ def test_timestamp_link_and_whatsapp_telegram_lures(detector, df_realistic):
 
 def test_burst_near_duplicates_across_users_and_videos(detector, df_realistic):
     out = detector.analyze_comments(df_realistic)
-    burst = out[out["comment_text"].str.contains("check my channel", na=False)]
+    burst = out[out["comment_text"].str.contains("check my channel", regex=False, na=False)]
     assert len(burst) == 3
     # Expect local duplicate counts >= cluster size
     assert (burst["duplicate_count_local"] >= 2).all()
@@ -191,37 +219,81 @@ def test_whitelist_softens_legit_phrases(detector, df_realistic):
 # ------------------------- DB integration shims --------------------------- #
 
 
+# Shaped like load_recent_comments' result; built once through Arrow and copied into each mock
+_MOCK_COMMENTS_DF = pa.Table.from_pydict(
+    {
+        "comment_id": ["a", "b"],
+        "video_id": ["v1", "v1"],
+        "comment_text": ["check my channel", "temazo 🔥"],
+        "author_name": ["u1", "u2"],
+        "like_count": [0, 1],
+        "published_at": [_FIXED_NOW] * 2,
+        "video_title": ["Song"] * 2,
+        "channel_title": ["Artist"] * 2,
+    }
+).to_pandas()
+
+
 class TestDBEntryPoints:
     @patch("src.youtubeviz.bot_detection.pd.read_sql")
     def test_load_recent_comments_min_columns(self, mock_read_sql):
-        mock_read_sql.return_value = pd.DataFrame(
-            {
-                "comment_id": ["x1"],
-                "video_id": ["v1"],
-                "comment_text": ["nice 🔥"],
-                "author_name": ["fan"],
-                "like_count": [0],
-                "published_at": [datetime.now(timezone.utc)],
-                "video_title": ["Song"],
-                "channel_title": ["Artist"],
-            }
-        )
+        mock_read_sql.return_value = _MOCK_COMMENTS_DF.copy()
         eng = Mock()
         df = load_recent_comments(eng, days=3)
         assert not df.empty and {"comment_id", "comment_text"} <= set(df.columns)
 
+    def test_load_recent_comments_connectorx_matches_sqlalchemy(self, tmp_path, monkeypatch):
+        import sqlite3
+        from types import SimpleNamespace
+
+        from sqlalchemy import create_engine
+
+        import src.youtubeviz.bot_detection as bot_detection
+
+        db_path = tmp_path / "comments.db"
+        now = datetime.now(timezone.utc).replace(tzinfo=None)
+        with sqlite3.connect(db_path) as conn:
+            conn.execute("CREATE TABLE youtube_videos (video_id TEXT, title TEXT, channel_title TEXT)")
+            conn.execute(
+                "CREATE TABLE youtube_comments (comment_id TEXT, video_id TEXT, comment_text TEXT,"
+                " author_name TEXT, like_count INTEGER, published_at DATETIME)"
+            )
+            conn.execute("INSERT INTO youtube_videos VALUES ('v1', 'Song', 'Artist')")
+            conn.executemany(
+                "INSERT INTO youtube_comments VALUES (?, 'v1', ?, ?, ?, ?)",
+                [
+                    ("a", "temazo 🔥", "u1", 3, str(now - timedelta(days=1))),
+                    ("b", "check my channel", "u2", 0, str(now - timedelta(hours=2))),
+                    ("old", "first", "u3", 1, str(now - timedelta(days=90))),
+                ],
+            )
+        engine = create_engine(f"sqlite:///{db_path}")
+
+        monkeypatch.setattr(bot_detection, "cx", None)
+        expected = load_recent_comments(engine, days=30)
+
+        calls = []
+
+        def fake_read_sql(conn, query, return_type):
+            # connectorx returns object columns; mimic that from the raw sqlite3 rows
+            calls.append((conn, query))
+            with sqlite3.connect(conn.removeprefix("sqlite://")) as raw:
+                cursor = raw.execute(query)
+                rows = cursor.fetchall()
+            return pd.DataFrame(rows, columns=[col[0] for col in cursor.description], dtype=object)
+
+        monkeypatch.setattr(bot_detection, "cx", SimpleNamespace(read_sql=fake_read_sql))
+        got = load_recent_comments(engine, days=30)
+
+        [(conn, query)] = calls
+        assert conn == f"sqlite://{db_path}"
+        assert ":cutoff_date" not in query and "yc.published_at >= '" in query
+        assert expected["comment_id"].tolist() == ["b", "a"]
+        pd.testing.assert_frame_equal(got, expected)
+
     @patch("src.youtubeviz.bot_detection.load_recent_comments")
     def test_analyze_bot_patterns_happy(self, mock_load):
-        mock_load.return_value = pd.DataFrame(
-            {
-                "comment_id": ["a", "b"],
-                "video_id": ["v1", "v1"],
-                "comment_text": ["check my channel", "temazo 🔥"],
-                "author_name": ["u1", "u2"],
-                "like_count": [0, 1],
-                "published_at": [datetime.now(timezone.utc)] * 2,
-            }
-        )
+        mock_load.return_value = _MOCK_COMMENTS_DF.copy()
         eng = Mock()
         cfg = BotDetectionConfig()
         out = analyze_bot_patterns(eng, config=cfg, days=7)
@@ -237,6 +309,27 @@ class TestDBEntryPoints:
 # ------------------------------ Edge cases -------------------------------- #
 
 
+@pytest.fixture(scope="session")
+def scale_comments_parquet(tmp_path_factory):
+    """Write the 400-row scale frame to Parquet once per session and hand back its path."""
+    n = 400
+    ids = np.arange(n)
+    half = n // 2
+    df = pd.DataFrame(
+        {
+            "comment_id": np.char.add("c", ids.astype(str)),
+            "video_id": np.char.add("v", (ids // 20).astype(str)),
+            "comment_text": np.where(ids < half, "amazing track", np.char.add("unique ", (ids - half).astype(str))),
+            "author_name": np.char.add("user", (ids // 5).astype(str)),
+            "like_count": np.zeros(n, dtype=np.int8),
+            "published_at": _FIXED_NOW - pd.to_timedelta(ids, unit="s"),
+        }
+    )
+    path = tmp_path_factory.mktemp("bot_detection") / "scale_comments.parquet"
+    df.to_parquet(path, index=False)
+    return path
+
+
 class TestEdgeAndPerf:
     def test_empty_text_and_only_emojis(self, detector):
         df = pd.DataFrame(
@@ -246,7 +339,7 @@ class TestEdgeAndPerf:
                 "comment_text": ["", "🔥🔥🔥", None],
                 "author_name": ["u1", "u2", "u3"],
                 "like_count": [0, 3, 0],
-                "published_at": [datetime.now(timezone.utc)] * 3,
+                "published_at": [_FIXED_NOW] * 3,
             }
         )
         out = detector.analyze_comments(df)
@@ -254,23 +347,101 @@ class TestEdgeAndPerf:
         # Pure emoji praise shouldn't auto-trigger High
         assert (out.loc[out["comment_id"] == "e2", "bot_risk_level"].iloc[0]) in {"Low", "Medium"}
 
-    def test_scale_reasonably(self, detector):
-        n = 400
+    def test_short_texts_sharing_a_video_with_ngrams_elsewhere(self, detector):
+        # v1 has no n-gram at all while the corpus vocabulary is not empty
         df = pd.DataFrame(
             {
-                "comment_id": [f"c{i}" for i in range(n)],
-                "video_id": [f"v{i//20}" for i in range(n)],
-                "comment_text": ["amazing track"] * (n // 2) + [f"unique {i}" for i in range(n - n // 2)],
-                "author_name": [f"user{i//5}" for i in range(n)],
-                "like_count": [0] * n,
-                "published_at": [datetime.now(timezone.utc) - timedelta(seconds=i) for i in range(n)],
+                "comment_id": ["s1", "s2", "s3"],
+                "video_id": ["v1", "v1", "v2"],
+                "comment_text": ["a", "b", "a long text here"],
+                "author_name": ["u1", "u2", "u3"],
+                "like_count": [0, 0, 0],
+                "published_at": [_FIXED_NOW] * 3,
             }
         )
         out = detector.analyze_comments(df)
+        assert len(out) == 3
+
+    def test_scale_reasonably(self, detector, scale_comments_parquet):
+        df = pd.read_parquet(scale_comments_parquet)
+        n = len(df)
+        out = detector.analyze_comments(df)
         assert len(out) == n
         # Heavy duplicate half should lift average above a pure-unique baseline
         assert out[out["comment_text"] == "amazing track"]["bot_score"].mean() >= out["bot_score"].mean() - 5
 
+    def test_fused_raw_score_matches_vectorized(self, detector):
+        # Frames of _JIT_MIN_ROWS or more take the fused kernel (uncompiled without numba)
+        rng = np.random.default_rng(7)
+        n = _JIT_MIN_ROWS
+        features = pd.DataFrame(
+            {
+                "duplicate_count_local": rng.integers(0, 12, n),
+                "duplicate_count_global": rng.integers(0, 12, n),
+                "burst_score": rng.random(n),
+                "author_repetition_score": rng.random(n),
+                "engagement_score": rng.random(n),
+                "emoji_count": rng.integers(0, 8, n),
+                "is_whitelisted": rng.random(n) < 0.1,
+            }
+        )
+        with patch("src.youtubeviz.bot_detection._raw_score", _raw_score or _raw_score_loop):
+            fused = detector._calculate_bot_score(features.copy())
+        with patch("src.youtubeviz.bot_detection._raw_score", None):
+            expected = detector._calculate_bot_score(features.copy())
+        pd.testing.assert_frame_equal(fused, expected)
+
+
+def _brute_force_similarity_counts(texts, keys, threshold):
+    """Per-group TfidfVectorizer + full cosine matrix: the reference the grouped counts must equal."""
+    from sklearn.feature_extraction.text import TfidfVectorizer
+    from sklearn.metrics.pairwise import cosine_similarity
+
+    counts = np.ones(len(texts), dtype=np.int64)
+    for key in set(keys):
+        rows = [i for i, k in enumerate(keys) if k == key]
+        if len(rows) < 2:
+            continue
+        vectorizer = TfidfVectorizer(analyzer="char", ngram_range=(3, 5), max_features=_MAX_NGRAM_FEATURES)
+        similarity = cosine_similarity(vectorizer.fit_transform([texts[i] for i in rows]))
+        counts[rows] = (similarity >= threshold).sum(axis=1)
+    return counts
+
+
+@pytest.fixture(scope="module")
+def capped_similarity_corpus():
+    """One bucket well past _MAX_NGRAM_FEATURES distinct n-grams, with near-duplicate clusters, plus two small ones."""
+    from sklearn.feature_extraction.text import CountVectorizer
+
+    rng = np.random.default_rng(11)
+    letters = np.array(list("abcdefghijklmnopqrstuvwxyz"))
+    big = ["".join(rng.choice(letters, 60)) for _ in range(300)]
+    # Near duplicates differ only in their last character
+    big += [text[:-1] + suffix for text in big[:20] for suffix in "xyz"]
+    big += big[:5]  # exact duplicates
+    small = ["check my channel now", "check my channel now!", "love this song so much", "what a vibe"]
+    texts = big + small
+    keys = ["big"] * len(big) + ["s1", "s1", "s2", "s2"]
+    counts = CountVectorizer(analyzer="char", ngram_range=(3, 5)).fit_transform(texts).tocsr()
+    assert (counts[: len(big)].getnnz(axis=0) > 0).sum() > _MAX_NGRAM_FEATURES
+    return texts, keys, counts
+
+
+class TestSimilarityCounts:
+    def test_bucket_over_the_ngram_cap_matches_brute_force(self, capped_similarity_corpus):
+        texts, keys, counts = capped_similarity_corpus
+        expected = _brute_force_similarity_counts(texts, keys, 0.9)
+        assert expected.max() > 1  # the clusters are found at all
+        got = _similarity_counts(texts, counts, pd.Series(keys), 0.9)
+        np.testing.assert_array_equal(got, expected)
+
+    def test_lsh_bucket_over_the_ngram_cap_matches_brute_force(self, capped_similarity_corpus):
+        texts, keys, counts = capped_similarity_corpus
+        expected = _brute_force_similarity_counts(texts, keys, 0.9)
+        # The big bucket has far more than 50 distinct texts, so only its LSH candidates are scored
+        got = _similarity_counts(texts, counts, pd.Series(keys), 0.9, lsh_min_unique=50, shingle_size=3)
+        np.testing.assert_array_equal(got, expected)
+
 
 # ------------------------- Legacy compatibility --------------------------- #
 
@@ -289,7 +460,7 @@ class TestLegacyCompatibility:
                 "comment_text": ["Great song!", "Check my channel"],
                 "author_name": ["fan", "spammer"],
                 "like_count": [5, 0],
-                "published_at": [datetime.now(timezone.utc), datetime.now(timezone.utc)],
+                "published_at": [_FIXED_NOW] * 2,
             }
         )
 
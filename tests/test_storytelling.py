@@ -1,11 +1,20 @@
 import re
 
-from src.youtubeviz.storytelling import quick_takeaways, story_block
+import pandas as pd
+
+from src.youtubeviz.storytelling import (
+    _STATIC_CSS,
+    quick_takeaways,
+    quick_takeaways_many,
+    story_block,
+    story_blocks,
+)
 
 
 class DummyFig:
     def to_html(self, include_plotlyjs="cdn", full_html=False):  # pragma: no cover - trivial
-        return "<div id='dummy-fig'>FIG</div>"
+        script = "<script src='https://cdn.plot.ly/plotly.min.js'></script>" if include_plotlyjs == "cdn" else ""
+        return script + "<div id='dummy-fig'>FIG</div>"
 
 
 def test_quick_takeaways_various():
@@ -21,6 +30,29 @@ def test_quick_takeaways_various():
     assert "Hit Song" in text
 
 
+def test_quick_takeaways_many_matches_single_artist_version():
+    df = pd.DataFrame(
+        {
+            "artist": ["A", "B", "C"],
+            "last_7d_change_pct": [12.34, None, -3.0],
+            "engagement_rate": [4.2, None, 1.0],
+            "standout_video": ["Hit Song", None, ""],
+        },
+        index=[10, 11, 12],
+    )
+    many = quick_takeaways_many(df)
+
+    assert list(many.index) == [10, 11, 12]
+    for idx, row in df.iterrows():
+        expected = quick_takeaways(
+            row["artist"],
+            last_7d_change_pct=None if pd.isna(row["last_7d_change_pct"]) else row["last_7d_change_pct"],
+            engagement_rate=None if pd.isna(row["engagement_rate"]) else row["engagement_rate"],
+            standout_video=None if pd.isna(row["standout_video"]) else row["standout_video"],
+        )
+        assert many[idx] == expected
+
+
 def test_story_block_returns_html_for_testing():
     fig = DummyFig()
     html = story_block(
@@ -36,3 +68,170 @@ def test_story_block_returns_html_for_testing():
     assert len(re.findall(r"<li>.*?</li>", html)) >= 2
     # Figure HTML embedded
     assert "dummy-fig" in html
+
+
+class PlainHtmlFig:
+    def to_html(self):  # pragma: no cover - trivial
+        return "<div id='plain-fig'>FIG</div>"
+
+
+def test_story_block_handles_figures_without_plotly_kwargs():
+    html = story_block(PlainHtmlFig(), title="t", bullets=["a"], return_html=True)
+    assert "plain-fig" in html
+
+    html = story_block(object(), title="t", bullets=["a"], return_html=True)
+    assert "figure-fallback" in html
+
+
+def test_story_block_renders_kwargs_to_html_without_plotlyjs():
+    styler = pd.DataFrame({"plays": [1, 2]}).style
+    html = story_block(styler, title="t", bullets=["a"], return_html=True)
+
+    assert "<table" in html
+    assert "cdn.plot.ly" not in html
+
+
+def test_story_block_embeds_prerendered_html():
+    html = story_block("<div id='pre'>FIG</div>", title="t", bullets=["a"], return_html=True)
+    assert "<div id='pre'>FIG</div>" in html
+    assert "figure-fallback" not in html
+
+    html = story_block(b"<div id='pre-bytes'>FIG</div>", title="t", bullets=["a"], return_html=True)
+    assert "<div id='pre-bytes'>FIG</div>" in html
+
+
+class CountingFig:
+    def __init__(self):
+        self.calls = 0
+
+    def to_html(self, include_plotlyjs="cdn", full_html=False):
+        self.calls += 1
+        return "<div id='counting-fig'>FIG</div>"
+
+
+def test_story_block_cache_fig_html_renders_figure_once():
+    fig = CountingFig()
+    first = story_block(fig, title="a", bullets=["x"], return_html=True, cache_fig_html=True)
+    second = story_block(fig, title="b", bullets=["y"], return_html=True, cache_fig_html=True)
+
+    assert fig.calls == 1
+    assert "counting-fig" in first and "counting-fig" in second
+
+    story_block(fig, title="c", bullets=["z"], return_html=True)
+    assert fig.calls == 2
+
+
+def test_every_displayed_plotly_story_block_loads_plotlyjs(monkeypatch):
+    # Re-running the first cell must not leave the other saved outputs without plotly.js
+    shown = []
+    monkeypatch.setattr("IPython.display.display", lambda obj: shown.append(obj.data))
+
+    story_block(DummyFig(), title="a", bullets=["x"])
+    story_block(DummyFig(), title="b", bullets=["y"])
+    story_block(DummyFig(), title="a", bullets=["x"])
+
+    assert all("cdn.plot.ly" in html for html in shown)
+    assert "cdn.plot.ly" in story_block(DummyFig(), title="c", bullets=["z"], return_html=True)
+
+
+GOLDEN_STORY_BLOCK_HTML = (
+    '\n    <div class="yv-story yv-light">'
+    '\n      <div class="yv-fig" style="flex:0 0 58%; max-width:58%;"><div id=\'golden\'>FIG</div></div>'
+    '\n      <div class="yv-text">'
+    "\n        <h3>Title</h3>"
+    "\n        <ul><li>A</li>\n<li>B</li></ul>"
+    '\n        <div class="yv-caption">Cap</div>'
+    "\n      </div>\n    </div>\n    "
+)
+
+
+def test_story_block_matches_golden_html():
+    # Guards byte-identical output between the pure-Python and mypyc-compiled module
+    html = story_block("<div id='golden'>FIG</div>", title="Title", bullets=["A", "B"], caption="Cap", return_html=True)
+    assert html == _STATIC_CSS + GOLDEN_STORY_BLOCK_HTML
+
+
+def test_story_block_accepts_bullet_generator():
+    html = story_block("<div>FIG</div>", title="t", bullets=(b for b in ["one", "", "two"]), return_html=True)
+    assert "<li>one</li>\n<li>two</li>" in html
+
+
+def test_story_block_escapes_text_but_not_figure_html():
+    html = story_block(
+        "<div id='fig'>FIG</div>",
+        title="<script>alert(1)</script>",
+        bullets=["Tom & Jerry"],
+        caption="<b>bold</b>",
+        return_html=True,
+    )
+    assert "<div id='fig'>FIG</div>" in html
+    assert "<script>" not in html
+    assert "&lt;script&gt;" in html
+    assert "<li>Tom &amp; Jerry</li>" in html
+    assert "&lt;b&gt;bold&lt;/b&gt;" in html
+
+
+def test_story_block_keeps_markup_wrapped_text():
+    from markupsafe import Markup
+
+    html = story_block(
+        "<div>FIG</div>",
+        title=Markup("<i>Title</i>"),
+        bullets=[Markup("<b>bold</b> point"), "<b>plain</b>"],
+        caption=Markup("<a href='#src'>source</a>"),
+        return_html=True,
+    )
+    assert "<i>Title</i>" in html
+    assert "<li><b>bold</b> point</li>" in html
+    assert "<li>&lt;b&gt;plain&lt;/b&gt;</li>" in html
+    assert "<a href='#src'>source</a>" in html
+
+
+def test_every_displayed_story_block_carries_the_css(monkeypatch):
+    # Re-running the first cell must not leave the other saved outputs unstyled
+    shown = []
+    monkeypatch.setattr("IPython.display.display", lambda obj: shown.append(obj.data))
+
+    story_block("<div>FIG</div>", title="a", bullets=["x"])
+    story_block("<div>FIG</div>", title="b", bullets=["y"], theme="dark")
+    story_block("<div>FIG</div>", title="a", bullets=["x"])
+
+    assert [html.count("<style>") for html in shown] == [1, 1, 1]
+    assert story_block("<div>FIG</div>", title="c", bullets=["z"], return_html=True).count("<style>") == 1
+
+
+def test_story_blocks_renders_batch_with_css_once():
+    html = story_blocks(
+        [
+            {"fig": "<div>A</div>", "title": "First", "bullets": ["x"]},
+            {"fig": "<div>B</div>", "title": "Second", "bullets": ["y"], "caption": "c", "theme": "dark"},
+        ],
+        return_html=True,
+    )
+
+    assert html.count("<style>") == 1
+    assert html.index("<h3>First</h3>") < html.index("<h3>Second</h3>")
+    assert 'class="yv-story yv-dark"' in html
+
+
+def test_story_block_coerces_non_string_bullets():
+    html = story_block("<div>FIG</div>", title="t", bullets=[42, "  ", 3.5], return_html=True)
+
+    assert "<li>42</li>" in html
+    assert "<li>3.5</li>" in html
+    assert html.count("<li>") == 2
+
+
+def test_story_block_renders_mixed_type_bullets_after_a_string():
+    html = story_block("<div>FIG</div>", title="t", bullets=["a", 42, None], return_html=True)
+
+    assert "<li>a</li>\n<li>42</li>\n<li>None</li>" in html
+
+
+def test_story_block_returns_html_object_when_not_displaying_now():
+    from IPython.display import HTML
+
+    obj = story_block("<div>FIG</div>", title="t", bullets=["x"], display_now=False)
+
+    assert isinstance(obj, HTML)
+    assert "<h3>t</h3>" in obj.data
@@ -5,6 +5,7 @@ This module tests the comprehensive error handling system that provides
 educational error messages and graceful degradation for missing data scenarios.
 """
 
+import warnings
 from unittest.mock import patch
 
 import pandas as pd
@@ -13,6 +14,7 @@ import pytest
 from src.youtubeviz.storytelling import (
     DataQualityWarning,
     StorytellingDataError,
+    ValidationResult,
     create_confidence_indicator,
     create_error_recovery_suggestions,
     generate_data_quality_report,
@@ -71,6 +73,42 @@ class TestDataValidation:
         assert result["confidence_score"] == 1.0
         assert len(result["errors"]) == 0
 
+    def test_validation_result_attribute_and_dict_access(self):
+        """Test that the result object supports attributes, item access and to_dict."""
+        df = pd.DataFrame({"artist_name": ["Artist A", "Artist B"], "view_count": [1000, 2000]})
+
+        result = validate_data_for_storytelling(df, required_columns=["view_count"])
+
+        assert isinstance(result, ValidationResult)
+        assert result.is_valid is result["is_valid"] is True
+        result["confidence_score"] = 0.5
+        assert result.confidence_score == 0.5
+        assert result.to_dict() == {
+            "is_valid": True,
+            "warnings": [],
+            "errors": [],
+            "recommendations": [],
+            "confidence_score": 0.5,
+            "data_quality_issues": [],
+        }
+        with pytest.raises(KeyError):
+            result["unknown"]
+
+    def test_validation_result_supports_read_only_mapping_protocol(self):
+        """Test that dict idioms used on the former return value keep working."""
+        df = pd.DataFrame({"artist_name": ["Artist A", "Artist B"], "view_count": [1000, 2000]})
+
+        result = validate_data_for_storytelling(df, required_columns=["view_count"])
+
+        assert "is_valid" in result and "unknown" not in result
+        assert dict(result) == result.to_dict()
+        assert list(result) == list(result.keys()) == list(result.to_dict())
+        assert len(result) == len(result.to_dict())
+        assert dict(result.items()) == result.to_dict()
+        assert list(result.values()) == list(result.to_dict().values())
+        assert result.get("is_valid") is True
+        assert result.get("unknown", "missing") == "missing"
+
     def test_validate_insufficient_rows(self):
         """Test validation with insufficient data rows."""
         df = pd.DataFrame({"artist_name": ["Artist A"], "view_count": [1000], "like_count": [100]})
@@ -143,6 +181,15 @@ class TestDataValidation:
         assert result["confidence_score"] < 1.0
         assert any("Limited Comment Data" in warning for warning in result["warnings"])
 
+    def test_validate_trend_analysis_single_unparseable_date(self):
+        """Test that a lone row with an unreadable date still gets the date warning."""
+        df = pd.DataFrame({"artist_name": ["Artist A"], "published_at": ["not a date"]})
+
+        result = validate_data_for_storytelling(df, required_columns=["artist_name"], analysis_type="trend_analysis")
+
+        assert any("Date Format Issues" in warning for warning in result["warnings"])
+        assert not any("Short Time Range" in warning for warning in result["warnings"])
+
 
 class TestConfidenceIndicator:
     """Test confidence indicator generation."""
@@ -193,6 +240,16 @@ class TestConfidenceIndicator:
         assert "Very Low" in indicator
         assert "exploration only" in indicator
 
+    def test_confidence_indicator_lists_issues_in_issue_map_order(self):
+        """Test that each issue's descriptions follow the issue map order, once each."""
+        indicator = create_confidence_indicator(
+            confidence_score=0.3,
+            data_quality_issues=["date_issues_and_high_nulls_and_date_issues", "single_artist"],
+            analysis_type="analysis",
+        )
+
+        assert "Issues: High missing data, Date formatting problems, Single artist only</small>" in indicator
+
 
 class TestMissingDataHandling:
     """Test missing data handling functions."""
@@ -234,6 +291,26 @@ class TestMissingDataHandling:
         assert "average" in explanation
         assert "statistical properties" in explanation
 
+    def test_handle_missing_data_fill_mean_datetime_column(self):
+        """Test fill mean keeps a datetime column as datetimes filled with the mean timestamp."""
+        df = pd.DataFrame({"published_at": pd.to_datetime(["2024-01-01", None, "2024-01-03"])})
+
+        cleaned_df, _ = handle_missing_data_gracefully(df, "published_at", "fill_mean")
+
+        assert cleaned_df["published_at"].dtype == df["published_at"].dtype
+        assert cleaned_df.loc[1, "published_at"] == pd.Timestamp("2024-01-02")
+
+    def test_handle_missing_data_fill_mean_all_missing_column(self):
+        """Test fill mean on an all-NaN column leaves it NaN without a RuntimeWarning."""
+        df = pd.DataFrame({"view_count": [float("nan")] * 3})
+
+        with warnings.catch_warnings():
+            warnings.simplefilter("error", RuntimeWarning)
+            cleaned_df, explanation = handle_missing_data_gracefully(df, "view_count", "fill_mean")
+
+        assert cleaned_df["view_count"].isnull().all()
+        assert "average (nan)" in explanation
+
     def test_handle_missing_data_no_missing_values(self):
         """Test handling when no missing values exist."""
         df = pd.DataFrame({"artist_name": ["Artist A", "Artist B"], "view_count": [1000, 2000]})
@@ -313,6 +390,25 @@ class TestDataQualityReport:
         assert "Recommendations" in report
         assert "data cleaning" in report or "imputation" in report
 
+    def test_generate_quality_report_polars_engine_matches_pandas(self):
+        """Test that the polars scan reports the same numbers as pandas."""
+        pytest.importorskip("polars")
+        df = pd.DataFrame(
+            {
+                "artist_name": ["Artist A", None, "Artist C", "Artist D"],
+                "view_count": [1000.0, None, 1500.0, 250.0],
+                "like_count": [100, 200, 150, 50],
+                "empty": [None, None, None, None],
+            }
+        )
+
+        def without_memory(report):
+            return [line for line in report.splitlines() if not line.startswith("• Memory usage")]
+
+        assert without_memory(generate_data_quality_report(df, engine="polars")) == without_memory(
+            generate_data_quality_report(df, engine="pandas")
+        )
+
 
 class TestErrorRecoverySuggestions:
     """Test error recovery suggestion generation."""
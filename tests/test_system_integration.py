@@ -16,7 +16,8 @@ import pytest
 sys.path.append(os.path.dirname(os.path.dirname(__file__)))
 
 from tools.sentiment.deploy_bot_detection import EnhancedBotDetector
-from youtubeviz.weak_supervision_sentiment import WeakSupervisionSentimentAnalyzer
+from youtubeviz import weak_supervision_sentiment
+from youtubeviz.weak_supervision_sentiment import WeakSupervisionSentimentAnalyzer, create_evaluation_dataset
 
 
 class TestSentimentAnalysisIntegration:
@@ -53,6 +54,113 @@ class TestSentimentAnalysisIntegration:
         positive_count = sum(1 for wl in weak_labels if wl.final_label and wl.final_label.value > 0)
         assert positive_count >= len(music_slang) * 0.5, "Most music slang should be positive"
 
+    def test_batch_labeling_matches_per_text_labeling(self):
+        """Test that the vectorized batch path agrees with apply_labeling_functions."""
+        analyzer = WeakSupervisionSentimentAnalyzer()
+        texts = ["this is fire 🔥", "my nigga snapped", "who produced this?", "this is trash", "ok", "mid but FIRE!!!"]
+
+        batch = analyzer.apply_labeling_functions_batch(pd.Series(texts))
+        per_text = analyzer.apply_labeling_functions(texts)
+
+        assert list(batch["final_label"]) == [wl.final_label for wl in per_text]
+        assert np.allclose(batch["confidence"], [wl.confidence for wl in per_text])
+
+    def test_parallel_labeling_matches_serial_labeling(self, monkeypatch):
+        """Test that sharding apply_labeling_functions over worker processes keeps order and labels."""
+        monkeypatch.setattr(weak_supervision_sentiment, "_PARALLEL_MIN_TEXTS", 0)
+        monkeypatch.setattr(weak_supervision_sentiment, "_PARALLEL_SHARD_SIZE", 4)
+        analyzer = WeakSupervisionSentimentAnalyzer()
+        texts = [text for text, _ in create_evaluation_dataset()]
+
+        serial = analyzer.apply_labeling_functions(texts)
+        parallel = analyzer.apply_labeling_functions(texts, n_jobs=2)
+
+        assert [wl.text for wl in parallel] == texts
+        assert [(wl.final_label, wl.confidence, wl.labels) for wl in parallel] == [
+            (wl.final_label, wl.confidence, wl.labels) for wl in serial
+        ]
+
+    def test_predict_batch_matches_predict(self):
+        """Test that predict is the single-row case of predict_batch."""
+        analyzer = WeakSupervisionSentimentAnalyzer()
+        texts = [text for text, _ in create_evaluation_dataset()]
+        analyzer.train_classifier(texts * 10)
+
+        batch = analyzer.predict_batch(texts + texts[:3])
+        assert len(batch) == len(texts) + 3
+        assert batch.iloc[-3:].reset_index(drop=True).equals(batch.iloc[:3])
+        assert np.allclose(analyzer.predict_fast(texts).to_numpy(), batch.iloc[: len(texts)].to_numpy(), atol=1e-6)
+
+        for empty in (analyzer.predict_batch([]), analyzer.predict_fast([])):
+            assert empty.empty
+            assert list(empty.columns) == list(batch.columns)
+
+        for text, (_, row) in zip(texts, batch.iterrows()):
+            single = analyzer.predict(text)
+            assert single["sentiment_score"] == row["sentiment_score"]
+            assert single["confidence"] == pytest.approx(row["confidence"])
+            assert single["probabilities"]["positive"] == pytest.approx(row["positive"])
+            assert analyzer.predict(text) == single  # served from the prediction cache
+
+    def test_train_classifier_skips_low_confidence_silver_labels(self, monkeypatch):
+        """Test that rows the label model is unsure about are left out of training."""
+        label_model = weak_supervision_sentiment._fast_dawid_skene
+
+        def unsure_about_first_rows(fired, initial):
+            posteriors = label_model(fired, initial)
+            posteriors[:30] = 1.0 / 3.0
+            return posteriors
+
+        monkeypatch.setattr(weak_supervision_sentiment, "_fast_dawid_skene", unsure_about_first_rows)
+        analyzer = WeakSupervisionSentimentAnalyzer()
+        texts = [text for text, _ in create_evaluation_dataset()]
+        labeled = sum(1 for wl in analyzer.apply_labeling_functions(texts * 10) if wl.labels)
+
+        result = analyzer.train_classifier(texts * 10)
+        assert result["training_size"] == labeled - 30
+
+    def test_saved_bundle_round_trip(self, tmp_path):
+        """Test that a model reloaded from the .npz bundle predicts like the original."""
+        analyzer = WeakSupervisionSentimentAnalyzer()
+        texts = [text for text, _ in create_evaluation_dataset()]
+        analyzer.train_classifier(texts * 10)
+        path = tmp_path / "model.npz"
+        analyzer.save_model(str(path))
+
+        loaded = WeakSupervisionSentimentAnalyzer()
+        loaded.load_model(str(path))
+
+        expected = analyzer.predict_batch(texts)
+        actual = loaded.predict_batch(texts)
+        assert list(actual["sentiment_score"]) == list(expected["sentiment_score"])
+        assert np.allclose(actual.to_numpy(), expected.to_numpy(), atol=1e-6)
+        assert [lf.pattern for lf in loaded.labeling_functions] == [lf.pattern for lf in analyzer.labeling_functions]
+
+    def test_hyperscan_matching_agrees_with_re(self):
+        """Test that the Hyperscan prefilter reports the same LFs as plain re."""
+        pytest.importorskip("hyperscan")
+        analyzer = WeakSupervisionSentimentAnalyzer()
+        assert analyzer._lf_database is not None
+
+        texts = ["my nigga snapped", "WHO PRODUCED THIS", "  lyrics ? ", "trash and mid", "visuals when??!!", "ok"]
+        fast = [analyzer._match_labeling_functions(text) for text in texts]
+
+        analyzer._lf_database = None
+        assert fast == [analyzer._match_labeling_functions(text) for text in texts]
+
+    def test_aho_corasick_matching_agrees_with_re(self):
+        """Test that word-list LFs answered by Aho-Corasick match exactly like their regexes."""
+        pytest.importorskip("ahocorasick")
+        analyzer = WeakSupervisionSentimentAnalyzer()
+        assert analyzer._lf_automaton is not None
+
+        texts = ["FIRE!!", "fired up", "no_cap", "can't stop", "hard  af", "this is mid", "ate that", "ok"]
+        fast = [analyzer._match_labeling_functions(text) for text in texts]
+
+        analyzer._lf_automaton = None
+        analyzer._lf_database = None
+        assert fast == [analyzer._match_labeling_functions(text) for text in texts]
+
 
 class TestBotDetectionIntegration:
     """Test bot detection integration."""
@@ -99,6 +207,35 @@ class TestBotDetectionIntegration:
             elif expected == "low_bot_score":
                 assert bot_score < 0.5, f"'{text}' should have low bot score"
 
+    def test_precompiled_patterns_match_per_pattern_search(self):
+        """The fused pattern groups must agree with one re.search per pattern."""
+        import re
+
+        detector = EnhancedBotDetector()
+        texts = [
+            "this is fire",
+            "DROP IT ALREADY please",
+            "nice!!!",
+            "check out my channel",
+            "aaaaaaaaaaaa",
+            "abababababab",
+            "12345",
+            "?!",
+            "first",
+            "at 1:23 the bridge gives me chills, i love how it sounds like 2009",
+            "I can't stop crying, my favorite song",
+            "",
+        ]
+
+        def count(patterns, text):
+            return sum(1 for pattern in patterns if re.search(pattern, text, re.IGNORECASE))
+
+        whitelist = [pattern for patterns in detector.fan_whitelist.values() for pattern in patterns]
+        for text in texts:
+            assert detector.is_whitelisted_fan(text) == (count(whitelist, text.lower()) > 0)
+            for category, patterns in detector.bot_patterns.items():
+                assert detector._bot_pattern_groups[category].count(text) == count(patterns, text)
+
 
 class TestSystemPerformance:
     """Test system performance."""
@@ -24,6 +24,7 @@ from sqlalchemy import Column, DateTime, Integer, MetaData, String, Table
 from sqlalchemy import inspect as sa_inspect
 from sqlalchemy import text
 from sqlalchemy.engine import Engine
+from sqlalchemy.exc import DBAPIError
 
 # Optional niceties (only used when --interactive)
 try:  # pragma: no cover
@@ -31,6 +32,12 @@ try:  # pragma: no cover
 except Exception:  # pragma: no cover
     inquirer = None  # type: ignore
 
+# Faster JSON export when available; stdlib json is the fallback
+try:  # pragma: no cover
+    import orjson  # type: ignore
+except Exception:  # pragma: no cover
+    orjson = None  # type: ignore
+
 
 app = typer.Typer(add_completion=False, help="Manage artist aliases without thinking.")
 
@@ -117,9 +124,26 @@ def fetch_candidates(engine: Engine, limit: Optional[int] = None) -> List[str]:
 
 # --- Back-compat shims for older tests ----------------------------------
 def fetch_artists_and_channels(engine: Engine, limit: Optional[int] = None) -> List[tuple[str, int]]:
-    """Compat: return List[(name, count)] for tests that expect counts."""
-    rows: Dict[str, int] = {}
+    """Compat: return List[(name, count)] for tests that expect counts.
+
+    Counts are summed across both tables by one UNION ALL + GROUP BY query with
+    the limit applied in SQL; if either table is missing, the tables that exist
+    are counted one by one and merged here instead.
+    """
+    limit_sql = " LIMIT :k" if limit else ""
     with engine.connect() as conn:
+        try:
+            sql = (
+                "SELECT n, COUNT(*) AS c FROM ("
+                "SELECT artist_name AS n FROM artists UNION ALL SELECT channel_title AS n FROM youtube_videos"
+                ") names WHERE n IS NOT NULL AND n <> '' GROUP BY n ORDER BY c DESC, n" + limit_sql
+            )
+            return [(str(n), int(c)) for n, c in conn.execute(text(sql), {"k": limit})]
+        except DBAPIError:
+            # A missing table; any other failure should surface rather than fall through
+            conn.rollback()
+
+        rows: Dict[str, int] = {}
         for sql in (
             "SELECT artist_name AS n, COUNT(*) AS c FROM artists GROUP BY artist_name",
             "SELECT channel_title AS n, COUNT(*) AS c FROM youtube_videos WHERE channel_title IS NOT NULL GROUP BY channel_title",
@@ -128,130 +152,81 @@ def fetch_artists_and_channels(engine: Engine, limit: Optional[int] = None) -> L
                 for n, c in conn.execute(text(sql)):
                     if n:
                         rows[str(n)] = rows.get(str(n), 0) + int(c)
-            except Exception:
+            except DBAPIError:
+                conn.rollback()
                 continue
-    items = sorted(rows.items(), key=lambda kv: kv[1], reverse=True)
+    # Same order as the SQL path: most frequent first, ties by name
+    items = sorted(rows.items(), key=lambda kv: (-kv[1], kv[0]))
     return items[: (limit or len(items))]
 
 
+def _dedupe_aliases(canonical: str, aliases: List[str]) -> Dict[str, str]:
+    """Stripped aliases keyed by their lower-case form (first spelling wins), minus the canonical name."""
+    unique: Dict[str, str] = {}
+    for a in aliases:
+        a = a.strip()
+        if a and a.lower() != canonical.lower():
+            unique.setdefault(a.lower(), a)
+    return unique
+
+
+# SQLite caps a compound SELECT at 500 terms (SQLITE_MAX_COMPOUND_SELECT)
+_UPSERT_BATCH_SIZE = 500
+
+
 def upsert_aliases(engine: Engine, canonical: str, aliases: List[str]) -> int:
-    """Ensure canonical row exists (alias=''), then upsert aliases. SQLite uses ON CONFLICT; MySQL uses ON DUPLICATE KEY."""
-    n = 0
+    """Ensure canonical row exists (alias=''), then upsert aliases. SQLite uses ON CONFLICT; MySQL uses ON DUPLICATE KEY.
+
+    Aliases are de-duped case-insensitively in Python, then inserted by a single
+    INSERT ... SELECT per batch whose NOT EXISTS probe skips any alias already stored
+    for this canonical name in another case. Returns the number of aliases actually added.
+    """
     canonical = canonical.strip()
-    aliases = [a.strip() for a in aliases if a.strip() and a.strip().lower() != canonical.lower()]
+    pending = list(_dedupe_aliases(canonical, aliases).values())
     is_sqlite = engine.dialect.name == "sqlite"
     with engine.begin() as conn:
         insp = sa_inspect(engine)
         cols = {c["name"] for c in insp.get_columns("artist_aliases")}
         if "canonical_name" in cols:  # natural-key schema (preferred)
-            if is_sqlite:
-                conn.execute(
-                    text(
-                        """
-                    INSERT INTO artist_aliases (canonical_name, alias)
-                    VALUES (:c, '')
-                    ON CONFLICT(canonical_name, alias) DO NOTHING
-                    """
-                    ),
-                    {"c": canonical},
-                )
-                for a in aliases:
-                    # Count only if actually new
-                    exists = conn.execute(
-                        text("SELECT 1 FROM artist_aliases WHERE canonical_name=:c AND lower(alias)=lower(:a) LIMIT 1"),
-                        {"c": canonical, "a": a},
-                    ).first()
-                    if exists:
-                        continue
-                    conn.execute(
-                        text(
-                            """
-                        INSERT INTO artist_aliases (canonical_name, alias)
-                        VALUES (:c, :a)
-                        ON CONFLICT(canonical_name, alias) DO NOTHING
-                        """
-                        ),
-                        {"c": canonical, "a": a},
-                    )
-                    n += 1
-            else:
-                conn.execute(
-                    text(
-                        """
-                    INSERT INTO artist_aliases (canonical_name, alias)
-                    VALUES (:c, '')
-                    ON DUPLICATE KEY UPDATE canonical_name=VALUES(canonical_name)
-                    """
-                    ),
-                    {"c": canonical},
-                )
-                for a in aliases:
-                    exists = conn.execute(
-                        text("SELECT 1 FROM artist_aliases WHERE canonical_name=:c AND lower(alias)=lower(:a) LIMIT 1"),
-                        {"c": canonical, "a": a},
-                    ).first()
-                    if exists:
-                        continue
-                    conn.execute(
-                        text(
-                            """
-                        INSERT INTO artist_aliases (canonical_name, alias)
-                        VALUES (:c, :a)
-                        ON DUPLICATE KEY UPDATE canonical_name=VALUES(canonical_name)
-                        """
-                        ),
-                        {"c": canonical, "a": a},
-                    )
-                    n += 1
+            key_col, key = "canonical_name", canonical
         else:  # legacy schema fallback (artist_id)
             # Ensure artists row exists
             r = conn.execute(
                 text("SELECT artist_id FROM artists WHERE artist_name = :n LIMIT 1"), {"n": canonical}
             ).first()
             if r:
-                artist_id = int(r[0])
+                key = int(r[0])
             else:
                 res = conn.execute(text("INSERT INTO artists (artist_name) VALUES (:n)"), {"n": canonical})
-                artist_id = int(getattr(res, "lastrowid", 0) or 0)
-            if is_sqlite:
-                for a in aliases:
-                    exists = conn.execute(
-                        text("SELECT 1 FROM artist_aliases WHERE artist_id=:id AND lower(alias)=lower(:a) LIMIT 1"),
-                        {"id": artist_id, "a": a},
-                    ).first()
-                    if exists:
-                        continue
-                    conn.execute(
-                        text(
-                            """
-                        INSERT INTO artist_aliases (artist_id, alias)
-                        VALUES (:id, :a)
-                        ON CONFLICT(artist_id, alias) DO NOTHING
-                        """
-                        ),
-                        {"id": artist_id, "a": a},
-                    )
-                    n += 1
-            else:
-                for a in aliases:
-                    exists = conn.execute(
-                        text("SELECT 1 FROM artist_aliases WHERE artist_id=:id AND lower(alias)=lower(:a) LIMIT 1"),
-                        {"id": artist_id, "a": a},
-                    ).first()
-                    if exists:
-                        continue
-                    conn.execute(
-                        text(
-                            """
-                        INSERT INTO artist_aliases (artist_id, alias)
-                        VALUES (:id, :a)
-                        ON DUPLICATE KEY UPDATE alias=VALUES(alias)
-                        """
-                        ),
-                        {"id": artist_id, "a": a},
-                    )
-                    n += 1
-    return n
+                key = int(getattr(res, "lastrowid", 0) or 0)
+            key_col = "artist_id"
+
+        if is_sqlite:
+            on_conflict = f"ON CONFLICT({key_col}, alias) DO NOTHING"
+        else:
+            on_conflict = f"ON DUPLICATE KEY UPDATE {key_col}=VALUES({key_col})"
+
+        if key_col == "canonical_name":
+            conn.execute(
+                text(f"INSERT INTO artist_aliases ({key_col}, alias) VALUES (:k, '') {on_conflict}"), {"k": key}
+            )
+
+        if not pending:
+            return 0
+        added = 0
+        for start in range(0, len(pending), _UPSERT_BATCH_SIZE):
+            batch = pending[start : start + _UPSERT_BATCH_SIZE]
+            # UNION ALL of bound SELECTs is the VALUES list both SQLite and MySQL accept
+            source = " UNION ALL ".join(f"SELECT :a{i} AS a" for i in range(len(batch)))
+            insert = text(
+                f"INSERT INTO artist_aliases ({key_col}, alias) SELECT :k, v.a FROM ({source}) v "
+                "WHERE NOT EXISTS ("
+                f"SELECT 1 FROM artist_aliases aa WHERE aa.{key_col} = :k AND LOWER(aa.alias) = LOWER(v.a)"
+                f") {on_conflict}"
+            )
+            params = {"k": key, **{f"a{i}": a for i, a in enumerate(batch)}}
+            added += conn.execute(insert, params).rowcount
+        return added
 
 
 def export_mapping(engine: Engine, out_path: Path) -> int:
@@ -279,7 +254,12 @@ def export_mapping(engine: Engine, out_path: Path) -> int:
 
     # Atomic + durable write
     tmp = out_path.with_suffix(out_path.suffix + ".tmp")
-    tmp.write_text(json.dumps(mapping, ensure_ascii=False, indent=2), encoding="utf-8")
+    if orjson is not None:
+        tmp.write_bytes(orjson.dumps(mapping, option=orjson.OPT_INDENT_2))
+    else:
+        # Stream to the file instead of building the whole JSON string first
+        with tmp.open("w", encoding="utf-8") as fp:
+            json.dump(mapping, fp, ensure_ascii=False, indent=2)
     os.replace(tmp, out_path)
     try:  # best-effort directory fsync
         dir_fd = os.open(str(out_path.parent), os.O_RDONLY)
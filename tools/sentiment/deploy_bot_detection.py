@@ -28,6 +28,69 @@ from web.etl_helpers import get_engine
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# A numbered backreference such as \1 would point at the wrong group once its
+# pattern sits inside a larger alternation
+_BACKREFERENCE = re.compile(r"\\[1-9]")
+
+
+class _PatternGroup:
+    """Case-insensitive patterns compiled once, behind one fused alternation.
+
+    A text the fused regex misses cannot match any member, so ``count`` skips
+    the per-pattern searches for it. Groups using backreferences get no fused
+    regex and always search their members.
+    """
+
+    def __init__(self, patterns):
+        self.patterns = [re.compile(pattern, re.IGNORECASE) for pattern in patterns]
+        self.fused = None
+        if patterns and not any(_BACKREFERENCE.search(pattern) for pattern in patterns):
+            self.fused = re.compile("|".join(f"(?:{pattern})" for pattern in patterns), re.IGNORECASE)
+
+    def any(self, text: str) -> bool:
+        """Return True when at least one pattern matches ``text``."""
+        if self.fused is not None:
+            return self.fused.search(text) is not None
+        return any(pattern.search(text) for pattern in self.patterns)
+
+    def count(self, text: str) -> int:
+        """Return how many of the patterns match ``text``."""
+        if self.fused is not None and self.fused.search(text) is None:
+            return 0
+        return sum(1 for pattern in self.patterns if pattern.search(text))
+
+
+# Score added per matching bot pattern, by category
+_BOT_PATTERN_PENALTIES = {
+    "spam_indicators": 0.8,  # High penalty for spam
+    "generic_praise": 0.3,  # Medium penalty for generic
+    "repetitive_patterns": 0.5,  # High penalty for repetitive
+    "low_effort": 0.4,  # Medium-high penalty for low effort
+}
+
+# Authenticity patterns, each scored per matching pattern
+_PERSONAL_PATTERNS = _PatternGroup(
+    [
+        r"\b(i|me|my|mine|myself)\b",
+        r"\b(this reminds me|makes me feel|when i)\b",
+        r"\b(my favorite|i love how|i can\'t)\b",
+    ]
+)
+_SPECIFIC_PATTERNS = _PatternGroup(
+    [
+        r"\b(at \d+:\d+|the part where|that beat)\b",
+        r"\b(the lyrics|the chorus|the bridge)\b",
+        r"\b(reminds me of|sounds like|similar to)\b",
+    ]
+)
+_EMOTIONAL_PATTERNS = _PatternGroup(
+    [
+        r"\b(crying|tears|emotional|chills|goosebumps)\b",
+        r"\b(obsessed|addicted|can\'t stop)\b",
+        r"\b(amazing|incredible|beautiful|perfect)\b",
+    ]
+)
+
 
 class EnhancedBotDetector:
     """
@@ -37,6 +100,13 @@ class EnhancedBotDetector:
     def __init__(self):
         self.fan_whitelist = self._create_fan_whitelist()
         self.bot_patterns = self._create_bot_patterns()
+        # Any whitelist hit is enough, so every category shares one alternation
+        self._whitelist_group = _PatternGroup(
+            [pattern for patterns in self.fan_whitelist.values() for pattern in patterns]
+        )
+        self._bot_pattern_groups = {
+            category: _PatternGroup(patterns) for category, patterns in self.bot_patterns.items()
+        }
 
     def _create_fan_whitelist(self):
         """Create whitelist for legitimate fan expressions."""
@@ -91,13 +161,7 @@ class EnhancedBotDetector:
 
     def is_whitelisted_fan(self, comment_text: str) -> bool:
         """Check if comment matches fan whitelist patterns."""
-        text_lower = comment_text.lower()
-
-        for category, patterns in self.fan_whitelist.items():
-            for pattern in patterns:
-                if re.search(pattern, text_lower, re.IGNORECASE):
-                    return True
-        return False
+        return self._whitelist_group.any(comment_text.lower())
 
     def calculate_bot_score(self, comment_data: dict) -> float:
         """Calculate bot probability score (0.0 = human, 1.0 = bot)."""
@@ -109,17 +173,10 @@ class EnhancedBotDetector:
             return 0.1
 
         # Check bot patterns
-        for category, patterns in self.bot_patterns.items():
-            for pattern in patterns:
-                if re.search(pattern, text, re.IGNORECASE):
-                    if category == "spam_indicators":
-                        score += 0.8  # High penalty for spam
-                    elif category == "generic_praise":
-                        score += 0.3  # Medium penalty for generic
-                    elif category == "repetitive_patterns":
-                        score += 0.5  # High penalty for repetitive
-                    elif category == "low_effort":
-                        score += 0.4  # Medium-high penalty for low effort
+        for category, group in self._bot_pattern_groups.items():
+            penalty = _BOT_PATTERN_PENALTIES.get(category, 0.0)
+            for _ in range(group.count(text)):
+                score += penalty
 
         # Length-based scoring
         text_length = len(text.strip())
@@ -178,41 +235,20 @@ class EnhancedBotDetector:
         authenticity_score = 0.0
 
         # Personal references increase authenticity
-        personal_patterns = [
-            r"\b(i|me|my|mine|myself)\b",
-            r"\b(this reminds me|makes me feel|when i)\b",
-            r"\b(my favorite|i love how|i can\'t)\b",
-        ]
-
-        for pattern in personal_patterns:
-            if re.search(pattern, text, re.IGNORECASE):
-                authenticity_score += 0.2
+        for _ in range(_PERSONAL_PATTERNS.count(text)):
+            authenticity_score += 0.2
 
         # Specific references increase authenticity
-        specific_patterns = [
-            r"\b(at \d+:\d+|the part where|that beat)\b",
-            r"\b(the lyrics|the chorus|the bridge)\b",
-            r"\b(reminds me of|sounds like|similar to)\b",
-        ]
-
-        for pattern in specific_patterns:
-            if re.search(pattern, text, re.IGNORECASE):
-                authenticity_score += 0.3
+        for _ in range(_SPECIFIC_PATTERNS.count(text)):
+            authenticity_score += 0.3
 
         # Questions increase authenticity
         if "?" in text:
             authenticity_score += 0.1
 
         # Emotional expressions increase authenticity
-        emotional_patterns = [
-            r"\b(crying|tears|emotional|chills|goosebumps)\b",
-            r"\b(obsessed|addicted|can\'t stop)\b",
-            r"\b(amazing|incredible|beautiful|perfect)\b",
-        ]
-
-        for pattern in emotional_patterns:
-            if re.search(pattern, text, re.IGNORECASE):
-                authenticity_score += 0.2
+        for _ in range(_EMOTIONAL_PATTERNS.count(text)):
+            authenticity_score += 0.2
 
         return min(authenticity_score, 1.0)
 
@@ -70,7 +70,7 @@ def train_and_deploy_model():
     logger.info("   - Label distribution: %s", metrics["label_distribution"])
 
     # Save model
-    model_path = "models/weak_supervision_sentiment.joblib"
+    model_path = "models/weak_supervision_sentiment.npz"
     os.makedirs("models", exist_ok=True)
     analyzer.save_model(model_path)
 